@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from core.browser import browser_rss_mb
+from core.instrumentation import percentile
+
+
+@contextmanager
+def local_target(latency_ms: float = 0.0, jitter_ms: float = 0.0, ui_latency_ms: float = 0.0) -> Iterator[str]:
+    """Serve the stand-in app on a free port and point BASE_URL at it (DRY_RUN and PERF_METRICS off)
+    for the duration.
+
+    Step modules read DRY_RUN at import time, so import test_factory/steps inside this block.
+    """
+    from standin.server import start_in_thread
+
+    server, url = start_in_thread(latency_ms=latency_ms, jitter_ms=jitter_ms, ui_latency_ms=ui_latency_ms)
+    saved = {k: os.environ.get(k) for k in ("BASE_URL", "DRY_RUN", "PERF_METRICS")}
+    os.environ.update({"BASE_URL": url, "DRY_RUN": "false", "PERF_METRICS": "false"})
+    try:
+        yield url
+    finally:
+        server.shutdown()
+        server.server_close()
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+class PeakMemorySampler:
+    """Samples browser process-tree RSS on a background thread; tracks the peak per step."""
+
+    def __init__(self, driver, interval: float = 0.1):
+        self.driver = driver
+        self.interval = interval
+        self.peaks: dict[str, float] = {}
+        self._step = ""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        rss = browser_rss_mb(self.driver)
+        if rss is not None and self._step:
+            self.peaks[self._step] = max(self.peaks.get(self._step, 0.0), rss)
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """Step wrapper that attributes samples taken while ``fn`` runs to step ``name``."""
+        def run(driver):
+            self._step = name
+            self.sample()
+            try:
+                fn(driver)
+            finally:
+                self.sample()
+                self._step = ""
+        return run
+
+    def __enter__(self) -> "PeakMemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def describe(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"n": 0, "median": 0.0, "p95": 0.0, "min": 0.0, "max": 0.0}
+    return {
+        "n": len(values),
+        "median": statistics.median(values),
+        "p95": percentile(values, 95),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
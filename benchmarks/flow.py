@@ -0,0 +1,158 @@
+"""
+Registration flow benchmark against the local stand-in app, gated on a stored baseline.
+
+    python -m benchmarks.flow --runs 10 --update-baseline   # record benchmarks/baseline.json
+    python -m benchmarks.flow --runs 10                     # fail (exit 1) on regressions
+
+No baseline is committed: timings depend on the machine, so record one on the machine that
+runs the gate. Without a baseline the comparison is skipped (exit 0, "[bench] SKIP ...");
+--require-baseline turns that into a failure for CI jobs that must gate.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from benchmarks.common import PeakMemorySampler, describe, local_target, timestamp
+from core.browser import get_driver
+from core.runner import run_steps
+
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+METRICS = ("wall", "commands", "peak_mb")
+
+
+def run_once(steps):
+    """One pipeline run in a fresh browser: (FlowResult, peak RSS per step, startup seconds)."""
+    driver = get_driver()
+    try:
+        with PeakMemorySampler(driver) as sampler:
+            wrapped = [(name, sampler.wrap(name, fn)) for name, fn in steps]
+            with redirect_stdout(io.StringIO()):
+                result = run_steps(driver, wrapped)
+        return result, sampler.peaks, driver.startup_timings["total"]
+    finally:
+        driver.quit()
+
+
+def collect(runs: int, steps) -> dict:
+    samples = {name: {m: [] for m in METRICS} for name, _ in steps}
+    pipeline, startup, failures = [], [], 0
+    for i in range(runs):
+        result, peaks, started = run_once(steps)
+        startup.append(started)
+        if result.exit_code:
+            failures += 1
+            bad = next((s for s in result.steps if s.status in ("failed", "error")), None)
+            if bad is None:  # failed outside the steps (setup, checkpoint restore)
+                print(f"[warn] run {i + 1}: {result.error}")
+            else:
+                print(f"[warn] run {i + 1}: {bad.name} {bad.status}: {bad.error}")
+            continue
+        pipeline.append(result.duration)
+        for s in result.steps:
+            samples[s.name]["wall"].append(s.duration)
+            samples[s.name]["commands"].append(float(s.commands))
+            if s.name in peaks:
+                samples[s.name]["peak_mb"].append(peaks[s.name])
+        print(f"[run {i + 1}/{runs}] {result.duration:.2f}s")
+    return {
+        "created": timestamp(),
+        "runs": runs,
+        "failures": failures,
+        "pipeline": describe(pipeline),
+        "startup": describe(startup),
+        "steps": {name: {m: describe(v) for m, v in ms.items()} for name, ms in samples.items()},
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, mem_threshold: float, min_delta: float) -> list[str]:
+    """Regressions of median wall time, command count and peak memory per step (and whole pipeline)."""
+    limits = {"wall": (threshold, min_delta), "commands": (threshold, 1.0), "peak_mb": (mem_threshold, 10.0)}
+    found = []
+    pairs = [("pipeline", {"wall": current["pipeline"]}, {"wall": baseline.get("pipeline", {})})]
+    pairs += [(name, cur, baseline.get("steps", {}).get(name, {})) for name, cur in current["steps"].items()]
+    for name, cur, base in pairs:
+        for metric, (rel, floor) in limits.items():
+            c = cur.get(metric, {}).get("median", 0.0)
+            b = base.get(metric, {}).get("median", 0.0)
+            if not (c and b):
+                continue
+            if c > b * (1 + rel) and c - b > floor:
+                found.append(f"{name}: {metric} {b:.2f} -> {c:.2f} (+{(c - b) / b * 100:.0f}%, limit {rel * 100:.0f}%)")
+    return found
+
+
+def print_table(current: dict, baseline: dict | None) -> None:
+    print(f"\n{'step':<36} {'median':>8} {'p95':>8} {'cmds':>6} {'peakMB':>7} {'base':>8} {'delta':>7}")
+    for name, m in current["steps"].items():
+        wall = m["wall"]
+        base = (baseline or {}).get("steps", {}).get(name, {}).get("wall", {}).get("median", 0.0)
+        delta = f"{(wall['median'] - base) / base * 100:+.0f}%" if base and wall["n"] else "-"
+        print(f"{name:<36} {wall['median']:>7.2f}s {wall['p95']:>7.2f}s {m['commands']['median']:>6.0f}"
+              f" {m['peak_mb']['median']:>7.0f} {(f'{base:.2f}s' if base else '-'):>8} {delta:>7}")
+    p = current["pipeline"]
+    print(f"{'pipeline':<36} {p['median']:>7.2f}s {p['p95']:>7.2f}s"
+          f"   (startup median {current['startup']['median']:.2f}s, failures {current['failures']}/{current['runs']})")
+
+
+def _select_steps(all_steps, spec: str | None):
+    """'3' -> steps 1..3 (steps depend on the previous ones, so always a prefix)."""
+    if not spec:
+        return list(all_steps)
+    return list(all_steps)[: int(spec)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the registration flow against the stand-in app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--upto", help="benchmark only the first N steps")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stand-in HTTP latency")
+    parser.add_argument("--ui-latency-ms", type=float, default=0.0, help="stand-in screen transition latency")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression of wall/commands")
+    parser.add_argument("--mem-threshold", type=float, default=0.3, help="allowed relative regression of peak RSS")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="ignore wall regressions below N seconds")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--require-baseline", action="store_true", help="fail instead of skipping without a baseline")
+    parser.add_argument("--out", help="also write results JSON here")
+    args = parser.parse_args(argv)
+
+    with local_target(latency_ms=args.latency_ms, ui_latency_ms=args.ui_latency_ms) as url:
+        from test_factory import STEPS
+
+        print(f"[bench] target {url}, {args.runs} runs")
+        current = collect(args.runs, _select_steps(STEPS, args.upto))
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else None
+    print_table(current, baseline)
+    if args.out:
+        Path(args.out).write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n[bench] baseline updated: {baseline_path}")
+        return 0 if not current["failures"] else 1
+    if current["failures"]:
+        print(f"\n❌ {current['failures']} прогон(ов) упали")
+        return 1
+    if baseline is None:
+        print(f"\n[bench] SKIP regression check: no baseline at {baseline_path}; "
+              f"run with --update-baseline to record one")
+        return 1 if args.require_baseline else 0
+    regressions = compare(current, baseline, args.threshold, args.mem_threshold, args.min_delta)
+    if regressions:
+        print("\n❌ Регрессии:")
+        for r in regressions:
+            print(f"  {r}")
+        return 1
+    print("\n✅ Без регрессий относительно baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""
+Per-step wall time with the legacy implicit wait vs explicit-wait-only mode.
+
+    DRY_RUN=false BASE_URL=... python -m benchmarks.implicit_wait --runs 3
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import statistics
+from contextlib import redirect_stdout
+
+from core.browser import get_driver
+from core.runner import run_steps
+
+
+def bench(implicit_wait: float, runs: int, steps) -> dict[str, list[float]]:
+    """Run the flow ``runs`` times in fresh browsers; return durations per step name."""
+    times: dict[str, list[float]] = {name: [] for name, _ in steps}
+    for i in range(runs):
+        driver = get_driver(implicit_wait=implicit_wait)
+        try:
+            with redirect_stdout(io.StringIO()):
+                result = run_steps(driver, steps)
+        finally:
+            driver.quit()
+        if result.exit_code:
+            failed = next((s for s in result.steps if s.status in ("failed", "error")), None)
+            if failed is None:  # failed outside the steps (setup, checkpoint restore)
+                print(f"[warn] implicit_wait={implicit_wait} run {i + 1}: {result.error}")
+            else:
+                print(f"[warn] implicit_wait={implicit_wait} run {i + 1}: {failed.name} {failed.status}: {failed.error}")
+        for s in result.steps:
+            if s.status == "passed":
+                times[s.name].append(s.duration)
+    return times
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Implicit wait vs explicit-only wall time per step")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--legacy", type=float, default=2.0, help="implicit wait of the legacy mode, seconds")
+    args = parser.parse_args(argv)
+
+    from test_factory import STEPS
+
+    legacy = bench(args.legacy, args.runs, STEPS)
+    explicit = bench(0, args.runs, STEPS)
+
+    print(f"\n{'step':<36} {'implicit=' + str(args.legacy):>12} {'implicit=0':>12} {'saved':>9}")
+    total_a = total_b = 0.0
+    for name, _ in STEPS:
+        if not legacy[name] or not explicit[name]:
+            print(f"{name:<36} {'-':>12} {'-':>12} {'-':>9}")
+            continue
+        a, b = statistics.mean(legacy[name]), statistics.mean(explicit[name])
+        total_a, total_b = total_a + a, total_b + b
+        pct = (a - b) / a * 100 if a else 0.0
+        print(f"{name:<36} {a:>11.2f}s {b:>11.2f}s {a - b:>7.2f}s ({pct:.0f}%)")
+    print(f"{'total':<36} {total_a:>11.2f}s {total_b:>11.2f}s {total_a - total_b:>7.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, fields, replace
+
+
+@dataclass(frozen=True)
+class PerfBudget:
+    """Limits for one step boundary (see core.perf_metrics.PerfSample); None = not checked."""
+    ttfb_ms: float | None = None  # navigation response start, only on a new document
+    load_ms: float | None = None  # navigation loadEventEnd, only on a new document
+    lcp_ms: float | None = None  # largest contentful paint, only on a new document
+    cls: float | None = None  # layout shift accumulated during the step
+    long_tasks_ms: float | None = None  # total long-task time during the step
+    requests: int | None = None  # resource requests during the step
+    transfer_kb: float | None = None  # bytes over the network during the step
+
+
+# Applies to every page object; "good" Core Web Vitals thresholds where they exist
+DEFAULT = PerfBudget(ttfb_ms=800, load_ms=4000, lcp_ms=2500, cls=0.1, long_tasks_ms=500, requests=60,
+                     transfer_kb=1500)
+
+# Per page object (class name), overrides on top of DEFAULT
+BUDGETS: dict[str, dict] = {
+    # The landing page pulls the app bundle, fonts and illustrations
+    "AuthLandingPage": {"requests": 150, "transfer_kb": 5000, "long_tasks_ms": 800},
+    "CodePage": {"requests": 30, "transfer_kb": 500},
+    "WorkspaceNamePage": {"requests": 30, "transfer_kb": 500},
+}
+
+
+def get_budget(page: str) -> PerfBudget:
+    overrides = BUDGETS.get(page, {})
+    unknown = set(overrides) - {f.name for f in fields(PerfBudget)}
+    if unknown:
+        raise ValueError(f"Unknown budget keys for {page}: {', '.join(sorted(unknown))}")
+    return replace(DEFAULT, **overrides)
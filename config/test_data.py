@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, replace
 
 
 @dataclass(frozen=True)
@@ -21,3 +22,19 @@ class UserData:
     birth_month: str = "March"
     birth_year: str = "1995"
     invite_emails: tuple[str, ...] = ("mate1@test.com", "bad@@mail", "friend2@test.com")
+
+
+# Data variants for the registration matrix: overrides applied on top of UserData defaults
+VARIANTS: dict[str, dict] = {
+    "default": {},
+    "cyrillic": {"first_name": "Иван", "last_name": "Петров"},
+    "plus_email": {"email_valid": "user+qa@test.com"},
+}
+
+
+def get_user_data(variant: str | None = None) -> UserData:
+    """Return UserData for the given variant (defaults to DATA_VARIANT env or 'default')."""
+    name = variant or os.getenv("DATA_VARIANT", "default")
+    if name not in VARIANTS:
+        raise ValueError(f"Unknown data variant: {name!r} (known: {', '.join(VARIANTS)})")
+    return replace(UserData(), **VARIANTS[name])
@@ -1,20 +1,41 @@
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from core import flight_recorder
+from core.chromedriver import resolve_chromedriver
+from core.resources import apply_profile
 
 
-def get_driver(headless: bool | None = None) -> webdriver.Chrome:
+def get_driver(headless: bool | None = None, implicit_wait: float | None = None,
+               resource_profile: str | None = None) -> webdriver.Chrome:
      """
      Create and return a configured Chrome WebDriver instance.
 
      Respects env vars:
        HEADLESS=true/false
+       IMPLICIT_WAIT=2 (seconds; 0 = explicit waits only, see pages.base_page.PROBE_TIMEOUT)
+       CHROMEDRIVER_PATH=/path/to/chromedriver (skip resolution entirely)
+       FLIGHT_RECORDER=true/false (buffer console/network logs for failure diagnostics)
+       RESOURCE_PROFILE=full|no-media|minimal (URLs blocked via CDP, see core.resources)
+       PAGE_LOAD_STRATEGY=normal|eager|none (with eager/none, pages wait on APP_READY detectors)
+
+     Startup timings are attached as driver.startup_timings.
      """
      if headless is None:
          headless_env = os.getenv("HEADLESS", "true").lower()
          headless = headless_env in ("1", "true", "yes")
+     if implicit_wait is None:
+         implicit_wait = float(os.getenv("IMPLICIT_WAIT", "2"))
 
      options = Options()
      if headless:
@@ -23,12 +44,243 @@ def get_driver(headless: bool | None = None) -> webdriver.Chrome:
      options.add_argument("--no-sandbox")
      options.add_argument("--disable-dev-shm-usage")
      options.add_argument("--disable-gpu")
+     options.page_load_strategy = os.getenv("PAGE_LOAD_STRATEGY", "normal").strip().lower()
+     if flight_recorder.enabled():
+          flight_recorder.configure_options(options)
 
-     service = Service(ChromeDriverManager().install())
+     t0 = time.perf_counter()
+     resolved = resolve_chromedriver()
+     service = Service(resolved.path)
      driver = webdriver.Chrome(service=service, options=options)
-     driver.implicitly_wait(2)
+     try:
+          driver.implicitly_wait(implicit_wait)
+          profile = apply_profile(driver, resource_profile)
+     except Exception:
+          # Unknown RESOURCE_PROFILE or a CDP failure: do not leak the browser we just started
+          driver.quit()
+          raise
+     total = time.perf_counter() - t0
+     driver.startup_timings = {
+          "chromedriver": resolved.seconds,
+          "chromedriver_source": resolved.source,
+          "launch": total - resolved.seconds,
+          "total": total,
+     }
+     print(f"[browser] startup {total:.2f}s (chromedriver {resolved.source} {resolved.seconds:.3f}s, "
+           f"launch {total - resolved.seconds:.2f}s, resources {profile.name})")
      return driver
 
 def get_base_url() -> str:
      """Return base URL for auth app, overridable via BASE_URL env."""
      return os.getenv("BASE_URL", "https://auth.lenzaos.com")
+
+def get_locale() -> str:
+     """Return locale the flow normalizes to after language checks, overridable via LOCALE env."""
+     return os.getenv("LOCALE", "ru").strip().lower() or "ru"
+
+
+def _process_tree_rss_mb(root_pid: int) -> float | None:
+     """Sum RSS (MB) of a process and all its descendants via /proc. None if unavailable."""
+     proc = Path("/proc")
+     if not proc.is_dir():
+          return None
+     children: dict[int, list[int]] = {}
+     for entry in proc.iterdir():
+          if not entry.name.isdigit():
+               continue
+          try:
+               stat = (entry / "stat").read_text()
+               ppid = int(stat.rsplit(")", 1)[1].split()[1])
+          except (OSError, IndexError, ValueError):
+               continue
+          children.setdefault(ppid, []).append(int(entry.name))
+     total_kb = 0
+     stack = [root_pid]
+     while stack:
+          pid = stack.pop()
+          stack.extend(children.get(pid, []))
+          try:
+               for line in (proc / str(pid) / "status").read_text().splitlines():
+                    if line.startswith("VmRSS:"):
+                         total_kb += int(line.split()[1])
+                         break
+          except (OSError, ValueError):
+               continue
+     return total_kb / 1024
+
+
+def browser_rss_mb(driver) -> float | None:
+     """RSS of chromedriver plus the Chrome processes it spawned, in MB."""
+     try:
+          return _process_tree_rss_mb(driver.service.process.pid)
+     except AttributeError:
+          return None
+
+
+def reset_session(driver) -> None:
+     """Bring a browser back to a clean state: one blank tab, no cookies, no storage."""
+     handles = driver.window_handles
+     for handle in handles[1:]:
+          driver.switch_to.window(handle)
+          driver.close()
+     driver.switch_to.window(handles[0])
+     driver.switch_to.default_content()
+     origin = "{0.scheme}://{0.netloc}".format(urlsplit(get_base_url()))
+     try:
+          driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+          driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+          driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+     except Exception:
+          # Non-Chromium driver: fall back to WebDriver/JS for the current origin only
+          driver.delete_all_cookies()
+          driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+     driver.get("about:blank")
+
+
+class DriverPool:
+     """
+     Pool of pre-launched Chrome sessions, handed out one flow at a time.
+
+     A browser is reset (see reset_session) between flows and recycled - quit and
+     relaunched on next acquire - after max_flows flows or once its process tree
+     RSS exceeds max_rss_mb.
+
+     Respects env vars:
+       POOL_MAX_FLOWS=20
+       POOL_MAX_RSS_MB=1500
+       POOL_ACQUIRE_TIMEOUT=300 (seconds acquire() waits for a free browser)
+     """
+
+     def __init__(self, size: int = 1, max_flows: int | None = None, max_rss_mb: float | None = None,
+                  headless: bool | None = None):
+          self.size = size
+          self.max_flows = max_flows if max_flows is not None else int(os.getenv("POOL_MAX_FLOWS", "20"))
+          self.max_rss_mb = max_rss_mb if max_rss_mb is not None else float(os.getenv("POOL_MAX_RSS_MB", "1500"))
+          self.headless = headless
+          self._idle: queue.Queue = queue.Queue()
+          self._flows: dict[int, int] = {}
+          self._live = 0
+          self._lock = threading.Lock()
+          self._closed = False
+
+     def _launch(self):
+          driver = get_driver(headless=self.headless)
+          self._flows[id(driver)] = 0
+          return driver
+
+     def _discard(self, driver) -> None:
+          self._flows.pop(id(driver), None)
+          with self._lock:
+               self._live -= 1
+          try:
+               driver.quit()
+          except Exception:
+               pass
+
+     def _launch_reserved(self):
+          """Launch into a slot already counted in _live; the slot is freed if the launch fails."""
+          try:
+               return self._launch()
+          except Exception:
+               with self._lock:
+                    self._live -= 1
+               raise
+
+     def warm(self) -> "DriverPool":
+          """Launch browsers up to pool size in parallel.
+
+          If any launch fails, the browsers that did start are quit too and the first error is raised.
+          """
+          with self._lock:
+               missing = self.size - self._live
+               self._live += max(missing, 0)
+          if missing <= 0:
+               return self
+          with ThreadPoolExecutor(max_workers=missing) as ex:
+               futures = [ex.submit(self._launch_reserved) for _ in range(missing)]
+          launched, errors = [], []
+          for fut in futures:
+               try:
+                    launched.append(fut.result())
+               except Exception as e:
+                    errors.append(e)
+          if errors:
+               for driver in launched:
+                    self._discard(driver)
+               raise errors[0]
+          for driver in launched:
+               self._idle.put(driver)
+          return self
+
+     def acquire(self, timeout: float | None = None):
+          """Take a clean browser; launches one lazily if the pool is below size.
+
+          Waits at most ``timeout`` seconds (POOL_ACQUIRE_TIMEOUT, default 300) for a busy
+          browser to come back, then raises TimeoutError.
+          """
+          if timeout is None:
+               timeout = float(os.getenv("POOL_ACQUIRE_TIMEOUT", "300"))
+          deadline = time.monotonic() + timeout
+          while True:
+               if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+               try:
+                    return self._idle.get_nowait()
+               except queue.Empty:
+                    pass
+               with self._lock:
+                    can_launch = self._live < self.size
+                    if can_launch:
+                         self._live += 1
+               if can_launch:
+                    return self._launch_reserved()
+               remaining = deadline - time.monotonic()
+               if remaining <= 0:
+                    raise TimeoutError(f"No browser available from the pool within {timeout:g}s")
+               # Re-check periodically: a discarded browser frees a slot without touching _idle
+               try:
+                    return self._idle.get(timeout=min(remaining, 1.0))
+               except queue.Empty:
+                    pass
+
+     def should_recycle(self, driver) -> bool:
+          if self._flows.get(id(driver), 0) >= self.max_flows:
+               return True
+          rss = browser_rss_mb(driver)
+          return rss is not None and rss > self.max_rss_mb
+
+     def release(self, driver) -> None:
+          """Return a browser after a flow; reset it or recycle it per policy."""
+          self._flows[id(driver)] = self._flows.get(id(driver), 0) + 1
+          if self._closed or self.should_recycle(driver):
+               self._discard(driver)
+               return
+          try:
+               reset_session(driver)
+          except Exception:
+               # Browser is in a bad state (crashed tab, dead session) - replace it
+               self._discard(driver)
+               return
+          self._idle.put(driver)
+
+     @contextmanager
+     def session(self):
+          driver = self.acquire()
+          try:
+               yield driver
+          finally:
+               self.release(driver)
+
+     def close(self) -> None:
+          self._closed = True
+          while True:
+               try:
+                    self._discard(self._idle.get_nowait())
+               except queue.Empty:
+                    break
+
+     def __enter__(self) -> "DriverPool":
+          return self
+
+     def __exit__(self, *exc) -> None:
+          self.close()
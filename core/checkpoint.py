@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+_CAPTURE_JS = """
+function dump(name) {
+  var out = {};
+  try {
+    var storage = window[name];
+    for (var i = 0; i < storage.length; i++) { var k = storage.key(i); out[k] = storage.getItem(k); }
+  } catch (e) { /* opaque origin (about:blank, data:) has no storage */ }
+  return out;
+}
+return {url: location.href, origin: location.origin,
+        local: dump('localStorage'), session: dump('sessionStorage')};
+"""
+
+# Runs before any page script on the restored URL, so the app boots with the saved state
+_SEED_JS = """
+(function (cp) {
+  if (location.origin !== cp.origin) return;
+  // Drop what a failed attempt wrote, so the state is exactly the checkpoint's
+  localStorage.clear();
+  sessionStorage.clear();
+  Object.keys(cp.local).forEach(function (k) { localStorage.setItem(k, cp.local[k]); });
+  Object.keys(cp.session).forEach(function (k) { sessionStorage.setItem(k, cp.session[k]); });
+})(%s);
+"""
+
+# Fields of Network.getAllCookies results that Network.setCookies does not accept
+_COOKIE_READ_ONLY = ("size", "session")
+
+
+@dataclass
+class Checkpoint:
+    """Browser state at a step boundary: cookies (all domains, incl. httpOnly), web storage and URL."""
+
+    step_index: int  # 0-based index of the last step that completed
+    step_name: str
+    url: str
+    origin: str
+    cookies: list[dict] = field(default_factory=list)
+    local_storage: dict[str, str] = field(default_factory=dict)
+    session_storage: dict[str, str] = field(default_factory=dict)
+    created: float = field(default_factory=time.time)
+
+
+def capture(driver, step_index: int, step_name: str) -> Checkpoint:
+    """Snapshot the session: one CDP call for cookies, one script for storage and URL."""
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    state = driver.execute_script(_CAPTURE_JS)
+    return Checkpoint(
+        step_index=step_index,
+        step_name=step_name,
+        url=state["url"],
+        origin=state["origin"],
+        cookies=cookies,
+        local_storage=state["local"],
+        session_storage=state["session"],
+    )
+
+
+def _cookie_param(cookie: dict) -> dict:
+    param = {k: v for k, v in cookie.items() if k not in _COOKIE_READ_ONLY}
+    if cookie.get("session"):
+        param.pop("expires", None)
+    return param
+
+
+def restore(driver, cp: Checkpoint) -> None:
+    """Load a checkpoint into the current browser session and open its URL.
+
+    Cookies are replaced via CDP; storage is cleared and seeded by a new-document script
+    before the app boots, then the script is removed so later navigations are unaffected.
+    """
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    if cp.cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_cookie_param(c) for c in cp.cookies]})
+    seed = json.dumps({"origin": cp.origin, "local": cp.local_storage, "session": cp.session_storage})
+    script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _SEED_JS % seed})
+    try:
+        driver.get(cp.url)
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+
+class CheckpointStore:
+    """JSON checkpoints on disk, one file per step: <CHECKPOINT_DIR>/<flow>/<NN>.json.
+
+    A ``readonly`` store only restores (``--from-step`` without ``--checkpoints``).
+    """
+
+    def __init__(self, flow: str = "", root: str | Path | None = None, readonly: bool = False):
+        self.root = Path(root or os.getenv("CHECKPOINT_DIR", "_checkpoints"))
+        self.dir = self.root / (flow.replace("/", "-") or "default")
+        self.readonly = readonly
+
+    def path(self, step_index: int) -> Path:
+        return self.dir / f"{step_index + 1:02d}.json"
+
+    def save(self, cp: Checkpoint) -> Path:
+        path = self.path(cp.step_index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(cp), ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def load(self, step_index: int) -> Checkpoint:
+        path = self.path(step_index)
+        if not path.exists():
+            raise FileNotFoundError(f"no checkpoint after step {step_index + 1} at {path}; run with --checkpoints first")
+        return Checkpoint(**json.loads(path.read_text(encoding="utf-8")))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+# Resolved once per process; DriverPool and parallel workers launch many browsers
+_resolved: "Resolution | None" = None
+
+
+@dataclass(frozen=True)
+class Resolution:
+    path: str
+    chrome_version: str | None
+    source: str  # env | memory | cache | download
+    seconds: float
+
+
+def cache_path() -> Path:
+    """Location of the resolution cache, overridable via CHROMEDRIVER_CACHE env."""
+    default = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "qa-lenzaos" / "chromedriver.json"
+    return Path(os.getenv("CHROMEDRIVER_CACHE", default))
+
+
+def _version_of(binary: str) -> str | None:
+    try:
+        out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    m = _VERSION_RE.search(out or "")
+    return m.group(0) if m else None
+
+
+def chrome_version() -> str | None:
+    """Installed Chrome version, read locally from the binary (CHROME_BINARY env first)."""
+    candidates = [os.getenv("CHROME_BINARY", "")] + list(CHROME_BINARIES)
+    for name in filter(None, candidates):
+        binary = name if os.path.isabs(name) else shutil.which(name)
+        if binary and os.path.exists(binary):
+            version = _version_of(binary)
+            if version:
+                return version
+    return None
+
+
+def _major(version: str | None) -> str | None:
+    return version.split(".", 1)[0] if version else None
+
+
+def is_valid(path: str, chrome: str | None) -> bool:
+    """Driver exists, is executable and (when Chrome version is known) matches its major version."""
+    if not path or not os.path.isfile(path) or not os.access(path, os.X_OK):
+        return False
+    if chrome is None:
+        return True
+    return _major(_version_of(path)) == _major(chrome)
+
+
+def _load_cache() -> dict[str, str]:
+    try:
+        return json.loads(cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict[str, str]) -> None:
+    path = cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def resolve_chromedriver() -> Resolution:
+    """
+    Return a chromedriver path without touching the network when possible.
+
+    Order: CHROMEDRIVER_PATH env, in-process memo, on-disk cache keyed on the
+    installed Chrome version, and only then webdriver-manager (may download).
+    """
+    global _resolved
+    t0 = time.perf_counter()
+
+    env_path = os.getenv("CHROMEDRIVER_PATH")
+    if env_path:
+        if not is_valid(env_path, None):
+            raise RuntimeError(f"CHROMEDRIVER_PATH is not an executable file: {env_path}")
+        return Resolution(env_path, None, "env", time.perf_counter() - t0)
+
+    if _resolved is not None and os.path.isfile(_resolved.path):
+        return Resolution(_resolved.path, _resolved.chrome_version, "memory", time.perf_counter() - t0)
+
+    chrome = chrome_version()
+    key = chrome or "unknown"
+    cache = _load_cache()
+    cached = cache.get(key)
+    if cached and is_valid(cached, chrome):
+        _resolved = Resolution(cached, chrome, "cache", time.perf_counter() - t0)
+        return _resolved
+
+    # Cache miss or stale entry: the only path that may hit the network
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    try:
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        raise RuntimeError(
+            f"chromedriver for Chrome {key} is not cached and could not be installed ({e}). "
+            "Offline hosts: set CHROMEDRIVER_PATH or pre-populate the cache with scripts/resolve_chromedriver.py."
+        ) from e
+    cache[key] = path
+    try:
+        _save_cache(cache)
+    except OSError:
+        pass
+    _resolved = Resolution(path, chrome, "download", time.perf_counter() - t0)
+    return _resolved
@@ -0,0 +1,194 @@
+"""
+DOM crawl of the registration flow: the page at every step boundary is stored in the
+snapshot store (identical DOMs share one blob), and a locator map extracted from it is
+compared with the previous crawl, so only what changed gets written.
+
+    steps = [(name, BoundaryCapture(name, fn, run)) for name, fn in STEPS]
+    run_flows(flows, steps, workers=4)
+    for flow in flows:
+        diff, path = CrawlBaseline(flow.name).update(run, collect(run, flow.name))
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from selenium.webdriver.common.by import By
+
+from core.diagnostics import get_diagnostics
+from core.runner import Flow
+from core.snapshot_store import SnapshotStore
+from pages.dom_js import css_quote, xpath_literal
+from pages.offline_dom import Node, find, parse_html
+
+
+REASON = "crawl"
+# Elements worth a locator: form controls, links, ARIA widgets and anything with a test id
+_INTERACTIVE = {"input", "button", "select", "textarea", "a"}
+_ROLES = {"button", "link", "menuitem", "option", "tab", "checkbox", "radio", "textbox", "combobox"}
+_ATTRS = ("id", "name", "type", "data-testid", "placeholder", "aria-label", "role", "href", "class")
+# Prefixes of framework-generated class names (emotion, styled-components, styled-jsx)
+_GENERATED = ("css-", "sc-", "jsx-")
+
+
+def flow_key(flow_name: str) -> str:
+    return flow_name.replace("/", "_")
+
+
+@dataclass
+class BoundaryCapture:
+    """A step wrapper that stores the page once the step has finished (or failed).
+
+    A plain class rather than a closure so it can be pickled into worker processes.
+    """
+    name: str
+    fn: Callable
+    run: str
+
+    def __call__(self, driver) -> None:
+        try:
+            self.fn(driver)
+        finally:
+            try:
+                flow = Flow(os.getenv("LOCALE", "ru"), os.getenv("DATA_VARIANT", "default"))
+                get_diagnostics().store.put(REASON, html=driver.page_source, step=f"{flow.name}|{self.name}",
+                                            run=self.run, url=driver.current_url)
+            except Exception as e:
+                print(f"[warn] crawl capture after {self.name!r} failed: {e}")
+
+
+def _stable(value: str) -> bool:
+    """False for ids/classes that look generated (hashes, counters) and change between builds."""
+    if not value or value.startswith(_GENERATED):
+        return False
+    for part in re.split(r"[-_]+", value):
+        if part.isdigit() and len(part) >= 3:
+            return False
+        if len(part) >= 5 and re.search(r"\d", part) and re.search(r"[a-zA-Z]", part):
+            return False
+    return True
+
+
+def suggest_locator(el: Node) -> tuple[str, str]:
+    """The most stable locator for an element: test id, id, name, placeholder/aria-label, text, classes."""
+    a, tag = el.attrs, el.tag
+    if a.get("data-testid"):
+        return By.CSS_SELECTOR, f"[data-testid={css_quote(a['data-testid'])}]"
+    if _stable(a.get("id", "")):
+        return By.CSS_SELECTOR, f"{tag}[id={css_quote(a['id'])}]"
+    for attr in ("name", "placeholder", "aria-label"):
+        if a.get(attr):
+            return By.CSS_SELECTOR, f"{tag}[{attr}={css_quote(a[attr])}]"
+    text = " ".join(el.text().split())
+    if text and len(text) <= 40 and '"' not in text:
+        return By.XPATH, f"//{tag}[normalize-space(.)={xpath_literal(text)}]"
+    classes = [c for c in a.get("class", "").split() if _stable(c)][:2]
+    if tag == "input" and a.get("type"):
+        return By.CSS_SELECTOR, f"input[type={css_quote(a['type'])}]" + "".join(f".{c}" for c in classes)
+    return By.CSS_SELECTOR, tag + "".join(f".{c}" for c in classes)
+
+
+def extract_locators(html: str) -> dict[str, dict]:
+    """Locator map of a page: suggested locator -> tag, text, key attributes and match count."""
+    doc = parse_html(html)
+    out: dict[str, dict] = {}
+    for el in doc.iter():
+        if not el.is_element:
+            continue
+        if el.tag not in _INTERACTIVE and el.attrs.get("role") not in _ROLES and "data-testid" not in el.attrs:
+            continue
+        if el.tag == "input" and el.attrs.get("type") == "hidden":
+            continue
+        loc = suggest_locator(el)
+        key = f"{loc[0]}|{loc[1]}"
+        if key in out:
+            continue
+        out[key] = {
+            "tag": el.tag,
+            "text": " ".join(el.text().split())[:80],
+            "attrs": {k: el.attrs[k] for k in _ATTRS if k in el.attrs},
+            "count": len(find(doc, loc)),
+        }
+    return out
+
+
+def collect(run: str, flow_name: str, store: SnapshotStore | None = None) -> dict[str, dict]:
+    """Per step (in capture order): url, snapshot id, html blob hash and locator map of one crawl."""
+    store = store or get_diagnostics().store
+    rows = [r for r in store.query(run=run, reason=REASON, limit=10_000) if r.step.startswith(f"{flow_name}|")]
+    steps: dict[str, dict] = {}
+    parsed: dict[str, dict] = {}  # html hash -> locator map, identical pages parse once
+    for row in sorted(rows, key=lambda r: r.id):
+        if not row.html:
+            continue
+        if row.html not in parsed:
+            parsed[row.html] = extract_locators(store.read_blob(row.html, "html").decode("utf-8", "replace"))
+        steps[row.step.split("|", 1)[1]] = {"url": row.url, "snapshot": row.id, "html": row.html,
+                                            "locators": parsed[row.html]}
+    return steps
+
+
+def diff_steps(old: dict[str, dict], new: dict[str, dict]) -> dict[str, dict]:
+    """Per changed step: url/DOM change and added, removed and changed locators. Empty if identical.
+
+    Steps the new crawl did not reach (partial crawl, failure) are not reported.
+    """
+    out: dict[str, dict] = {}
+    for step, cur in new.items():
+        prev = old.get(step)
+        if prev is None:
+            out[step] = {"new_step": True, "snapshot": cur["snapshot"], "added": sorted(cur["locators"])}
+            continue
+        if prev["html"] == cur["html"]:
+            continue
+        before, after = prev["locators"], cur["locators"]
+        change = {
+            "snapshot": cur["snapshot"],
+            "previous_snapshot": prev["snapshot"],
+            "added": sorted(set(after) - set(before)),
+            "removed": sorted(set(before) - set(after)),
+            "changed": {k: {"before": before[k], "after": after[k]}
+                        for k in sorted(set(before) & set(after)) if before[k] != after[k]},
+        }
+        if prev["url"] != cur["url"]:
+            change["url"] = {"before": prev["url"], "after": cur["url"]}
+        out[step] = change
+    return out
+
+
+class CrawlBaseline:
+    """The last crawl of one flow (``<root>/crawl/<flow>.json``) and the diffs written against it."""
+
+    def __init__(self, flow_name: str, root: str | Path | None = None):
+        self.root = Path(root or os.getenv("DUMP_DIR", "_dom_dumps")) / "crawl"
+        self.key = flow_key(flow_name)
+        self.path = self.root / f"{self.key}.json"
+
+    def load(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))["steps"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def update(self, run: str, steps: dict[str, dict]) -> tuple[dict, Path | None]:
+        """Diff ``steps`` against the baseline; write the diff (if any) and make ``steps`` the new baseline.
+
+        Steps missing from a partial crawl keep their previous entry. Returns (diff, diff file or None).
+        """
+        old = self.load()
+        diff = diff_steps(old, steps)
+        if not diff:
+            return diff, None
+        self.root.mkdir(parents=True, exist_ok=True)
+        out = self.root / run / f"{self.key}.diff.json"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(diff, ensure_ascii=False, indent=2), encoding="utf-8")
+        merged = {**old, **steps}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"run": run, "steps": merged}, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+        return diff, out
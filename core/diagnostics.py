@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import atexit
+import base64
+import json
+import multiprocessing.util
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.instrumentation import current_step
+from core.snapshot_store import SnapshotStore
+
+
+@dataclass
+class Snapshot:
+    reason: str
+    step: str = ""
+    url: str | None = None
+    html: str | None = None
+    png_b64: str | None = None
+    trace: dict | None = None
+
+
+class DiagnosticsWriter:
+    """
+    Writes DOM/screenshot dumps from a background thread so the requesting step never waits on disk.
+
+    Only the WebDriver round-trips (page_source, base64 screenshot) happen on the caller's
+    thread — the driver is not thread-safe. Decoding, hashing, gzip and file I/O happen in the
+    worker, which stores everything in the content-addressed SnapshotStore (deduplicated blobs,
+    indexed by run/step/reason). The store is evicted to its retention limits on close().
+    When the queue is full the snapshot is dropped and counted rather than blocking the test.
+    """
+
+    def __init__(self, out_dir: str | Path | None = None, compresslevel: int | None = None,
+                 max_queue: int = 64):
+        self.out_dir = out_dir
+        self.compresslevel = compresslevel
+        self.written: list[int] = []  # snapshot ids
+        self.dropped = 0
+        self.errors = 0
+        self._queue: queue.Queue[Snapshot | None] = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._store: SnapshotStore | None = None
+
+    @property
+    def store(self) -> SnapshotStore:
+        with self._lock:
+            if self._store is None:
+                self._store = SnapshotStore(self.out_dir, self.compresslevel)
+            return self._store
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="diagnostics-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            snap = self._queue.get()
+            try:
+                if snap is None:
+                    return
+                self._write(snap)
+            except Exception:
+                self.errors += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, snap: Snapshot) -> None:
+        png = base64.b64decode(snap.png_b64) if snap.png_b64 is not None else None
+        trace = json.dumps(snap.trace, ensure_ascii=False) if snap.trace is not None else None
+        self.written.append(self.store.put(snap.reason, snap.html, png, step=snap.step, url=snap.url, trace=trace))
+
+    def submit(self, snap: Snapshot) -> bool:
+        """Queue an already captured snapshot; False if it was dropped (queue full)."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(snap)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def snapshot(self, driver, reason: str, html: bool = True, screenshot: bool = True,
+                 step: str | None = None, trace: dict | None = None) -> bool:
+        """Capture page source and/or screenshot and queue them under ``reason``; never raises.
+
+        ``step`` defaults to the step being recorded; ``trace`` is an extra JSON payload
+        (flight recorder buffers) stored alongside.
+        """
+        snap = Snapshot(reason, step=current_step() if step is None else step, trace=trace)
+        try:
+            snap.url = driver.current_url
+        except Exception:
+            pass
+        if html:
+            try:
+                snap.html = driver.page_source
+            except Exception:
+                pass
+        if screenshot:
+            try:
+                snap.png_b64 = driver.get_screenshot_as_base64()
+            except Exception:
+                pass
+        if snap.html is None and snap.png_b64 is None and snap.trace is None:
+            return False
+        return self.submit(snap)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued snapshot is on disk; False on timeout."""
+        if self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        self.flush(timeout)
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=1)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+        if self._store is not None:
+            try:
+                self._store.evict()
+            except Exception:
+                self.errors += 1
+
+
+_writer: DiagnosticsWriter | None = None
+
+
+def get_diagnostics() -> DiagnosticsWriter:
+    """Process-wide writer, drained at interpreter and worker-process exit."""
+    global _writer
+    if _writer is None:
+        _writer = DiagnosticsWriter()
+        atexit.register(_writer.close)
+        # atexit does not run in multiprocessing workers; their finalizers do
+        multiprocessing.util.Finalize(_writer, _writer.close, exitpriority=10)
+    return _writer
+
+
+def dump(driver, reason: str, html: bool = True, screenshot: bool = True) -> bool:
+    """Shortcut for ``get_diagnostics().snapshot(...)``."""
+    return get_diagnostics().snapshot(driver, reason, html=html, screenshot=screenshot)
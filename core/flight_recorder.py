@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+
+from core.diagnostics import get_diagnostics
+
+
+# Only these CDP events from the performance log are kept (compacted) in the ring buffer
+NETWORK_EVENTS = ("Network.requestWillBeSent", "Network.responseReceived", "Network.loadingFailed")
+
+
+def enabled() -> bool:
+    """FLIGHT_RECORDER=false turns the recorder (and its Chrome logging prefs) off."""
+    return os.getenv("FLIGHT_RECORDER", "true").lower() in ("1", "true", "yes")
+
+
+def configure_options(options) -> None:
+    """Ask chromedriver to buffer console messages and network CDP events for get_log()."""
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL", "performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def _network_event(entry: dict) -> dict | None:
+    try:
+        msg = json.loads(entry["message"])["message"]
+    except (KeyError, ValueError, TypeError):
+        return None
+    method = msg.get("method")
+    if method not in NETWORK_EVENTS:
+        return None
+    p = msg.get("params", {})
+    event = {"t": entry.get("timestamp"), "event": method.split(".", 1)[1], "id": p.get("requestId")}
+    if method == "Network.requestWillBeSent":
+        event.update(url=p.get("request", {}).get("url"), method=p.get("request", {}).get("method"),
+                     type=p.get("type"))
+    elif method == "Network.responseReceived":
+        r = p.get("response", {})
+        event.update(url=r.get("url"), status=r.get("status"), type=p.get("type"))
+    else:
+        event.update(error=p.get("errorText"), canceled=p.get("canceled"), blocked=p.get("blockedReason"),
+                     type=p.get("type"))
+    return event
+
+
+class FlightRecorder:
+    """
+    In-memory ring buffer of recent browser console messages, network events and
+    low-resolution frames. Nothing touches disk unless ``flush()`` is called on failure.
+
+    Console/network entries are drained from chromedriver's log buffers (which also keeps
+    chromedriver's own memory bounded); frames are JPEG screenshots at reduced scale, taken
+    at step boundaries via CDP.
+    """
+
+    def __init__(self, driver, console: int = 200, network: int = 500, frames: int | None = None,
+                 frame_scale: float = 0.5, frame_quality: int = 30):
+        self.driver = driver
+        self.console: deque[dict] = deque(maxlen=console)
+        self.network: deque[dict] = deque(maxlen=network)
+        self.frames: deque[dict] = deque(maxlen=int(os.getenv("FLIGHT_FRAMES", "5")) if frames is None else frames)
+        self.frame_scale = frame_scale
+        self.frame_quality = frame_quality
+        self._sources = {"browser", "performance"}
+        self._viewport: tuple[float, float] | None = None
+        self.drain(keep=False)
+
+    def drain(self, keep: bool = True) -> None:
+        """Move new console/network entries from chromedriver into the ring buffers."""
+        for source in list(self._sources):
+            try:
+                entries = self.driver.get_log(source)
+            except Exception:
+                # log type not enabled for this session; don't ask again
+                self._sources.discard(source)
+                continue
+            if not keep:
+                continue
+            if source == "browser":
+                self.console.extend(
+                    {"t": e.get("timestamp"), "level": e.get("level"), "message": e.get("message")} for e in entries
+                )
+            else:
+                self.network.extend(ev for ev in map(_network_event, entries) if ev is not None)
+
+    def frame(self, label: str) -> None:
+        """Capture a low-res JPEG frame of the viewport into the ring buffer; never raises."""
+        if not self.frames.maxlen:
+            return
+        try:
+            if self._viewport is None:
+                metrics = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                vp = metrics.get("cssLayoutViewport") or metrics.get("layoutViewport", {})
+                self._viewport = (vp.get("clientWidth", 1440), vp.get("clientHeight", 900))
+            width, height = self._viewport
+            shot = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": self.frame_quality,
+                "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": self.frame_scale},
+            })
+        except Exception:
+            return
+        self.frames.append({"t": time.time(), "label": label, "jpeg_b64": shot.get("data")})
+
+    def mark(self, label: str) -> None:
+        """Step boundary: drain logs and take a frame."""
+        self.drain()
+        self.frame(label)
+
+    def export(self) -> dict:
+        return {"console": list(self.console), "network": list(self.network), "frames": list(self.frames)}
+
+    def flush(self, reason: str, step: str = "", error: str = "") -> bool:
+        """Persist the buffers plus a full DOM/screenshot snapshot through the diagnostics writer."""
+        self.drain()
+        self.frame(f"{step}: failure")
+        trace = self.export()
+        trace.update(step=step, error=error)
+        return get_diagnostics().snapshot(self.driver, reason, step=step, trace=trace)
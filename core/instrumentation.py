@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import math
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+# Recorder and step of the flow currently running in this process/thread
+_active: ContextVar["CommandRecorder | None"] = ContextVar("active_recorder", default=None)
+_step: ContextVar[str] = ContextVar("current_step", default="")
+
+
+@dataclass
+class CommandRecord:
+    flow: str
+    step: str
+    method: str  # outermost page-object method on the stack, e.g. "CodePage.enter_code"
+    command: str  # WebDriver command name, e.g. "findElements", "executeScript"
+    ms: float
+    ok: bool
+    t: float  # seconds since the recorder started
+
+
+def current_step() -> str:
+    return _step.get()
+
+
+def _page_method() -> str:
+    """Outermost page-object method in the call stack (pages.* frame with ``self``)."""
+    found = ""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("pages."):
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                found = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return found
+
+
+def instrument(driver) -> None:
+    """Wrap the driver's command executor so every command is timed into the active recorder.
+
+    Idempotent; commands issued outside CommandRecorder.step() are not recorded.
+    """
+    executor = driver.command_executor
+    if getattr(executor, "_instrumented", False):
+        return
+    execute = executor.execute
+
+    def timed_execute(command, params):
+        recorder = _active.get()
+        if recorder is None:
+            return execute(command, params)
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            res = execute(command, params)
+            ok = True
+            return res
+        finally:
+            recorder.add(command, (time.perf_counter() - t0) * 1000, ok, _page_method())
+
+    executor.execute = timed_execute
+    executor._instrumented = True
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class CommandRecorder:
+    """Collects per-command latency for one flow, tagged by step and page-object method."""
+
+    flow: str = ""
+    records: list[CommandRecord] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    def add(self, command: str, ms: float, ok: bool, method: str) -> None:
+        self.records.append(CommandRecord(self.flow, _step.get(), method, command, ms, ok,
+                                          time.perf_counter() - self.started))
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        rec_token, step_token = _active.set(self), _step.set(name)
+        try:
+            yield
+        finally:
+            _step.reset(step_token)
+            _active.reset(rec_token)
+
+    def count(self, step: str) -> int:
+        return sum(1 for r in self.records if r.step == step)
+
+    def last_page(self, step: str) -> str:
+        """Page-object class behind the step's last attributed command ('' if none)."""
+        for r in reversed(self.records):
+            if r.step == step and r.method:
+                return r.method.split(".", 1)[0]
+        return ""
+
+
+def summarize(records: Iterable[dict]) -> dict[str, dict]:
+    """Per-step command count, total time and p50/p95/p99 latency; top page methods by count."""
+    by_step: dict[str, list[dict]] = {}
+    for r in records:
+        by_step.setdefault(r["step"], []).append(r)
+    out: dict[str, dict] = {}
+    for step, recs in by_step.items():
+        ms = [r["ms"] for r in recs]
+        methods: dict[str, int] = {}
+        for r in recs:
+            methods[r["method"] or "-"] = methods.get(r["method"] or "-", 0) + 1
+        out[step] = {
+            "count": len(recs),
+            "total_ms": sum(ms),
+            "p50": percentile(ms, 50),
+            "p95": percentile(ms, 95),
+            "p99": percentile(ms, 99),
+            "top_methods": sorted(methods.items(), key=lambda kv: -kv[1])[:3],
+        }
+    return out
+
+
+def print_summary(summary: dict[str, dict]) -> None:
+    print("\n⏱  WebDriver команды по шагам")
+    for step, s in summary.items():
+        print(
+            f"  {step:<36} n={s['count']:<5} total={s['total_ms'] / 1000:.2f}s"
+            f"  p50={s['p50']:.0f}ms p95={s['p95']:.0f}ms p99={s['p99']:.0f}ms"
+        )
+        for method, n in s["top_methods"]:
+            print(f"      {n:>5} × {method}")
+
+
+def write_jsonl(records: Iterable[dict], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    return path
+
+
+def as_dicts(records: Iterable[CommandRecord]) -> list[dict]:
+    return [asdict(r) for r in records]
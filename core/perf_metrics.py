@@ -0,0 +1,132 @@
+"""
+Front-end performance at step boundaries, read from the browser's Performance API.
+
+With PERF_METRICS=true, at the end of every step the runner takes a PerfSample of what
+happened in the page during that step: navigation timing and LCP when a new document loaded,
+resource requests and transferred bytes, long tasks and layout shift. The sample is attributed
+to the page object the step used last and checked against its budget (config.perf_budgets).
+
+    PERF_METRICS=true           collect (default off: each sample is an extra script round trip)
+    PERF_BUDGET=off|warn|fail   ignore, print, or fail the step on a budget breach (default warn)
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field, fields
+
+from config.perf_budgets import get_budget
+from pages.dom_wait import ensure_script_timeout
+
+
+# Observers live on the document's window and are created with buffered: true, so entries
+# from before the first call (initial load, LCP) are delivered too; those arrive as tasks,
+# hence the short delay on the first call per document. Later calls report deltas.
+COLLECT_JS = r"""
+var done = arguments[arguments.length - 1];
+var st = window.__perfMetrics, fresh = !st;
+if (fresh) {
+  st = window.__perfMetrics = {res: 0, lt: [], cls: 0, lcp: null, navSent: false};
+  try { performance.setResourceTimingBufferSize(5000); } catch (e) {}
+  var observe = function (type, cb) {
+    try {
+      new PerformanceObserver(function (list) { list.getEntries().forEach(cb); })
+        .observe({type: type, buffered: true});
+    } catch (e) {}
+  };
+  observe('longtask', function (e) { st.lt.push(e.duration); });
+  observe('layout-shift', function (e) { if (!e.hadRecentInput) st.cls += e.value; });
+  observe('largest-contentful-paint', function (e) { st.lcp = e.renderTime || e.startTime; });
+}
+setTimeout(function () {
+  var out = {url: location.href, nav: null, lcp: null};
+  if (!st.navSent) {
+    var n = performance.getEntriesByType('navigation')[0];
+    if (n) out.nav = {ttfb: n.responseStart, load: n.loadEventEnd, transfer: n.transferSize || 0};
+    out.lcp = st.lcp;  // LCP stops at the first user input, so it only describes the initial load
+    st.navSent = true;
+  }
+  var res = performance.getEntriesByType('resource').slice(st.res);
+  st.res += res.length;
+  var bytes = out.nav ? out.nav.transfer : 0;
+  res.forEach(function (r) { bytes += r.transferSize || 0; });
+  out.requests = res.length;
+  out.bytes = bytes;
+  out.slowest = res.sort(function (a, b) { return b.duration - a.duration; }).slice(0, 3)
+    .map(function (r) { return [r.name, Math.round(r.duration)]; });
+  out.longTasks = st.lt.splice(0);
+  out.cls = st.cls;
+  st.cls = 0;
+  done(out);
+}, fresh ? 50 : 0);
+"""
+
+
+def enabled() -> bool:
+    return os.getenv("PERF_METRICS", "false").lower() in ("1", "true", "yes")
+
+
+def budget_mode() -> str:
+    mode = os.getenv("PERF_BUDGET", "warn").strip().lower()
+    if mode not in ("off", "warn", "fail"):
+        raise ValueError(f"PERF_BUDGET must be off, warn or fail, got {mode!r}")
+    return mode
+
+
+@dataclass
+class PerfSample:
+    step: str
+    page: str  # page object class the step used last, '' if none
+    url: str
+    ttfb_ms: float | None = None
+    load_ms: float | None = None
+    lcp_ms: float | None = None
+    cls: float = 0.0
+    long_tasks: int = 0
+    long_tasks_ms: float = 0.0
+    requests: int = 0
+    transfer_kb: float = 0.0
+    slowest: list = field(default_factory=list)  # [url, ms] of the slowest requests
+
+    def summary(self) -> str:
+        parts = []
+        if self.lcp_ms is not None:
+            parts.append(f"LCP {self.lcp_ms:.0f}ms")
+        if self.load_ms:
+            parts.append(f"load {self.load_ms:.0f}ms")
+        parts.append(f"CLS {self.cls:.3f}")
+        parts.append(f"long tasks {self.long_tasks} ({self.long_tasks_ms:.0f}ms)")
+        parts.append(f"{self.requests} req {self.transfer_kb:.0f}KB")
+        return ", ".join(parts)
+
+
+def collect(driver, step: str = "", page: str = "") -> PerfSample:
+    """Sample the current document: one async script call (~50ms on the first call per document)."""
+    ensure_script_timeout(driver, 5)
+    raw = driver.execute_async_script(COLLECT_JS)
+    nav = raw.get("nav") or {}
+    long_tasks = raw.get("longTasks") or []
+    return PerfSample(
+        step=step,
+        page=page,
+        url=raw.get("url", ""),
+        ttfb_ms=nav.get("ttfb"),
+        load_ms=nav.get("load") or None,  # 0 while the load event has not fired yet
+        lcp_ms=raw.get("lcp"),
+        cls=float(raw.get("cls") or 0.0),
+        long_tasks=len(long_tasks),
+        long_tasks_ms=float(sum(long_tasks)),
+        requests=int(raw.get("requests") or 0),
+        transfer_kb=(raw.get("bytes") or 0) / 1024,
+        slowest=raw.get("slowest") or [],
+    )
+
+
+def check(sample: PerfSample) -> list[str]:
+    """Budget breaches of a sample, e.g. ['lcp_ms 3120 > 2500']; empty when within budget."""
+    budget = get_budget(sample.page)
+    breaches = []
+    for f in fields(budget):
+        limit, value = getattr(budget, f.name), getattr(sample, f.name)
+        if limit is not None and value is not None and value > limit:
+            breaches.append(f"{f.name} {value:.3g} > {limit:g}" if f.name == "cls" else f"{f.name} {value:.0f} > {limit:g}")
+    return breaches
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+# URL patterns for Network.setBlockedURLs ('*' is a wildcard). CDP blocks by URL only, so
+# resource types are expressed as the file extensions the auth app serves them with.
+IMAGES = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*")
+MEDIA = ("*.mp4*", "*.webm*", "*.mp3*", "*.ogg*", "*.wav*")
+FONTS = ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*")
+VECTOR = ("*.svg*",)
+THIRD_PARTY = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*mc.yandex.ru*",
+    "*mc.yandex.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*intercom.io*",
+    "*intercomcdn.com*",
+    "*clarity.ms*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+)
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    name: str
+    blocked: tuple[str, ...] = ()
+    description: str = ""
+
+
+PROFILES = {
+    "full": ResourceProfile("full", (), "load everything (no blocking)"),
+    "no-media": ResourceProfile("no-media", IMAGES + MEDIA, "block raster images, audio and video"),
+    "minimal": ResourceProfile(
+        "minimal", IMAGES + MEDIA + FONTS + VECTOR + THIRD_PARTY,
+        "only HTML, CSS and first-party scripts: no images, fonts, media, analytics",
+    ),
+}
+
+# Bytes and request count of the current page, from the Resource Timing API
+PAGE_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var res = performance.getEntriesByType('resource');
+var out = {requests: res.length + (nav ? 1 : 0), bytes: nav ? (nav.transferSize || 0) : 0, by_type: {}};
+res.forEach(function (r) {
+  var size = r.transferSize || r.encodedBodySize || 0;
+  out.bytes += size;
+  var t = out.by_type[r.initiatorType] || (out.by_type[r.initiatorType] = {requests: 0, bytes: 0});
+  t.requests += 1;
+  t.bytes += size;
+});
+return out;
+"""
+
+
+def get_profile(name: str | None = None) -> ResourceProfile:
+    """Profile by name; RESOURCE_PROFILE env (default full). RESOURCE_BLOCK adds comma-separated patterns."""
+    name = (name or os.getenv("RESOURCE_PROFILE", "full")).strip().lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown resource profile {name!r}; known: {', '.join(PROFILES)}")
+    profile = PROFILES[name]
+    extra = tuple(p.strip() for p in os.getenv("RESOURCE_BLOCK", "").split(",") if p.strip())
+    if extra:
+        profile = ResourceProfile(profile.name, profile.blocked + extra, profile.description)
+    return profile
+
+
+def apply_profile(driver, profile: ResourceProfile | str | None = None) -> ResourceProfile:
+    """Install the profile's URL blocklist on the driver's tab via CDP (no-op for an empty list)."""
+    if not isinstance(profile, ResourceProfile):
+        profile = get_profile(profile)
+    if profile.blocked:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked)})
+    driver.resource_profile = profile.name
+    return profile
+
+
+def page_stats(driver) -> dict:
+    """Requests and transferred bytes of the current page (blocked requests never appear)."""
+    return driver.execute_script(PAGE_STATS_JS)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from core.instrumentation import percentile
+from core.runner import FlowResult
+from core.snapshot_store import run_id
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,               -- RUN_ID, shared with the snapshot store
+    started REAL NOT NULL,
+    duration REAL NOT NULL,
+    exit_code INTEGER NOT NULL,      -- worst across flows: 0 passed, 2 assertion, 3 error
+    build TEXT NOT NULL,             -- front-end build (APP_BUILD or bundle hash)
+    browser TEXT NOT NULL,
+    host TEXT NOT NULL,
+    commit_sha TEXT,
+    workers INTEGER NOT NULL,
+    env TEXT NOT NULL                -- JSON: platform, versions and the knobs that change timings
+);
+CREATE TABLE IF NOT EXISTS flows (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    flow TEXT NOT NULL,
+    exit_code INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    flow_id INTEGER NOT NULL REFERENCES flows(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    step TEXT NOT NULL,
+    status TEXT NOT NULL,            -- passed | failed | error | skipped
+    duration REAL NOT NULL,
+    commands INTEGER NOT NULL,
+    attempts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS runs_build ON runs(build, started);
+CREATE INDEX IF NOT EXISTS steps_step ON steps(step, run_id);
+"""
+
+# Settings recorded with every run: they explain most timing shifts between runs
+ENV_KEYS = (
+    "BASE_URL", "LOCALES", "DATA_VARIANTS", "HEADLESS", "IMPLICIT_WAIT", "PAGE_LOAD_STRATEGY",
+    "RESOURCE_PROFILE", "APP_READY", "FAST_FILL", "BATCH_VALIDATION", "FLIGHT_RECORDER", "PERF_METRICS",
+    "STEP_RETRIES", "CI",
+)
+
+
+def enabled() -> bool:
+    """RUN_HISTORY=false turns recording off."""
+    return os.getenv("RUN_HISTORY", "true").lower() in ("1", "true", "yes")
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=2,
+                             cwd=Path(__file__).resolve().parents[1])
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> dict:
+    from selenium import __version__ as selenium_version
+
+    env = {k: os.environ[k] for k in ENV_KEYS if k in os.environ}
+    env.update(platform=platform.platform(), python=platform.python_version(), selenium=selenium_version,
+               cpus=os.cpu_count())
+    return env
+
+
+@dataclass
+class StepStats:
+    step: str
+    bucket: str  # day or build
+    n: int
+    failures: int
+    retries: int
+    commands: float  # mean per run
+    p50: float
+    p90: float
+    p95: float
+    max: float
+
+
+class RunHistory:
+    """
+    Local SQLite history of test runs: one row per run, flow and step.
+
+    Path: RUN_HISTORY_DB env or _run_history.sqlite. WAL and a busy timeout make
+    concurrent CI jobs on one machine safe.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or os.getenv("RUN_HISTORY_DB", "_run_history.sqlite"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA foreign_keys=ON")
+            self._db.executescript(SCHEMA)
+
+    def record(self, results: Sequence[FlowResult], workers: int = 1, started: float | None = None,
+               duration: float | None = None) -> int:
+        """Store one run (all its flows and steps); returns the run row id."""
+        builds = sorted({r.build for r in results if r.build})
+        browsers = sorted({r.browser for r in results if r.browser})
+        duration = max((r.duration for r in results), default=0.0) if duration is None else duration
+        started = time.time() - duration if started is None else started
+        with self._lock, self._db:
+            cur = self._db.execute(
+                "INSERT INTO runs(run, started, duration, exit_code, build, browser, host, commit_sha, workers, env)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id(), started, duration, max((r.exit_code for r in results), default=0),
+                 os.getenv("APP_BUILD") or ",".join(builds) or "unknown", ",".join(browsers),
+                 platform.node(), _git_commit(), workers, json.dumps(environment(), ensure_ascii=False)),
+            )
+            run_row = int(cur.lastrowid)
+            for r in results:
+                flow_row = self._db.execute(
+                    "INSERT INTO flows(run_id, flow, exit_code, duration, error) VALUES (?, ?, ?, ?, ?)",
+                    (run_row, r.flow, r.exit_code, r.duration, r.error or None),
+                ).lastrowid
+                self._db.executemany(
+                    "INSERT INTO steps(run_id, flow_id, position, step, status, duration, commands, attempts)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(run_row, flow_row, i, s.name, s.status, s.duration, s.commands, s.attempts)
+                     for i, s in enumerate(r.steps)],
+                )
+        return run_row
+
+    def runs(self, limit: int = 20) -> list[dict]:
+        rows = self._db.execute(
+            "SELECT r.*, COUNT(f.id) AS flows FROM runs r LEFT JOIN flows f ON f.run_id = r.id"
+            " GROUP BY r.id ORDER BY r.started DESC LIMIT ?", (limit,),
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def builds(self) -> list[str]:
+        """Builds in the order they were first seen."""
+        rows = self._db.execute("SELECT build FROM runs GROUP BY build ORDER BY MIN(started)").fetchall()
+        return [r["build"] for r in rows]
+
+    def _step_rows(self, since: float = 0.0, step: str | None = None, build: str | None = None) -> list[sqlite3.Row]:
+        sql = ("SELECT s.step, s.status, s.duration, s.commands, s.attempts, s.position, r.build, r.started"
+               " FROM steps s JOIN runs r ON r.id = s.run_id WHERE r.started >= ?")
+        args: list = [since]
+        if step:
+            sql += " AND s.step LIKE ?"
+            args.append(f"%{step}%")
+        if build:
+            sql += " AND r.build = ?"
+            args.append(build)
+        return self._db.execute(sql + " ORDER BY r.started", args).fetchall()
+
+    def trend(self, by: str = "day", since: float = 0.0, step: str | None = None) -> list[StepStats]:
+        """Per step and bucket (calendar day or app build): duration percentiles of non-skipped
+        runs, failure and retry counts, mean WebDriver commands."""
+        groups: dict[tuple[str, str], list[sqlite3.Row]] = {}
+        order: dict[str, int] = {}
+        for row in self._step_rows(since, step):
+            if row["status"] == "skipped":
+                continue
+            bucket = row["build"] if by == "build" else time.strftime("%Y-%m-%d", time.localtime(row["started"]))
+            groups.setdefault((row["step"], bucket), []).append(row)
+            order.setdefault(row["step"], row["position"])
+        out = []
+        for (name, bucket), rows in sorted(groups.items(), key=lambda kv: order[kv[0][0]]):
+            durations = [r["duration"] for r in rows]
+            out.append(StepStats(
+                step=name, bucket=bucket, n=len(rows),
+                failures=sum(r["status"] != "passed" for r in rows),
+                retries=sum(max(r["attempts"] - 1, 0) for r in rows),
+                commands=sum(r["commands"] for r in rows) / len(rows),
+                p50=percentile(durations, 50), p90=percentile(durations, 90), p95=percentile(durations, 95),
+                max=max(durations),
+            ))
+        return out
+
+    def compare_builds(self, base: str, head: str, threshold: float = 0.2, min_delta: float = 0.1) -> list[dict]:
+        """Per step p50/p95 of passed runs on two builds. ``regression`` marks a p50 or p95 growth
+        above ``threshold`` (relative) and ``min_delta`` seconds, so noise on fast steps is ignored."""
+        stats: dict[str, dict[str, list[float]]] = {}
+        order: dict[str, int] = {}
+        for build in (base, head):
+            for row in self._step_rows(build=build):
+                if row["status"] == "passed":
+                    stats.setdefault(row["step"], {base: [], head: []})[build].append(row["duration"])
+                    order.setdefault(row["step"], row["position"])
+        out = []
+        for name in sorted(stats, key=order.get):
+            b, h = stats[name][base], stats[name][head]
+            entry = {"step": name, "base_n": len(b), "head_n": len(h)}
+            regression = False
+            for pct in (50, 95):
+                before, after = percentile(b, pct), percentile(h, pct)
+                entry[f"base_p{pct}"], entry[f"head_p{pct}"] = before, after
+                if b and h and after - before > max(min_delta, before * threshold):
+                    regression = True
+            entry["regression"] = regression
+            out.append(entry)
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def record_results(results: Sequence[FlowResult], workers: int = 1, duration: float | None = None) -> int | None:
+    """Append a finished run to the history (unless RUN_HISTORY=false); never fails the run."""
+    if not enabled():
+        return None
+    try:
+        history = RunHistory()
+        try:
+            return history.record(results, workers=workers, duration=duration)
+        finally:
+            history.close()
+    except (sqlite3.Error, OSError) as e:
+        print(f"[warn] run history not written: {e}")
+        return None
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import json
+import multiprocessing.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+from selenium.common.exceptions import TimeoutException
+
+from core import flight_recorder, perf_metrics
+from core.browser import DriverPool
+from core.checkpoint import Checkpoint, CheckpointStore, capture, restore
+from core.instrumentation import CommandRecorder, as_dicts, instrument
+from core.snapshot_store import run_id
+from pages.locator_cache import detect_app_build
+
+
+Step = tuple[str, Callable]
+
+# Per-process pool of warm browsers; set in worker processes by _init_worker
+_worker_pool: DriverPool | None = None
+
+
+@dataclass(frozen=True)
+class Flow:
+    """One flow of the registration matrix: a locale and a data variant."""
+
+    locale: str = "ru"
+    variant: str = "default"
+
+    @property
+    def name(self) -> str:
+        return f"{self.locale}/{self.variant}"
+
+    def env(self) -> dict[str, str]:
+        return {"LOCALE": self.locale, "DATA_VARIANT": self.variant}
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str  # passed | failed | error | skipped
+    duration: float = 0.0
+    error: str = ""
+    commands: int = 0
+    attempts: int = 0  # 1 = passed/failed first time; >1 = retried after rollback
+
+
+@dataclass
+class FlowResult:
+    flow: str
+    exit_code: int = 0
+    duration: float = 0.0
+    steps: list[StepResult] = field(default_factory=list)
+    worker: int = 0
+    error: str = ""
+    # Timed WebDriver commands (core.instrumentation.CommandRecord as dicts)
+    commands: list[dict] = field(default_factory=list)
+    # Front-end metrics per step boundary (core.perf_metrics.PerfSample as dicts)
+    perf: list[dict] = field(default_factory=list)
+    build: str = ""  # front-end build the flow ran against (pages.locator_cache.detect_app_build)
+    browser: str = ""  # browser version
+
+
+def build_flows(locales: Sequence[str], variants: Sequence[str]) -> list[Flow]:
+    """Cartesian product of locales and data variants, in a stable order."""
+    return [Flow(locale=loc, variant=var) for loc in locales for var in variants]
+
+
+@contextmanager
+def _flow_env(flow: Flow) -> Iterator[None]:
+    """Temporarily export flow settings so steps/pages pick them up from env."""
+    saved = {k: os.environ.get(k) for k in flow.env()}
+    os.environ.update(flow.env())
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def run_steps(driver, steps: Sequence[Step], flow_name: str = "", checkpoints: CheckpointStore | None = None,
+              start: int = 0, retries: int = 0) -> FlowResult:
+    """Run steps in order on one driver; stop at the first failure.
+
+    With a writable ``checkpoints`` store the browser state is saved after every passed step.
+    ``start`` > 0 restores the checkpoint saved after step number ``start`` from that store and
+    runs from there; the skipped prefix is left out of the result.
+
+    ``retries`` > 0 re-runs a failing step up to that many times, each time after rolling the
+    browser back to the in-memory checkpoint taken at the step's start boundary. The number of
+    attempts is recorded per step.
+
+    Exit codes follow test_factory: 0 - passed, 2 - assertion failed, 3 - unexpected error.
+    The flight recorder's buffers are written to the snapshot store only when a step
+    fails with AssertionError or TimeoutException; passing runs do no diagnostic I/O.
+    With PERF_METRICS=true a PerfSample is taken after every step and checked against the page's
+    budget; with PERF_BUDGET=fail a breach fails the step like an assertion.
+    """
+    prefix = f"[{flow_name}] " if flow_name else ""
+    result = FlowResult(flow=flow_name, worker=os.getpid())
+    recorder = CommandRecorder(flow_name)
+    instrument(driver)
+    flight = flight_recorder.FlightRecorder(driver) if flight_recorder.enabled() else None
+    perf_mode = perf_metrics.budget_mode() if perf_metrics.enabled() else None
+    saving = checkpoints is not None and not checkpoints.readonly
+    boundary: Checkpoint | None = None  # state at the start of the current step, for rollback
+    started = time.perf_counter()
+    if start > 0:
+        try:
+            if checkpoints is None:
+                raise ValueError("no checkpoint store given")
+            boundary = checkpoints.load(start - 1)
+            restore(driver, boundary)
+        except Exception as e:
+            result.exit_code, result.error = 3, f"checkpoint restore failed: {e}"
+            print(f"{prefix}💥 Не удалось восстановить чекпоинт: {e}")
+            return result
+        print(f"{prefix}⏩ Состояние после шага «{boundary.step_name}» восстановлено: {boundary.url}")
+    elif retries > 0:
+        boundary = _try_capture(driver, -1, "")
+    for index, (name, fn) in enumerate(steps):
+        if index < start:
+            continue
+        if result.exit_code:
+            result.steps.append(StepResult(name, "skipped"))
+            continue
+        print(f"\n{prefix}▶️  {name}")
+        if flight is not None:
+            flight.mark(name)
+        t0 = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            failure: Exception | None = None
+            try:
+                with recorder.step(name):
+                    fn(driver)
+            except Exception as e:
+                failure = e
+            if failure is None or attempts > retries or boundary is None:
+                break
+            print(f"{prefix}🔁 {name}: попытка {attempts} не удалась ({failure}); откат к началу шага")
+            try:
+                restore(driver, boundary)
+            except Exception as e:
+                print(f"{prefix}[warn] rollback failed, no more retries: {e}")
+                break
+        duration = time.perf_counter() - t0
+        if perf_mode is not None:
+            failure = _sample_perf(driver, result, recorder, name, perf_mode, failure, prefix)
+        if isinstance(failure, AssertionError):
+            result.steps.append(StepResult(name, "failed", duration, str(failure)))
+            result.exit_code = 2
+            print(f"{prefix}❌ Тест упал: {failure}")
+        elif failure is not None:
+            result.steps.append(StepResult(name, "error", duration, str(failure)))
+            result.exit_code = 3
+            print(f"{prefix}💥 Неожиданная ошибка: {failure}")
+        else:
+            result.steps.append(StepResult(name, "passed", duration))
+            retried = f" (попыток: {attempts})" if attempts > 1 else ""
+            print(f"{prefix}✅ {name} пройден{retried}")
+        result.steps[-1].commands = recorder.count(name)
+        result.steps[-1].attempts = attempts
+        if failure is None and (saving or retries > 0):
+            boundary = _try_capture(driver, index, name, prefix)
+            if saving and boundary is not None:
+                checkpoints.save(boundary)
+        if flight is not None and isinstance(failure, (AssertionError, TimeoutException)):
+            flight.flush(type(failure).__name__, name, str(failure))
+            print(f"{prefix}🧾 Диагностика сохранена: python scripts/snapshots.py list --step '{name}'")
+    result.duration = time.perf_counter() - started
+    result.commands = as_dicts(recorder.records)
+    result.build = detect_app_build(driver)
+    result.browser = str((getattr(driver, "capabilities", None) or {}).get("browserVersion", ""))
+    if not result.exit_code:
+        print(f"\n{prefix}🎉 Все шаги пройдены успешно")
+    return result
+
+
+def _sample_perf(driver, result: FlowResult, recorder: CommandRecorder, name: str, mode: str,
+                 failure: Exception | None, prefix: str = "") -> Exception | None:
+    """Take the step's PerfSample and check its page budget; a breach becomes the step's
+    failure under PERF_BUDGET=fail. Sampling errors are only reported."""
+    try:
+        sample = perf_metrics.collect(driver, name, recorder.last_page(name))
+    except Exception as e:
+        print(f"{prefix}[warn] perf metrics after {name!r} not collected: {e}")
+        return failure
+    result.perf.append(asdict(sample))
+    print(f"{prefix}📈 {sample.page or '-'}: {sample.summary()}")
+    breaches = perf_metrics.check(sample) if failure is None and mode != "off" else []
+    if breaches:
+        message = f"Perf budget exceeded on {sample.page or 'page'}: {'; '.join(breaches)}"
+        print(f"{prefix}⚠️  {message}")
+        if mode == "fail":
+            return AssertionError(message)
+    return failure
+
+
+def _try_capture(driver, index: int, name: str, prefix: str = "") -> Checkpoint | None:
+    try:
+        return capture(driver, index, name)
+    except Exception as e:
+        print(f"{prefix}[warn] checkpoint after {name or 'start'!r} not taken: {e}")
+        return None
+
+
+def run_flow(flow: Flow, steps: Sequence[Step], pool: DriverPool | None = None, checkpoints: bool = False,
+             start: int = 0, retries: int = 0) -> FlowResult:
+    """Run one flow on a clean browser from the pool. Safe to call inside a worker process.
+
+    ``checkpoints`` saves a checkpoint after every passed step and ``start`` resumes from one,
+    both in the flow's own CheckpointStore.
+    """
+    pool = pool or _worker_pool
+    with _flow_env(flow):
+        try:
+            driver = pool.acquire()
+        except Exception as e:
+            return FlowResult(flow=flow.name, exit_code=3, worker=os.getpid(), error=f"driver start failed: {e}")
+        try:
+            store = CheckpointStore(flow.name, readonly=not checkpoints) if checkpoints or start else None
+            return run_steps(driver, steps, flow.name, checkpoints=store, start=start, retries=retries)
+        finally:
+            pool.release(driver)
+
+
+def _init_worker() -> None:
+    """Pre-launch this worker's browser while the parent is still submitting flows."""
+    global _worker_pool
+    _worker_pool = DriverPool(size=1)
+    # atexit does not run in pool workers; multiprocessing finalizers do
+    multiprocessing.util.Finalize(_worker_pool, _worker_pool.close, exitpriority=10)
+    try:
+        _worker_pool.warm()
+    except Exception as e:
+        # Leave it to run_flow to report the failure per flow
+        print(f"[worker {os.getpid()}] browser warm-up failed: {e}")
+
+
+def run_flows(flows: Sequence[Flow], steps: Sequence[Step], workers: int = 1, checkpoints: bool = False,
+              start: int = 0, retries: int = 0) -> list[FlowResult]:
+    """Run flows serially (workers <= 1) or sharded across a pool of worker processes.
+
+    Each worker owns one warm browser that is reset between its flows, so flows
+    never share a session. Results are returned in the order of ``flows``.
+    """
+    if workers <= 1 or len(flows) <= 1:
+        with DriverPool(size=1) as pool:
+            return [run_flow(flow, steps, pool, checkpoints, start, retries) for flow in flows]
+
+    run_id()  # pin RUN_ID in the environment so spawned workers report under the same run
+    results: list[FlowResult] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(flows)), initializer=_init_worker) as executor:
+        futures = [executor.submit(run_flow, flow, steps, None, checkpoints, start, retries) for flow in flows]
+        for flow, fut in zip(flows, futures):
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                # Worker crashed (e.g. browser killed): report, don't lose the rest of the matrix
+                results.append(FlowResult(flow=flow.name, exit_code=3, error=f"worker failed: {e}"))
+    return results
+
+
+def exit_code(results: Sequence[FlowResult]) -> int:
+    """Worst exit code across flows (3 > 2 > 0)."""
+    return max((r.exit_code for r in results), default=0)
+
+
+def merge_report(results: Sequence[FlowResult]) -> dict:
+    """Merge per-flow results into per-step pass/fail counts and timings."""
+    steps: dict[str, dict] = {}
+    for r in results:
+        for s in r.steps:
+            agg = steps.setdefault(s.name, {"passed": 0, "failed": 0, "error": 0, "skipped": 0, "commands": 0,
+                                            "retries": 0, "durations": []})
+            agg[s.status] += 1
+            agg["commands"] += s.commands
+            agg["retries"] += max(s.attempts - 1, 0)
+            if s.status != "skipped":
+                agg["durations"].append(s.duration)
+    for agg in steps.values():
+        d = agg.pop("durations")
+        agg["min"] = min(d, default=0.0)
+        agg["avg"] = sum(d) / len(d) if d else 0.0
+        agg["max"] = max(d, default=0.0)
+    flows = []
+    for r in results:
+        f = asdict(r)
+        f.pop("commands")  # per-command detail goes to the JSONL file, not the report
+        flows.append(f)
+    return {
+        "exit_code": exit_code(results),
+        "flows": flows,
+        "steps": steps,
+    }
+
+
+def print_report(report: dict) -> None:
+    print("\n📊 Сводка по флоу")
+    for f in report["flows"]:
+        mark = "✅" if f["exit_code"] == 0 else "❌"
+        extra = f" ({f['error']})" if f["error"] else ""
+        print(f"  {mark} {f['flow']:<24} exit={f['exit_code']} {f['duration']:.1f}s{extra}")
+    print("\n📊 Сводка по шагам")
+    for name, s in report["steps"].items():
+        print(
+            f"  {name:<36} pass={s['passed']} fail={s['failed'] + s['error']} skip={s['skipped']}"
+            f"  min={s['min']:.2f}s avg={s['avg']:.2f}s max={s['max']:.2f}s cmds={s['commands']}"
+            + (f" retries={s['retries']}" if s["retries"] else "")
+        )
+
+
+def write_report(report: dict, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,          -- html | png | trace
+    size INTEGER NOT NULL,       -- bytes on disk
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    step TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    url TEXT,
+    created REAL NOT NULL,
+    html TEXT REFERENCES blobs(hash),
+    png TEXT REFERENCES blobs(hash),
+    trace TEXT REFERENCES blobs(hash)   -- flight recorder buffers (console, network, frames)
+);
+CREATE INDEX IF NOT EXISTS snapshots_run ON snapshots(run, step);
+CREATE INDEX IF NOT EXISTS snapshots_html ON snapshots(html);
+CREATE INDEX IF NOT EXISTS snapshots_png ON snapshots(png);
+CREATE INDEX IF NOT EXISTS snapshots_trace ON snapshots(trace);
+CREATE INDEX IF NOT EXISTS blobs_lru ON blobs(last_used);
+"""
+
+KINDS = ("html", "png", "trace")
+SUFFIXES = {"html": ".html", "png": ".png", "trace": ".json"}
+
+def run_id() -> str:
+    """Identifier of this test run: RUN_ID env, or generated on first use and stored in RUN_ID.
+
+    Worker processes inherit the parent's environment, so call this in the parent before
+    starting them (run_flows does) and the whole run shares one id under fork and spawn.
+    """
+    value = os.getenv("RUN_ID")
+    if not value:
+        value = os.environ["RUN_ID"] = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    return value
+
+
+@dataclass
+class SnapshotRow:
+    id: int
+    run: str
+    step: str
+    reason: str
+    url: str | None
+    created: float
+    html: str | None
+    png: str | None
+    trace: str | None = None
+
+
+class SnapshotStore:
+    """
+    Content-addressed dump store: every unique HTML/PNG payload is kept once under
+    ``blobs/<aa>/<sha256>``, and a SQLite index maps (run, step, reason) to blobs.
+
+    HTML and trace (JSON) blobs are gzipped (``compresslevel`` 0 = plain); PNGs are stored as-is.
+    Safe to share between threads of one process and between processes (WAL, busy timeout).
+    """
+
+    def __init__(self, root: str | Path | None = None, compresslevel: int | None = None):
+        self.root = Path(root or os.getenv("DUMP_DIR", "_dom_dumps"))
+        self.compresslevel = int(os.getenv("DUMP_COMPRESS", "6")) if compresslevel is None else compresslevel
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.root / "index.sqlite", timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            columns = {r[1] for r in self._db.execute("PRAGMA table_info(snapshots)")}
+            if columns and "trace" not in columns:
+                self._db.execute("ALTER TABLE snapshots ADD COLUMN trace TEXT REFERENCES blobs(hash)")
+            self._db.executescript(SCHEMA)
+
+    # --- blobs ---
+
+    def blob_path(self, digest: str, kind: str) -> Path:
+        suffix = SUFFIXES[kind]
+        if kind != "png" and self.compresslevel > 0:
+            suffix += ".gz"
+        return self.root / "blobs" / digest[:2] / f"{digest}{suffix}"
+
+    def _find_blob(self, digest: str, kind: str) -> Path:
+        for suffix in (SUFFIXES[kind] + ".gz", SUFFIXES[kind]):
+            path = self.root / "blobs" / digest[:2] / f"{digest}{suffix}"
+            if path.exists():
+                return path
+        raise FileNotFoundError(digest)
+
+    def _put_blob(self, data: bytes, kind: str, now: float) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        row = self._db.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if row is not None:
+            self._db.execute("UPDATE blobs SET last_used = ? WHERE hash = ?", (now, digest))
+            return digest
+        path = self.blob_path(digest, kind)
+        payload = gzip.compress(data, compresslevel=self.compresslevel) if path.suffix == ".gz" else data
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        self._db.execute(
+            "INSERT OR IGNORE INTO blobs(hash, kind, size, created, last_used) VALUES (?, ?, ?, ?, ?)",
+            (digest, kind, len(payload), now, now),
+        )
+        return digest
+
+    def read_blob(self, digest: str, kind: str) -> bytes:
+        path = self._find_blob(digest, kind)
+        with self._lock, self._db:
+            self._db.execute("UPDATE blobs SET last_used = ? WHERE hash = ?", (time.time(), digest))
+        data = path.read_bytes()
+        return gzip.decompress(data) if path.suffix == ".gz" else data
+
+    # --- snapshots ---
+
+    def put(self, reason: str, html: str | None = None, png: bytes | None = None, step: str = "",
+            run: str | None = None, url: str | None = None, trace: str | None = None) -> int:
+        """Store one snapshot; identical payloads reuse the existing blob. Returns the snapshot id."""
+        now = time.time()
+        with self._lock, self._db:
+            html_hash = self._put_blob(html.encode("utf-8"), "html", now) if html is not None else None
+            png_hash = self._put_blob(png, "png", now) if png is not None else None
+            trace_hash = self._put_blob(trace.encode("utf-8"), "trace", now) if trace is not None else None
+            cur = self._db.execute(
+                "INSERT INTO snapshots(run, step, reason, url, created, html, png, trace)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run or run_id(), step, reason, url, now, html_hash, png_hash, trace_hash),
+            )
+            return int(cur.lastrowid)
+
+    def get(self, snapshot_id: int) -> SnapshotRow | None:
+        row = self._db.execute("SELECT * FROM snapshots WHERE id = ?", (snapshot_id,)).fetchone()
+        return SnapshotRow(**dict(row)) if row else None
+
+    def paths(self, row: SnapshotRow) -> dict[str, Path]:
+        """Blob files of a snapshot, by kind."""
+        out = {}
+        for kind in KINDS:
+            digest = getattr(row, kind)
+            if digest:
+                try:
+                    out[kind] = self._find_blob(digest, kind)
+                except FileNotFoundError:
+                    pass
+        return out
+
+    def query(self, run: str | None = None, step: str | None = None, reason: str | None = None,
+              limit: int = 50) -> list[SnapshotRow]:
+        sql, args = "SELECT * FROM snapshots WHERE 1=1", []
+        for column, value in (("run", run), ("step", step), ("reason", reason)):
+            if value:
+                sql += f" AND {column} = ?"
+                args.append(value)
+        sql += " ORDER BY id DESC LIMIT ?"
+        args.append(limit)
+        return [SnapshotRow(**dict(r)) for r in self._db.execute(sql, args).fetchall()]
+
+    def stats(self) -> dict:
+        blobs = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        snaps = self._db.execute("SELECT COUNT(*), COUNT(DISTINCT run) FROM snapshots").fetchone()
+        refs = self._db.execute("SELECT COUNT(html) + COUNT(png) + COUNT(trace) FROM snapshots").fetchone()[0]
+        return {"blobs": blobs[0], "bytes": blobs[1], "snapshots": snaps[0], "runs": snaps[1],
+                "references": refs}
+
+    # --- retention ---
+
+    def evict(self, max_age_days: float | None = None, max_mb: float | None = None) -> dict:
+        """
+        Drop snapshots older than ``max_age_days``, then least-recently-used blobs (and the
+        snapshots that reference them) until the store fits in ``max_mb``.
+
+        Defaults come from SNAPSHOT_MAX_AGE_DAYS (7) and SNAPSHOT_MAX_MB (500); 0 disables a limit.
+        """
+        if max_age_days is None:
+            max_age_days = float(os.getenv("SNAPSHOT_MAX_AGE_DAYS", "7"))
+        if max_mb is None:
+            max_mb = float(os.getenv("SNAPSHOT_MAX_MB", "500"))
+        removed = {"snapshots": 0, "blobs": 0, "bytes": 0}
+        with self._lock, self._db:
+            if max_age_days > 0:
+                cutoff = time.time() - max_age_days * 86400
+                removed["snapshots"] += self._db.execute(
+                    "DELETE FROM snapshots WHERE created < ?", (cutoff,)
+                ).rowcount
+            self._drop_orphans(removed)
+            budget = int(max_mb * 1024 * 1024)
+            while max_mb > 0 and self._total_bytes() > budget:
+                lru = self._db.execute("SELECT hash FROM blobs ORDER BY last_used LIMIT 1").fetchone()
+                if lru is None:
+                    break
+                removed["snapshots"] += self._db.execute(
+                    "DELETE FROM snapshots WHERE html = ? OR png = ? OR trace = ?", (lru["hash"],) * 3
+                ).rowcount
+                # the snapshot's other blob is dropped too once nothing references it
+                self._drop_orphans(removed)
+        return removed
+
+    def _total_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _drop_orphans(self, removed: dict) -> None:
+        rows = self._db.execute(
+            "SELECT hash, kind, size FROM blobs b WHERE NOT EXISTS (SELECT 1 FROM snapshots s WHERE s.html = b.hash)"
+            " AND NOT EXISTS (SELECT 1 FROM snapshots s WHERE s.png = b.hash)"
+            " AND NOT EXISTS (SELECT 1 FROM snapshots s WHERE s.trace = b.hash)"
+        ).fetchall()
+        for row in rows:
+            self._db.execute("DELETE FROM blobs WHERE hash = ?", (row["hash"],))
+            try:
+                self._find_blob(row["hash"], row["kind"]).unlink()
+            except FileNotFoundError:
+                pass
+            removed["blobs"] += 1
+            removed["bytes"] += row["size"]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import time
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from .base_page import BasePage
+from .base_page import PROBE_TIMEOUT, BasePage
+from .dom_wait import any_candidate, attr_equals, enabled, present, visible
+from .validation import ValidationResult, validate_input
 from core.browser import get_base_url
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import ActionChains
@@ -22,6 +27,8 @@ class AuthLandingPage(BasePage):
         (By.XPATH, "//header//button[.//span[contains(translate(., 'ENRU', 'enru'), 'ru')] or contains(., 'EN') or contains(., 'RU')]")
     ]
     TITLE = (By.CSS_SELECTOR, "p.pr_slider_title")
+    MENU_LIST = (By.CSS_SELECTOR, ".context-menu.context-menu--modal .context-menu__list")
+    MENU_ITEM_TITLES = (By.CSS_SELECTOR, ".context-menu__option .list-item__title")
     # Multiple locale variants for the Start button
     START_BTN_XPATHS = [
         "//button[span[contains(normalize-space(.), 'Начать')]]",
@@ -29,13 +36,18 @@ class AuthLandingPage(BasePage):
         "//button[contains(normalize-space(.), 'Начать')]",
         "//button[contains(normalize-space(.), 'Start')]",
     ]
+    START_BTN_CANDIDATES = [(By.XPATH, xp) for xp in START_BTN_XPATHS]
+    COOKIE_BTN_CANDIDATES = [
+        (By.XPATH, "//button[contains(., 'Принять') or contains(., 'Согласен') or contains(., 'Хорошо')]"),
+        (By.XPATH, "//button[contains(., 'Accept') or contains(., 'I agree') or contains(., 'Got it')]"),
+        (By.CSS_SELECTOR, "button.cookie-accept, button[data-testid='cookie-accept']"),
+    ]
 
     def open(self):
-        self.driver.get(get_base_url())
-        # Wait for main title to ensure page is loaded
+        # Navigation returns once the main title is visible (or the APP_READY detectors hold)
         try:
-            WebDriverWait(self.driver, 15).until(EC.visibility_of_element_located(self.TITLE))
-        except Exception:
+            self.navigate(get_base_url(), ready=visible(self.TITLE), timeout=15)
+        except TimeoutException:
             pass
         # Try close cookie banner if exists
         try:
@@ -45,18 +57,16 @@ class AuthLandingPage(BasePage):
         return self
 
     def _find_lang_btn(self):
-        for by, sel in self.LANG_BTN_CANDIDATES:
-            try:
-                el = WebDriverWait(self.driver, 4).until(EC.presence_of_element_located((by, sel)))
-                if el and el.is_displayed():
-                    try:
-                        WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable((by, sel)))
-                    except Exception:
-                        pass
-                    return el
-            except Exception:
-                continue
-        raise AssertionError("Language button not found")
+        # One bounded wait over all candidates, each poll a single round trip
+        try:
+            el = self.wait_resolve("LANG_BTN_CANDIDATES", timeout=4, enabled=False).element
+        except TimeoutException:
+            raise AssertionError("Language button not found")
+        try:
+            WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(el))
+        except Exception:
+            pass
+        return el
 
     def open_language_dropdown(self):
         btn = self._find_lang_btn()
@@ -70,12 +80,7 @@ class AuthLandingPage(BasePage):
             self.driver.execute_script("arguments[0].click();", btn)
         # Wait for the modal context menu list to appear
         try:
-            WebDriverWait(self.driver, 6).until(
-                EC.visibility_of_element_located((
-                    By.CSS_SELECTOR,
-                    ".context-menu.context-menu--modal .context-menu__list"
-                ))
-            )
+            self.wait_until(visible(self.MENU_LIST), 6)
         except Exception:
             pass
 
@@ -85,44 +90,23 @@ class AuthLandingPage(BasePage):
         except Exception:
             pass
 
-    def _find_menu_in_current_context(self):
-        try:
-            return self.driver.find_element(By.CSS_SELECTOR, ".context-menu.context-menu--modal .context-menu__list")
-        except Exception:
-            return None
-
-    def _switch_to_menu_context(self):
+    def _switch_to_menu_context(self, timeout: float = PROBE_TIMEOUT):
         """Ensure driver context points to the iframe (if any) containing the language menu.
         Returns the menu WebElement if found, otherwise None. Restores default content if not found.
+        The frame path is cached (see BasePage.find_in_frames), so frames are only rescanned
+        when the menu moved; retries until ``timeout`` so it does not depend on the implicit wait.
         """
-        # First try default content
-        self._switch_to_default()
-        menu = self._find_menu_in_current_context()
-        if menu is not None:
-            return menu
-        # Try top-level iframes and one nested level
-        frames = self.driver.find_elements(By.TAG_NAME, "iframe")
-        for fr in frames:
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                self.driver.switch_to.frame(fr)
-                menu = self._find_menu_in_current_context()
-                if menu is not None:
-                    return menu
-                nested = self.driver.find_elements(By.TAG_NAME, "iframe")
-                for fr2 in nested:
-                    try:
-                        self.driver.switch_to.frame(fr2)
-                        menu = self._find_menu_in_current_context()
-                        if menu is not None:
-                            return menu
-                    finally:
-                        self.driver.switch_to.parent_frame()
-            except Exception:
-                pass
-            finally:
-                self.driver.switch_to.default_content()
-        self._switch_to_default()
-        return None
+                menu = self.find_in_frames(self.MENU_LIST, key="MENU_LIST")
+            except WebDriverException:
+                # A frame detached mid-scan; start over from the top-level document
+                self._switch_to_default()
+                menu = None
+            if menu is not None or time.monotonic() >= deadline:
+                return menu
+            time.sleep(0.1)
 
     def get_language_items(self):
         # Extract language items from the modal menu; handle iframes if needed
@@ -130,23 +114,19 @@ class AuthLandingPage(BasePage):
         if menu is None:
             return {"items": [], "texts": []}
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".context-menu__option .list-item__title"))
-            )
+            self.wait_until(present(self.MENU_ITEM_TITLES), 5)
         except Exception:
             pass
-        titles = menu.find_elements(By.CSS_SELECTOR, ".context-menu__option .list-item__title")
+        # All titles with text in one round trip
+        titles = self.read_all(self.MENU_ITEM_TITLES, root=menu)
         texts: list[str] = []
         items = []
-        for i, el in enumerate(titles):
-            try:
-                txt = (el.text or el.get_attribute('textContent') or '').strip()
-                if not txt:
-                    continue
-                texts.append(txt)
-                items.append({"text": txt, "index": i})
-            except Exception:
+        for i, info in enumerate(titles):
+            txt = info.label
+            if not txt:
                 continue
+            texts.append(txt)
+            items.append({"text": txt, "index": i})
         return {"items": items, "texts": texts}
 
     def click_language_by_text(self, label: str):
@@ -172,9 +152,7 @@ class AuthLandingPage(BasePage):
 
         # Ensure the list is present and the label exists before clicking
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#context-root .context-menu__list"))
-            )
+            self.wait_until(present((By.CSS_SELECTOR, "#context-root .context-menu__list")), 5)
         except Exception:
             pass
 
@@ -219,24 +197,21 @@ class AuthLandingPage(BasePage):
 
     def click_start(self):
         # Try multiple variants in different locales with safe click
-        for xp in self.START_BTN_XPATHS:
-            els = self.driver.find_elements(By.XPATH, xp)
-            if els:
-                try:
-                    els[0].click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", els[0])
-                return
+        match = self.probe("START_BTN_CANDIDATES", visible=False, enabled=False)
+        if match:
+            try:
+                match.element.click()
+            except Exception:
+                self.driver.execute_script("arguments[0].click();", match.element)
+            return
         raise AssertionError("Start button not found on landing page")
 
     def get_language_label(self) -> str:
         try:
             btn = self._find_lang_btn()
-            txt = (btn.text or "").strip()
-            if not txt:
-                # sometimes label stored in aria-label or data-attr
-                txt = (btn.get_attribute('aria-label') or btn.get_attribute('data-lang') or '').strip()
-            return txt
+            # text, aria-label and data-lang in one read; label is sometimes only in the attributes
+            info = self.read_all(btn, ("aria-label", "data-lang"))[0]
+            return info.text or (info.attrs["aria-label"] or info.attrs["data-lang"] or "").strip()
         except Exception:
             return ""
 
@@ -298,34 +273,39 @@ class AuthLandingPage(BasePage):
 
     def dismiss_cookies(self):
         """Try to close cookie/consent banners if present."""
-        candidates = [
-            (By.XPATH, "//button[contains(., 'Принять') or contains(., 'Согласен') or contains(., 'Хорошо')]") ,
-            (By.XPATH, "//button[contains(., 'Accept') or contains(., 'I agree') or contains(., 'Got it')]") ,
-            (By.CSS_SELECTOR, "button.cookie-accept, button[data-testid='cookie-accept']"),
-        ]
-        for by, sel in candidates:
-            try:
-                el = WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable((by, sel)))
-                try:
-                    el.click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", el)
-                break
-            except Exception:
-                continue
+        try:
+            el = self.wait_resolve("COOKIE_BTN_CANDIDATES", timeout=2).element
+        except TimeoutException:
+            return
+        try:
+            el.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", el)
 
 
 class EmailPage(BasePage):
     # Real selectors (from DOM dump after clicking "Начать")
     EMAIL_INPUT = (By.CSS_SELECTOR, "input#email-input")
-    # Button has inner span text "Продолжить" and type="button"
-    NEXT_BTN = (By.XPATH, "//button[span[contains(normalize-space(.), 'Продолжить')]]")
+    # Button has inner span text "Продолжить" ("Continue" in EN locale) and type="button"
+    NEXT_BTN = (By.XPATH, "//button[span[contains(normalize-space(.), 'Продолжить') or contains(normalize-space(.), 'Continue')]]")
     # TODO: Add specific selector for validation error text when identified
     ERROR_TEXT = (By.CSS_SELECTOR, "p.hdi_description")
+    # Browser-side conditions for BasePage.wait_until
+    NEXT_ENABLED = enabled(NEXT_BTN)
+    HAS_ERROR = present(ERROR_TEXT)
+    INPUT_VISIBLE = visible(EMAIL_INPUT)
 
     def enter_email(self, email: str):
         self.type(*self.EMAIL_INPUT, text=email)
 
+    def validate_emails(self, cases, timeout: float = 2) -> list[ValidationResult]:
+        """Drive (email, expected_blocked) cases through the input in one batch; see pages.validation."""
+        el = self.wait_visible(*self.EMAIL_INPUT)
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'})", el)
+        # No positive signal here: the input has no aria-invalid and an empty value shows no error,
+        # so "blocked" stays "Next disabled or error shown"
+        return validate_input(self.driver, el, cases, ~self.NEXT_ENABLED | self.HAS_ERROR, timeout=timeout)
+
     def click_next(self):
         self.click(*self.NEXT_BTN)
 
@@ -360,49 +340,39 @@ class CodePage(BasePage):
         (By.CSS_SELECTOR, "button[type='submit']"),
         (By.CSS_SELECTOR, "button.btn.btn--full-width"),
     ]
+    INPUTS_PRESENT = any_candidate(CODE_INPUT_CANDIDATES, visible=False, enabled=False)
 
-    def _find_code_inputs(self):
-        # Try candidates and return list of WebElements
-        for by, sel in self.CODE_INPUT_CANDIDATES:
-            els = self.driver.find_elements(by, sel)
-            if els:
-                return els
-        return []
+    def _find_code_inputs(self, timeout: float = 0):
+        # Try candidates (last winner first) in one round trip and return list of WebElements
+        match = self.probe("CODE_INPUT_CANDIDATES", timeout, visible=False, enabled=False, all_matches=True)
+        return match.elements if match else []
 
     def enter_code(self, code: str):
-        inputs = self._find_code_inputs()
+        inputs = self._find_code_inputs(PROBE_TIMEOUT)
         assert inputs, "Не удалось найти поле(я) ввода кода"
         if len(inputs) == 1:
-            self.wait_visible(*self.CODE_INPUT_CANDIDATES[0]) if inputs[0] is None else None
-            inputs[0].clear()
-            inputs[0].send_keys(code)
+            self.fill([(inputs[0], code)])
         else:
-            # Fill per character across multiple inputs
-            for i, ch in enumerate(code):
-                if i >= len(inputs):
-                    break
-                inputs[i].clear()
-                inputs[i].send_keys(ch)
-
-    def click_back(self):
-        # Try all back button candidates
-        for by, sel in self.BACK_BUTTON_CANDIDATES:
-            els = self.driver.find_elements(by, sel)
-            if els:
-                els[0].click()
-                return
-        raise AssertionError("Кнопка 'Назад' не найдена на странице кода")
+            # One character per box; with FAST_FILL all boxes are set in a single call
+            self.fill(list(zip(inputs, code)))
+
+    def click_back(self) -> bool:
+        """Click Back if the page has one (any candidate); False when it has none."""
+        match = self.probe("BACK_BUTTON_CANDIDATES", visible=False, enabled=False)
+        if match is None:
+            return False
+        match.element.click()
+        return True
 
     def continue_next(self):
         # Try to click a Continue/Next button
-        for by, sel in self.CONTINUE_BUTTON_CANDIDATES:
-            els = self.driver.find_elements(by, sel)
-            if els:
-                try:
-                    els[0].click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", els[0])
-                return
+        match = self.probe("CONTINUE_BUTTON_CANDIDATES", visible=False, enabled=False)
+        if match:
+            try:
+                match.element.click()
+            except Exception:
+                self.driver.execute_script("arguments[0].click();", match.element)
+            return
         # If nothing found, silently return; some flows may auto-advance
 
 
@@ -417,44 +387,51 @@ class WorkspaceNamePage(BasePage):
     ]
     NEXT_BTN = (By.CSS_SELECTOR, "button[type='submit']")
     BACK_BTN = (By.CSS_SELECTOR, "[data-testid='back-button']")
+    BACK_BUTTON_CANDIDATES = [
+        BACK_BTN,
+        (By.XPATH, "//button[contains(normalize-space(.), 'Назад')]"),
+    ]
+    ERROR = (By.CSS_SELECTOR, ".error, .error-text, .field-error")
+    # Browser-side conditions for BasePage.wait_until, mirroring the methods below
+    NAME_INPUT_READY = any_candidate(NAME_INPUT_CANDIDATES)
+    NEXT_ENABLED = enabled(NEXT_BTN, visible=False, disabled_class="disabled")
+    HAS_ERROR = attr_equals(NAME_INPUT_READY, "aria-invalid", "true") | visible(ERROR)
 
     def _find_name_input(self):
-        for by, sel in self.NAME_INPUT_CANDIDATES:
-            els = self.driver.find_elements(by, sel)
-            for el in els:
-                try:
-                    if el.is_displayed() and el.is_enabled():
-                        return el
-                except Exception:
-                    continue
-        return None
+        # First visible and enabled input across all candidates, one round trip
+        match = self.resolve("NAME_INPUT_CANDIDATES")
+        return match.element if match else None
 
     def exists_name_input(self) -> bool:
         return self._find_name_input() is not None
 
+    def validate_names(self, cases, timeout: float = 2) -> list[ValidationResult]:
+        """Drive (name, expected_blocked) cases through the name input in one batch; see pages.validation."""
+        el = self._find_name_input()
+        assert el is not None, "Поле имени воркспейса не найдено"
+        return validate_input(self.driver, el, cases, ~self.NEXT_ENABLED | self.HAS_ERROR, invalid=self.HAS_ERROR,
+                              timeout=timeout)
+
     def set_name(self, name: str):
         el = self._find_name_input()
         assert el is not None, "Поле имени воркспейса не найдено"
-        el.clear()
-        el.send_keys(name)
+        self.fill([(el, name)])
 
     def next(self):
         self.click(*self.NEXT_BTN)
 
-    def click_back(self):
-        try:
-            self.click(*self.BACK_BTN)
-        except Exception:
-            # Fallback by text
-            try:
-                self.click(By.XPATH, "//button[contains(normalize-space(.), 'Назад')]")
-            except Exception:
-                pass
+    def click_back(self) -> bool:
+        """Click Back if the page has one (test id, then by text); False when it has none."""
+        match = self.probe("BACK_BUTTON_CANDIDATES")
+        if match is None:
+            return False
+        match.element.click()
+        return True
 
     def is_next_enabled(self) -> bool:
         try:
-            el = self.driver.find_element(*self.NEXT_BTN)
-            return el.is_enabled() and 'disabled' not in (el.get_attribute('class') or '')
+            info = self.read_all(self.NEXT_BTN, ("class",))[0]
+            return info.enabled and 'disabled' not in (info.attrs["class"] or '')
         except Exception:
             return False
 
@@ -464,8 +441,7 @@ class WorkspaceNamePage(BasePage):
             inp = self._find_name_input()
             if inp is not None and (inp.get_attribute('aria-invalid') == 'true'):
                 return True
-            err = self.driver.find_elements(By.CSS_SELECTOR, ".error, .error-text, .field-error")
-            return any(e.is_displayed() for e in err)
+            return any(info.visible for info in self.read_all(self.ERROR))
         except Exception:
             return False
 
@@ -484,8 +460,7 @@ class ProfilePage(BasePage):
         self.wait_visible(*self.AVATAR_INPUT).send_keys(path)
 
     def fill_names(self, first: str, last: str):
-        self.type(*self.FIRST_NAME, text=first)
-        self.type(*self.LAST_NAME, text=last)
+        self.fill([(self.FIRST_NAME, first), (self.LAST_NAME, last)])
 
     def can_continue(self) -> bool:
         return self.wait_visible(*self.CONTINUE).is_enabled()
@@ -1,15 +1,68 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence, Union
 
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from core import perf_metrics
+
+from .dom_js import FILL_JS, READ_JS, RESOLVE_JS, to_js_locator
+from . import dom_wait
+from .dom_wait import Cond, any_candidate, fresh_document, holds, present, url_contains, wait_for
+from .locator_cache import detect_app_build, get_locator_cache
+from .readiness import app_ready
+
 
 DEFAULT_TIMEOUT = 10
+# Bound for probing optional elements (back/continue buttons, menus); replaces the
+# driver's implicit wait, which may be 0 (IMPLICIT_WAIT=0)
+PROBE_TIMEOUT = 2
+
+Locator = tuple[str, str]
+# Indices of <iframe> elements, outermost first; () is the top-level document
+FramePath = tuple[int, ...]
+# How many iframe levels find_in_frames descends: top-level iframes and one nested level
+FRAME_DEPTH = 2
+IFRAME = (By.TAG_NAME, "iframe")
+
+
+def fast_fill_enabled() -> bool:
+    """FAST_FILL=true: fill inputs via native setter + input/change events instead of keystrokes."""
+    return os.getenv("FAST_FILL", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class LocatorMatch:
+    """Result of BasePage.resolve: which candidate won and the elements it matched."""
+    index: int
+    locator: Locator
+    elements: list
+
+    @property
+    def element(self):
+        return self.elements[0]
+
+
+@dataclass
+class ElementInfo:
+    """One element as seen by BasePage.read_all."""
+    text: str  # rendered text (innerText), '' for hidden elements
+    content: str  # textContent, includes hidden text
+    attrs: dict
+    visible: bool
+    enabled: bool
+    element: object = None  # WebElement, only with elements=True
+
+    @property
+    def label(self) -> str:
+        """Rendered text, falling back to textContent."""
+        return self.text or self.content
 
 
 @dataclass
@@ -32,28 +85,234 @@ class BasePage:
         return el
 
     def type(self, by: By, value: str, text: str, clear: bool = True, timeout: int = DEFAULT_TIMEOUT):
+        if clear and fast_fill_enabled():
+            return self.fill([((by, value), text)], timeout)[0]
         el = self.wait_visible(by, value, timeout)
         if clear:
             el.clear()
         el.send_keys(text)
         return el
 
+    def fill(self, fields: Sequence[tuple], timeout: float = DEFAULT_TIMEOUT, fast: Optional[bool] = None) -> list:
+        """Set several inputs, given as (locator or WebElement, text) pairs; returns the elements.
+
+        Fast mode (FAST_FILL, or ``fast``) waits for all located fields with one push-based
+        wait and sets every value in one script call; fields whose value did not stick
+        are retyped with clear() + send_keys(). Otherwise each field is typed as before.
+        """
+        fast = fast_fill_enabled() if fast is None else fast
+        if not fast:
+            return [self._send_keys(target, text, timeout) for target, text in fields]
+        locators = [target for target, _ in fields if isinstance(target, tuple)]
+        if locators:
+            self.wait_until(dom_wait.all_of(*(dom_wait.visible(loc) for loc in locators)), timeout)
+        payload = [[to_js_locator(*t) if isinstance(t, tuple) else t, text] for t, text in fields]
+        done = self.driver.execute_script(FILL_JS, payload)
+        elements = []
+        for (target, text), (el, ok) in zip(fields, done):
+            elements.append(el if ok else self._send_keys(el or target, text, timeout))
+        return elements
+
+    def _send_keys(self, target, text: str, timeout: float = DEFAULT_TIMEOUT):
+        el = self.wait_visible(*target, timeout) if isinstance(target, tuple) else target
+        el.clear()
+        el.send_keys(text)
+        return el
+
     def get_text(self, by: By, value: str, timeout: int = DEFAULT_TIMEOUT) -> str:
         el = self.wait_visible(by, value, timeout)
         return el.text.strip()
 
+    def read_all(self, target, attrs: Sequence[str] = (), root=None, elements: bool = False) -> list[ElementInfo]:
+        """Text, ``attrs`` and visibility of every element matching locator ``target`` (or of the
+        WebElement ``target``) in one execute_script round trip; ``root`` scopes the search."""
+        loc = to_js_locator(*target) if isinstance(target, tuple) else target
+        rows = self.driver.execute_script(READ_JS, loc, list(attrs), root, elements) or []
+        return [ElementInfo(**row) for row in rows]
+
     def exists(self, by: By, value: str, timeout: int = 3) -> bool:
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-            return True
+            return self.wait_until(present((by, value)), timeout)
         except Exception:
             return False
 
     def url_contains(self, fragment: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
         try:
-            WebDriverWait(self.driver, timeout).until(EC.url_contains(fragment))
-            return True
+            return self.wait_until(url_contains(fragment), timeout)
         except Exception:
             return False
+
+    def wait_until(self, cond: Cond, timeout: float = DEFAULT_TIMEOUT, message: str = "") -> bool:
+        """Push-based wait (MutationObserver in the page); raises TimeoutException."""
+        return wait_for(self.driver, cond, timeout, message)
+
+    def holds(self, cond: Cond) -> bool:
+        return holds(self.driver, cond)
+
+    def navigate(self, url: str, ready: Optional[Cond] = None, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Open ``url`` and wait until the app is usable (see pages.readiness; raises TimeoutException).
+
+        Under the 'none' load strategy driver.get() may return while the old document is
+        still current, so the old document is marked first and the wait requires it gone.
+        """
+        cond = app_ready(ready)
+        if self.driver.capabilities.get("pageLoadStrategy") == "none":
+            try:
+                self.driver.execute_script("window.__navPending = true;")
+                cond = fresh_document("__navPending") & cond
+            except Exception:
+                pass
+        self.driver.get(url)
+        self.wait_until(cond, timeout, f"{url} not ready within {timeout}s")
+
+    def performance(self, step: str = ""):
+        """PerfSample of this page since the previous sample (see core.perf_metrics); the runner
+        also samples at every step boundary, so a call here splits that step's numbers."""
+        return perf_metrics.collect(self.driver, step, type(self).__name__)
+
+    def _cache_scope(self, name: str):
+        return get_locator_cache(), detect_app_build(self.driver), f"{type(self).__name__}.{name}"
+
+    def resolve(self, candidates: Union[str, Sequence[Locator]], visible: bool = True, enabled: bool = True,
+                all_matches: bool = False) -> Optional[LocatorMatch]:
+        """Resolve a whole candidate list (CSS and XPath) in one execute_script round trip.
+
+        Returns the first candidate with a matching element that passes the visible/enabled
+        filters (all such elements if ``all_matches``), or None. When ``candidates`` is the
+        name of a ``*_CANDIDATES`` attribute, order and stats go through the locator cache.
+        """
+        match, ordered = self._lookup(candidates, visible, enabled, all_matches)
+        self._record_lookup(candidates, ordered, match)
+        return match
+
+    def _lookup(self, candidates, visible: bool, enabled: bool, all_matches: bool):
+        """One RESOLVE_JS round trip over the (cache-ordered) candidates; does not touch the stats."""
+        if isinstance(candidates, str):
+            cache, build, key = self._cache_scope(candidates)
+            ordered = cache.ordered(build, key, getattr(self, candidates))
+        else:
+            ordered = list(candidates)
+        res = self.driver.execute_script(
+            RESOLVE_JS,
+            [to_js_locator(by, value) for by, value in ordered],
+            {"visible": visible, "enabled": enabled, "all": all_matches},
+        )
+        match = LocatorMatch(res[0], ordered[res[0]], list(res[1])) if res else None
+        return match, ordered
+
+    def _record_lookup(self, candidates, ordered: list, match: Optional[LocatorMatch]) -> None:
+        if not isinstance(candidates, str):
+            return
+        cache, build, key = self._cache_scope(candidates)
+        if match is not None:
+            cache.record(build, key, ordered[: match.index + 1], match.locator)
+        else:
+            cache.record(build, key, ordered, None)
+
+    def wait_resolve(self, candidates: Union[str, Sequence[Locator]], timeout: float = DEFAULT_TIMEOUT,
+                     visible: bool = True, enabled: bool = True, all_matches: bool = False) -> LocatorMatch:
+        """resolve(), waiting up to ``timeout`` for some candidate to match; raises TimeoutException.
+
+        Resolves immediately when possible; otherwise waits push-based in the page
+        (one round trip) and resolves again. ``timeout=0`` means a single attempt. Only the
+        final outcome goes into the locator cache stats, so a slow render is not a miss.
+        """
+        match, ordered = self._lookup(candidates, visible, enabled, all_matches)
+        if match is None and timeout > 0:
+            locs = getattr(self, candidates) if isinstance(candidates, str) else candidates
+            try:
+                self.wait_until(any_candidate(locs, visible, enabled), timeout)
+            except TimeoutException:
+                self._record_lookup(candidates, ordered, None)
+                raise
+            match, ordered = self._lookup(candidates, visible, enabled, all_matches)
+        self._record_lookup(candidates, ordered, match)
+        if match is None:
+            # timeout=0, or matched in the wait but gone again (re-render)
+            raise TimeoutException(f"No candidate matched: {candidates}")
+        return match
+
+    def probe(self, candidates: Union[str, Sequence[Locator]], timeout: float = PROBE_TIMEOUT,
+              **kwargs) -> Optional[LocatorMatch]:
+        """wait_resolve() for optional elements: None instead of TimeoutException."""
+        try:
+            return self.wait_resolve(candidates, timeout, **kwargs)
+        except TimeoutException:
+            return None
+
+    def _frame_paths(self) -> dict:
+        """Per-driver memo of where frame-aware lookups last matched (pages share it)."""
+        paths = getattr(self.driver, "_frame_paths", None)
+        if paths is None:
+            paths = {}
+            try:
+                self.driver._frame_paths = paths
+            except AttributeError:
+                pass
+        return paths
+
+    def _first(self, locator: Locator):
+        # Single round trip without the implicit wait; None when nothing matches
+        match = self.resolve([locator], visible=False, enabled=False)
+        return match.element if match else None
+
+    def _iframes(self) -> list:
+        match = self.resolve([IFRAME], visible=False, enabled=False, all_matches=True)
+        return match.elements if match else []
+
+    def switch_to_frame_path(self, path: FramePath) -> bool:
+        """Switch from the top-level document along ``path``; False (and left at top level) if it no longer exists."""
+        self.driver.switch_to.default_content()
+        for index in path:
+            frames = self._iframes()
+            if index >= len(frames):
+                self.driver.switch_to.default_content()
+                return False
+            try:
+                self.driver.switch_to.frame(frames[index])
+            except WebDriverException:
+                self.driver.switch_to.default_content()
+                return False
+        return True
+
+    def _scan_frames(self, locator: Locator, path: FramePath, depth: int):
+        el = self._first(locator)
+        if el is not None:
+            return path, el
+        if depth <= 0:
+            return None
+        for index, frame in enumerate(self._iframes()):
+            try:
+                self.driver.switch_to.frame(frame)
+            except WebDriverException:
+                continue
+            found = self._scan_frames(locator, path + (index,), depth - 1)
+            if found is not None:
+                return found  # stay in the frame that holds the element
+            self.driver.switch_to.parent_frame()
+        return None
+
+    def find_in_frames(self, locator: Locator, key: Optional[str] = None, depth: int = FRAME_DEPTH):
+        """First element matching ``locator`` in the top-level document or in iframes up to ``depth`` levels.
+
+        On a match the driver is left switched into the frame that holds the element (call
+        driver.switch_to.default_content() when done); otherwise it is back at top level and
+        None is returned. The frame path is remembered per driver under ``key`` (default:
+        page class + locator) and tried first next time, so a hit costs a switch per level and
+        one lookup; the full scan only runs when the element is no longer there.
+        """
+        key = f"{type(self).__name__}.{key or '|'.join(locator)}"
+        paths = self._frame_paths()
+        cached = paths.get(key)
+        if cached is not None and self.switch_to_frame_path(cached):
+            el = self._first(locator)
+            if el is not None:
+                return el
+        self.driver.switch_to.default_content()
+        found = self._scan_frames(locator, (), depth)
+        if found is None:
+            self.driver.switch_to.default_content()
+            paths.pop(key, None)
+            return None
+        paths[key] = found[0]
+        return found[1]
@@ -0,0 +1,126 @@
+"""JavaScript snippets shared by page-object helpers that run logic inside the browser."""
+from __future__ import annotations
+
+from selenium.webdriver.common.by import By
+
+
+# Helpers prepended to scripts: locator lookup (css/xpath) and visibility/enabled
+# checks close to WebDriver's isDisplayed/isEnabled.
+HELPERS_JS = r"""
+function __find(by, sel, root) {
+  root = root || document;
+  if (by === 'xpath') {
+    var snap = document.evaluate(sel, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var out = [];
+    for (var i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+    return out;
+  }
+  return Array.prototype.slice.call(root.querySelectorAll(sel));
+}
+function __visible(el) {
+  if (!el || !el.isConnected) return false;
+  if (el.checkVisibility) {
+    if (!el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true})) return false;
+  } else {
+    var st = window.getComputedStyle(el);
+    if (st.display === 'none' || st.visibility === 'hidden' || st.opacity === '0') return false;
+  }
+  return el.getClientRects().length > 0;
+}
+function __enabled(el) {
+  return !el.disabled && !(el.closest && el.closest('fieldset[disabled]'));
+}
+"""
+
+
+RESOLVE_JS = HELPERS_JS + r"""
+var cands = arguments[0], opts = arguments[1];
+for (var i = 0; i < cands.length; i++) {
+  var els;
+  try { els = __find(cands[i][0], cands[i][1]); } catch (e) { continue; }
+  var ok = els.filter(function (el) {
+    return (!opts.visible || __visible(el)) && (!opts.enabled || __enabled(el));
+  });
+  if (ok.length) return [i, opts.all ? ok : [ok[0]]];
+}
+return null;
+"""
+
+# Bulk reader: text, chosen attributes and visibility of every match (or of one element)
+READ_JS = HELPERS_JS + r"""
+var target = arguments[0], attrs = arguments[1], root = arguments[2], withEl = arguments[3];
+var els = Array.isArray(target) ? __find(target[0], target[1], root || document) : [target];
+return els.map(function (el) {
+  var a = {};
+  attrs.forEach(function (name) { a[name] = el.getAttribute(name); });
+  var info = {
+    text: (el.innerText || '').trim(),
+    content: (el.textContent || '').trim(),
+    attrs: a,
+    visible: __visible(el),
+    enabled: __enabled(el)
+  };
+  if (withEl) info.element = el;
+  return info;
+});
+"""
+
+
+# Fast fill: set values through the prototype's native setter (so React/Vue value
+# tracking sees the change) and dispatch input/change. One call per form; returns
+# [element|null, ok] per field, ok=false when the value did not stick (masks,
+# keystroke-driven widgets) so the caller can fall back to send_keys.
+FILL_JS = HELPERS_JS + r"""
+var fields = arguments[0];
+function __proto(el) {
+  if (el instanceof HTMLTextAreaElement) return HTMLTextAreaElement.prototype;
+  if (el instanceof HTMLSelectElement) return HTMLSelectElement.prototype;
+  if (el instanceof HTMLInputElement) return HTMLInputElement.prototype;
+  return null;
+}
+return fields.map(function (f) {
+  var el = f[0], value = f[1];
+  if (Array.isArray(el)) el = __find(el[0], el[1]).filter(__visible)[0] || null;
+  var proto = el && __proto(el);
+  if (!proto || el.readOnly || !__enabled(el)) return [el, false];
+  el.focus();
+  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+  el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: value}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  return [el, el.value === value];
+});
+"""
+
+
+def css_quote(value: str) -> str:
+    """Double-quoted CSS attribute value, e.g. for [id="..."]."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def xpath_literal(value: str) -> str:
+    """XPath string literal for any text, via concat() when it holds both quote kinds."""
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    parts = value.split('"')
+    return "concat(" + ", '\"', ".join(f'"{p}"' for p in parts) + ")"
+
+
+def to_js_locator(by: str, value: str) -> list[str]:
+    """Normalize a Selenium locator to ['css selector'|'xpath', value] for __find."""
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return [by, value]
+    if by == By.ID:
+        return [By.CSS_SELECTOR, f"[id={css_quote(value)}]"]
+    if by == By.NAME:
+        return [By.CSS_SELECTOR, f"[name={css_quote(value)}]"]
+    if by == By.CLASS_NAME:
+        return [By.CSS_SELECTOR, f".{value}"]
+    if by == By.TAG_NAME:
+        return [By.CSS_SELECTOR, value]
+    if by == By.LINK_TEXT:
+        return [By.XPATH, f"//a[normalize-space(.)={xpath_literal(value)}]"]
+    if by == By.PARTIAL_LINK_TEXT:
+        return [By.XPATH, f"//a[contains(., {xpath_literal(value)})]"]
+    raise ValueError(f"Unsupported locator strategy: {by}")
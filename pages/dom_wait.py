@@ -0,0 +1,210 @@
+"""
+Push-based waits: conditions are built in Python as small specs, evaluated in the
+browser and re-checked on every DOM mutation via MutationObserver, so a wait
+returns as soon as the page changes and costs a single round trip.
+
+    from pages.dom_wait import enabled, present, wait_for
+    wait_for(driver, ~enabled(EmailPage.NEXT_BTN) | present(EmailPage.ERROR_TEXT), timeout=2)
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from .dom_js import HELPERS_JS, to_js_locator
+
+
+DEFAULT_TIMEOUT = 10
+
+# Condition evaluator (__check); other in-browser drivers such as pages.validation build on it
+EVAL_JS = HELPERS_JS + r"""
+function __first(s) {
+  var els, i;
+  switch (s.op) {
+    case 'present':
+      return __find(s.loc[0], s.loc[1])[0] || null;
+    case 'visible':
+      return __find(s.loc[0], s.loc[1]).filter(__visible)[0] || null;
+    case 'enabled':
+      els = __find(s.loc[0], s.loc[1]);
+      if (s.visible) els = els.filter(__visible);
+      var el = els[0];
+      if (!el || !__enabled(el)) return null;
+      if (s.cls && String(el.getAttribute('class') || '').indexOf(s.cls) >= 0) return null;
+      return el;
+    case 'candidates':
+      for (i = 0; i < s.locs.length; i++) {
+        try { els = __find(s.locs[i][0], s.locs[i][1]); } catch (e) { continue; }
+        els = els.filter(function (el) {
+          return (!s.visible || __visible(el)) && (!s.enabled || __enabled(el));
+        });
+        if (els.length) return els[0];
+      }
+      return null;
+  }
+  throw new Error('not an element condition: ' + s.op);
+}
+function __eval(s) {
+  var el;
+  switch (s.op) {
+    case 'any': return s.of.some(__eval);
+    case 'all': return s.of.every(__eval);
+    case 'not': return !__eval(s.of);
+    case 'url': return window.location.href.indexOf(s.text) >= 0;
+    case 'ready': return s.states.indexOf(document.readyState) >= 0;
+    case 'fresh': return !window[s.key];
+    case 'idle':
+      // no new Resource Timing entries for quietMs (state lives on the document's window)
+      var n = performance.getEntriesByType('resource').length, now = Date.now();
+      var st = window.__domWaitIdle;
+      if (!st || st.n !== n) st = window.__domWaitIdle = {n: n, since: now};
+      return document.readyState !== 'loading' && now - st.since >= s.quietMs;
+    case 'attr': el = __first(s.of); return !!el && el.getAttribute(s.name) === s.value;
+    case 'text': el = __first(s.of); return !!el && (el.textContent || '').indexOf(s.text) >= 0;
+    default: return !!__first(s);
+  }
+}
+function __check(spec) {
+  try { return __eval(spec); } catch (e) { return false; }
+}
+"""
+
+CHECK_JS = EVAL_JS + "return __check(arguments[0]);"
+
+WAIT_JS = EVAL_JS + r"""
+var spec = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+if (__check(spec)) { done(true); return; }
+var finished = false, observer, timer, poll;
+function finish(value) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  clearInterval(poll);
+  document.removeEventListener('transitionend', onChange, true);
+  document.removeEventListener('animationend', onChange, true);
+  done(value);
+}
+function onChange() { if (__check(spec)) finish(true); }
+observer = new MutationObserver(onChange);
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+// CSS transitions and history.pushState do not always mutate the DOM
+document.addEventListener('transitionend', onChange, true);
+document.addEventListener('animationend', onChange, true);
+poll = setInterval(onChange, 250);
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+"""
+
+
+@dataclass(frozen=True)
+class Cond:
+    """A browser-side wait condition. Combine with ``|`` (any), ``&`` (all) and ``~`` (not)."""
+    spec: dict
+
+    def __or__(self, other: "Cond") -> "Cond":
+        return any_of(self, other)
+
+    def __and__(self, other: "Cond") -> "Cond":
+        return all_of(self, other)
+
+    def __invert__(self) -> "Cond":
+        return Cond({"op": "not", "of": self.spec})
+
+
+def present(locator: tuple[str, str]) -> Cond:
+    return Cond({"op": "present", "loc": to_js_locator(*locator)})
+
+
+def visible(locator: tuple[str, str]) -> Cond:
+    return Cond({"op": "visible", "loc": to_js_locator(*locator)})
+
+
+def enabled(locator: tuple[str, str], visible: bool = True, disabled_class: str | None = None) -> Cond:
+    """First (visible) match is enabled and, if given, has no ``disabled_class`` in its class attribute."""
+    return Cond({"op": "enabled", "loc": to_js_locator(*locator), "visible": visible, "cls": disabled_class})
+
+
+def any_candidate(candidates: Sequence[tuple[str, str]], visible: bool = True, enabled: bool = True) -> Cond:
+    """Some candidate has an element passing the visible/enabled filters (see BasePage.resolve)."""
+    return Cond({"op": "candidates", "locs": [to_js_locator(*c) for c in candidates],
+                 "visible": visible, "enabled": enabled})
+
+
+def url_contains(fragment: str) -> Cond:
+    return Cond({"op": "url", "text": fragment})
+
+
+def attr_equals(element: Cond, name: str, value: str) -> Cond:
+    return Cond({"op": "attr", "of": element.spec, "name": name, "value": value})
+
+
+def text_contains(element: Cond, text: str) -> Cond:
+    return Cond({"op": "text", "of": element.spec, "text": text})
+
+
+def document_ready(state: str = "interactive") -> Cond:
+    """document.readyState has reached ``state`` ('interactive' or 'complete')."""
+    states = ["interactive", "complete"] if state == "interactive" else ["complete"]
+    return Cond({"op": "ready", "states": states})
+
+
+def fresh_document(key: str) -> Cond:
+    """The window no longer has the marker ``key`` set on the previous document (navigation happened)."""
+    return Cond({"op": "fresh", "key": key})
+
+
+def network_idle(quiet_ms: int = 500) -> Cond:
+    """No new resource requests for ``quiet_ms``; re-checked at least every 250ms while waiting."""
+    return Cond({"op": "idle", "quietMs": quiet_ms})
+
+
+def any_of(*conds: Cond) -> Cond:
+    return Cond({"op": "any", "of": [c.spec for c in conds]})
+
+
+def all_of(*conds: Cond) -> Cond:
+    return Cond({"op": "all", "of": [c.spec for c in conds]})
+
+
+def holds(driver, cond: Cond) -> bool:
+    """Evaluate a condition once, in one round trip."""
+    return bool(driver.execute_script(CHECK_JS, cond.spec))
+
+
+def ensure_script_timeout(driver, seconds: float) -> None:
+    """Raise the async script timeout to cover a ``seconds``-long browser-side wait (memoized per driver)."""
+    needed = max(30.0, seconds + 5)
+    if getattr(driver, "_dom_wait_script_timeout", 0) < needed:
+        driver.set_script_timeout(needed)
+        try:
+            driver._dom_wait_script_timeout = needed
+        except AttributeError:
+            pass
+
+
+def _is_navigation_error(e: WebDriverException) -> bool:
+    msg = (e.msg or str(e)).lower()
+    return "unload" in msg or "navigat" in msg or "context was destroyed" in msg
+
+
+def wait_for(driver, cond: Cond, timeout: float = DEFAULT_TIMEOUT, message: str = "") -> bool:
+    """Block until ``cond`` holds in the current frame; raise TimeoutException after ``timeout`` seconds.
+
+    If the page navigates mid-wait the observer dies with the document, so the wait
+    is re-armed in the new document for the remaining time.
+    """
+    deadline = time.monotonic() + timeout
+    ensure_script_timeout(driver, timeout)
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            if driver.execute_async_script(WAIT_JS, cond.spec, max(0, int(remaining * 1000))):
+                return True
+            break
+        except WebDriverException as e:
+            if not _is_navigation_error(e) or deadline - time.monotonic() <= 0:
+                raise
+    raise TimeoutException(message or f"Condition not met within {timeout}s: {cond.spec}")
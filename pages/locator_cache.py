@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import multiprocessing.util
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+Locator = tuple[str, str]
+
+_BUILD_JS = """
+var urls = [];
+document.querySelectorAll('script[src], link[rel=stylesheet][href]').forEach(function (el) {
+  urls.push(el.getAttribute('src') || el.getAttribute('href'));
+});
+return urls.sort();
+"""
+
+
+def detect_app_build(driver) -> str:
+    """
+    Identify the deployed front-end build.
+
+    APP_BUILD env wins; otherwise hash the bundle URLs of the current page
+    (SPA bundles are content-hashed, so the set changes on every deploy).
+    Memoized per driver once a page with bundles has been seen.
+    """
+    env = os.getenv("APP_BUILD")
+    if env:
+        return env
+    build = getattr(driver, "_app_build", None)
+    if build:
+        return build
+    try:
+        urls = driver.execute_script(_BUILD_JS) or []
+    except Exception:
+        urls = []
+    if not urls:
+        return "unknown"
+    build = hashlib.sha1("\n".join(urls).encode("utf-8")).hexdigest()[:12]
+    try:
+        driver._app_build = build
+    except AttributeError:
+        pass
+    return build
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock on ``<path>.lock`` across processes (blocks until acquired)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f"{path.name}.lock"), "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _loc_id(loc: Locator) -> str:
+    return f"{loc[0]}|{loc[1]}"
+
+
+class LocatorCache:
+    """
+    Persistent memory of which candidate locator matched, per page and app build.
+
+    File layout (JSON):
+      {build: {"Page.CANDIDATES": {"winner": "by|sel", "hits": n, "misses": n,
+                                   "candidates": {"by|sel": {"hits": n, "misses": n}}}}}
+
+    Counters are kept as deltas in memory and merged into the file on flush under an
+    exclusive file lock, so parallel workers sharing one file add up instead of
+    overwriting each other.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or os.getenv("LOCATOR_CACHE", ".locator_cache.json"))
+        self._lock = threading.Lock()
+        self._data = self._read()
+        self._delta: dict = {}
+        self._dirty = False
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _entry(self, data: dict, build: str, key: str) -> dict:
+        return data.setdefault(build, {}).setdefault(key, {"winner": None, "hits": 0, "misses": 0, "candidates": {}})
+
+    def winner(self, build: str, key: str) -> str | None:
+        return self._data.get(build, {}).get(key, {}).get("winner")
+
+    def ordered(self, build: str, key: str, candidates: Sequence[Locator]) -> list[Locator]:
+        """Candidates with the last winner first, the rest in their declared order."""
+        win = self.winner(build, key)
+        cands = list(candidates)
+        for i, loc in enumerate(cands):
+            if _loc_id(loc) == win:
+                return [loc] + cands[:i] + cands[i + 1:]
+        return cands
+
+    def record(self, build: str, key: str, tried: Sequence[Locator], matched: Locator | None) -> None:
+        """Record one lookup: every tried candidate gets a hit or miss; the key a cache hit or miss."""
+        with self._lock:
+            learned = self.winner(build, key)
+            for data in (self._data, self._delta):
+                entry = self._entry(data, build, key)
+                for loc in tried:
+                    c = entry["candidates"].setdefault(_loc_id(loc), {"hits": 0, "misses": 0})
+                    c["hits" if loc == matched else "misses"] += 1
+                if matched is not None:
+                    entry["hits" if _loc_id(matched) == learned else "misses"] += 1
+                    entry["winner"] = _loc_id(matched)
+            self._dirty = True
+            changed = matched is not None and _loc_id(matched) != learned
+        if changed:
+            self.flush()
+
+    def stats(self) -> dict:
+        """Everything known so far (file contents plus this process), for reporting/pruning."""
+        with self._lock:
+            return json.loads(json.dumps(self._data))
+
+    def flush(self) -> None:
+        """Merge in-memory deltas into the file (locked read-merge-write, atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                with _file_lock(self.path):
+                    merged = self._read()
+                    for build, keys in self._delta.items():
+                        for key, d in keys.items():
+                            entry = self._entry(merged, build, key)
+                            entry["hits"] += d["hits"]
+                            entry["misses"] += d["misses"]
+                            if d["winner"]:
+                                entry["winner"] = d["winner"]
+                            for cid, c in d["candidates"].items():
+                                mc = entry["candidates"].setdefault(cid, {"hits": 0, "misses": 0})
+                                mc["hits"] += c["hits"]
+                                mc["misses"] += c["misses"]
+                    tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                    tmp.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+                    os.replace(tmp, self.path)
+            except OSError:
+                return
+            self._data = merged
+            self._delta = {}
+            self._dirty = False
+
+
+_cache: LocatorCache | None = None
+
+
+def get_locator_cache() -> LocatorCache:
+    """Process-wide cache instance, flushed at interpreter and worker-process exit."""
+    global _cache
+    if _cache is None:
+        _cache = LocatorCache()
+        atexit.register(_cache.flush)
+        # atexit does not run in multiprocessing workers; their finalizers do
+        multiprocessing.util.Finalize(_cache, _cache.flush, exitpriority=10)
+    return _cache
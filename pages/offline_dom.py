@@ -0,0 +1,779 @@
+"""
+Pure-Python DOM for checking locators against saved HTML, no browser involved.
+
+Parses page_source snapshots with html.parser and evaluates the locator subset the
+page objects use: CSS (type/#id/.class/[attr op value], :not/:first-child/:last-child/
+:nth-child, all four combinators, groups) and XPath 1.0 (all axes except namespace,
+predicates, and the core string/number/boolean functions).
+
+    doc = parse_html(html)
+    elements = find(doc, (By.CSS_SELECTOR, "input#email-input"))
+
+Matches include hidden elements: visibility needs layout, which a snapshot does not have.
+Unsupported syntax raises SelectorError.
+"""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+from .dom_js import to_js_locator
+
+
+class SelectorError(ValueError):
+    """Locator syntax the offline evaluator does not understand."""
+
+
+VOID_TAGS = frozenset(
+    "area base br col embed hr img input keygen link meta param source track wbr".split()
+)
+
+
+class Node:
+    """Element, text or attribute node. ``tag`` is '#document', '#text' or '@name' for non-elements."""
+    __slots__ = ("tag", "attrs", "parent", "children", "data", "order", "_text", "_attr_nodes")
+
+    def __init__(self, tag: str, attrs: dict | None = None, parent: "Node | None" = None, data: str = ""):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children: list[Node] = []
+        self.data = data
+        self.order: tuple = (0, 0)
+        self._text: str | None = None
+        self._attr_nodes: list[Node] | None = None
+
+    @property
+    def is_element(self) -> bool:
+        return self.tag[0] not in "#@"
+
+    def elements(self) -> list["Node"]:
+        return [c for c in self.children if c.is_element]
+
+    def iter(self):
+        """This node and its descendants in document order (no attribute nodes)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def text(self) -> str:
+        """XPath string-value: concatenated descendant text (memoized; the tree is immutable)."""
+        if self._text is None:
+            if self.tag == "#text" or self.tag[0] == "@":
+                self._text = self.data
+            else:
+                self._text = "".join(n.data for n in self.iter() if n.tag == "#text")
+        return self._text
+
+    def attr_nodes(self) -> list["Node"]:
+        if self._attr_nodes is None:
+            self._attr_nodes = []
+            for i, (name, value) in enumerate(self.attrs.items()):
+                attr = Node("@" + name, parent=self, data=value)
+                attr.order = (self.order[0], i + 1)
+                self._attr_nodes.append(attr)
+        return self._attr_nodes
+
+    def __repr__(self) -> str:
+        if self.tag == "#text":
+            return f"#text({self.data[:20]!r})"
+        attrs = "".join(f" {k}={v!r}" for k, v in list(self.attrs.items())[:3])
+        return f"<{self.tag}{attrs}>"
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {k: v or "" for k, v in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {k: v or "" for k, v in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element; stray end tags are ignored
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        parent = self.stack[-1]
+        if parent.children and parent.children[-1].tag == "#text":
+            parent.children[-1].data += data
+        else:
+            parent.children.append(Node("#text", parent=parent, data=data))
+
+
+def parse_html(html: str) -> Node:
+    """Parse HTML into a Node tree rooted at a '#document' node."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    for i, node in enumerate(builder.root.iter()):
+        node.order = (i, 0)
+    return builder.root
+
+
+# ---------------------------------------------------------------------------------------------
+# CSS
+
+_CSS_TOKEN = re.compile(r"""
+    \s*(?P<comb>[>+~,])\s*
+  | (?P<ws>\s+)
+  | (?P<type>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*
+        (?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*(?P<flag>[iIsS])?\s*)?\]
+  | :(?P<pseudo>[\w-]+)(?:\((?P<arg>[^()]*)\))?
+""", re.X)
+
+
+@dataclass
+class _Compound:
+    tag: str | None = None
+    ids: list = field(default_factory=list)
+    classes: list = field(default_factory=list)
+    attrs: list = field(default_factory=list)  # (name, op, value, ignore_case)
+    pseudos: list = field(default_factory=list)  # (name, arg)
+
+
+def _attr_matches(actual: str | None, op: str | None, value: str, ignore_case: bool) -> bool:
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if ignore_case:
+        actual, value = actual.lower(), value.lower()
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    if not value:
+        return False
+    if op == "^=":
+        return actual.startswith(value)
+    if op == "$=":
+        return actual.endswith(value)
+    return value in actual  # *=
+
+
+def _nth(arg: str, index: int) -> bool:
+    arg = arg.replace(" ", "").lower()
+    if arg == "odd":
+        arg = "2n+1"
+    elif arg == "even":
+        arg = "2n"
+    m = re.fullmatch(r"([+-]?\d*)n([+-]\d+)?|([+-]?\d+)", arg)
+    if not m:
+        raise SelectorError(f"unsupported :nth-child({arg})")
+    if m.group(3) is not None:
+        return index == int(m.group(3))
+    a = int(m.group(1) + "1" if m.group(1) in ("", "+", "-") else m.group(1))
+    b = int(m.group(2) or 0)
+    return index == b if a == 0 else (index - b) % a == 0 and (index - b) // a >= 0
+
+
+def _compound_matches(c: _Compound, el: Node) -> bool:
+    if c.tag and c.tag != "*" and el.tag != c.tag.lower():
+        return False
+    if any(el.attrs.get("id") != i for i in c.ids):
+        return False
+    if c.classes:
+        have = el.attrs.get("class", "").split()
+        if any(cls not in have for cls in c.classes):
+            return False
+    for name, op, value, ignore_case in c.attrs:
+        if not _attr_matches(el.attrs.get(name.lower()), op, value, ignore_case):
+            return False
+    for name, arg in c.pseudos:
+        if name == "not":
+            if any(_complex_matches(sel, el, len(sel[0]) - 1) for sel in arg):
+                return False
+            continue
+        siblings = el.parent.elements() if el.parent is not None else [el]
+        index = next(i for i, s in enumerate(siblings) if s is el) + 1
+        if name == "first-child" and index != 1:
+            return False
+        if name == "last-child" and index != len(siblings):
+            return False
+        if name == "only-child" and len(siblings) != 1:
+            return False
+        if name == "nth-child" and not _nth(arg, index):
+            return False
+        if name == "nth-last-child" and not _nth(arg, len(siblings) - index + 1):
+            return False
+    return True
+
+
+def _complex_matches(sel, el: Node, k: int) -> bool:
+    compounds, combs = sel
+    if not el.is_element or not _compound_matches(compounds[k], el):
+        return False
+    if k == 0:
+        return True
+    comb = combs[k]
+    if comb == ">":
+        return el.parent is not None and _complex_matches(sel, el.parent, k - 1)
+    if comb == " ":
+        node = el.parent
+        while node is not None:
+            if _complex_matches(sel, node, k - 1):
+                return True
+            node = node.parent
+        return False
+    siblings = el.parent.elements() if el.parent is not None else []
+    before = siblings[:next((i for i, s in enumerate(siblings) if s is el), 0)]
+    if comb == "+":
+        return bool(before) and _complex_matches(sel, before[-1], k - 1)
+    return any(_complex_matches(sel, s, k - 1) for s in before)  # ~
+
+
+_PSEUDOS = {"not", "first-child", "last-child", "only-child", "nth-child", "nth-last-child"}
+
+
+def compile_css(selector: str) -> list:
+    """Parse a selector group into [(compounds, combinators)]; combinators[k] joins k-1 and k."""
+    groups, compounds, combs = [], [_Compound()], [None]
+    text, pos = selector.strip(), 0
+    fresh = True  # current compound has no parts yet
+    while pos < len(text):
+        m = _CSS_TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise SelectorError(f"unsupported CSS at {text[pos:]!r}")
+        pos = m.end()
+        if m.group("comb") or m.group("ws"):
+            comb = m.group("comb") or " "
+            if fresh:
+                raise SelectorError(f"dangling combinator in {selector!r}")
+            if comb == ",":
+                groups.append((compounds, combs))
+                compounds, combs = [_Compound()], [None]
+            else:
+                compounds.append(_Compound())
+                combs.append(comb)
+            fresh = True
+            continue
+        cur = compounds[-1]
+        if m.group("type"):
+            if not fresh:
+                raise SelectorError(f"type selector must come first in {selector!r}")
+            cur.tag = m.group("type")
+        elif m.group("id"):
+            cur.ids.append(m.group("id"))
+        elif m.group("cls"):
+            cur.classes.append(m.group("cls"))
+        elif m.group("attr"):
+            value = next((v for v in (m.group("dq"), m.group("sq"), m.group("bare")) if v is not None), "")
+            cur.attrs.append((m.group("attr"), m.group("op"), value, (m.group("flag") or "").lower() == "i"))
+        else:
+            name, arg = m.group("pseudo").lower(), m.group("arg")
+            if name not in _PSEUDOS:
+                raise SelectorError(f"unsupported pseudo-class :{name}")
+            if name == "not":
+                arg = compile_css(arg or "")
+            cur.pseudos.append((name, arg))
+        fresh = False
+    if fresh:
+        raise SelectorError(f"empty or dangling CSS selector {selector!r}")
+    groups.append((compounds, combs))
+    return groups
+
+
+def select_css(doc: Node, selector: str) -> list[Node]:
+    groups = compile_css(selector)
+    return [el for el in doc.iter()
+            if el.is_element and any(_complex_matches(g, el, len(g[0]) - 1) for g in groups)]
+
+
+# ---------------------------------------------------------------------------------------------
+# XPath 1.0
+
+_XP_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<str>"[^"]*"|'[^']*')
+  | (?P<num>\d+(?:\.\d*)?|\.\d+)
+  | (?P<op>//|::|\.\.|!=|<=|>=|[/()\[\],@|=<>+\-*.])
+  | (?P<name>[A-Za-z_][\w.\-]*(?::[A-Za-z_][\w.\-]*)?)
+""", re.X)
+
+_AXES = {
+    "ancestor", "ancestor-or-self", "attribute", "child", "descendant", "descendant-or-self",
+    "following", "following-sibling", "parent", "preceding", "preceding-sibling", "self",
+}
+_NODE_TYPES = {"node", "text", "comment", "processing-instruction"}
+_OPERATOR_NAMES = {"and", "or", "div", "mod"}
+_FUNCTIONS = {
+    "last", "position", "count", "string", "concat", "starts-with", "contains", "substring-before",
+    "substring-after", "substring", "string-length", "normalize-space", "translate", "boolean",
+    "not", "true", "false", "number", "sum", "floor", "ceiling", "round", "name", "local-name",
+}
+
+
+def _xp_tokens(expr: str) -> list[tuple[str, str]]:
+    tokens, pos = [], 0
+    while pos < len(expr):
+        m = _XP_TOKEN.match(expr, pos)
+        if not m:
+            raise SelectorError(f"unsupported XPath at {expr[pos:]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "ws":
+            continue
+        value = m.group(kind)
+        # XPath 3.7: '*' and and/or/div/mod are operators unless at the start or after an operator
+        prev = tokens[-1] if tokens else None
+        operator_context = prev is not None and not (
+            prev[0] == "op" and prev[1] in ("@", "::", "(", "[", ",", "/", "//", "|", "=", "!=", "<", ">",
+                                            "<=", ">=", "+", "-", "*")
+            or prev[0] == "opname"
+        )
+        if value == "*" and not operator_context:
+            kind = "name"
+        elif kind == "name" and value in _OPERATOR_NAMES and operator_context:
+            kind = "opname"
+        tokens.append((kind, value))
+    return tokens
+
+
+class _XPathParser:
+    def __init__(self, expr: str):
+        self.expr = expr
+        self.tokens = _xp_tokens(expr)
+        self.i = 0
+
+    def peek(self, offset: int = 0):
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else (None, None)
+
+    def take(self, value: str | None = None):
+        tok = self.peek()
+        if tok[0] is None or (value is not None and tok[1] != value):
+            raise SelectorError(f"expected {value or 'token'} in XPath {self.expr!r}")
+        self.i += 1
+        return tok
+
+    def at(self, *values: str) -> bool:
+        kind, value = self.peek()
+        return kind in ("op", "opname") and value in values
+
+    def parse(self):
+        node = self.binary(0)
+        if self.peek()[0] is not None:
+            raise SelectorError(f"unexpected {self.peek()[1]!r} in XPath {self.expr!r}")
+        return node
+
+    _LEVELS = [("or",), ("and",), ("=", "!="), ("<", ">", "<=", ">="), ("+", "-"), ("*", "div", "mod")]
+
+    def binary(self, level: int):
+        if level == len(self._LEVELS):
+            return self.unary()
+        node = self.binary(level + 1)
+        while self.at(*self._LEVELS[level]):
+            op = self.take()[1]
+            node = ("binop", op, node, self.binary(level + 1))
+        return node
+
+    def unary(self):
+        if self.at("-"):
+            self.take()
+            return ("neg", self.unary())
+        node = self.path_expr()
+        while self.at("|"):
+            self.take()
+            node = ("binop", "|", node, self.path_expr())
+        return node
+
+    def path_expr(self):
+        kind, value = self.peek()
+        is_primary = kind in ("str", "num") or (kind == "op" and value == "(") or (
+            kind == "name" and self.peek(1) == ("op", "(") and value not in _NODE_TYPES)
+        if not is_primary:
+            return self.location_path()
+        node = self.primary()
+        preds = self.predicates()
+        if preds:
+            node = ("filter", node, preds)
+        if self.at("/", "//"):
+            steps = self.relative_path()
+            node = ("path", node, steps)
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == "str":
+            return ("lit", value[1:-1])
+        if kind == "num":
+            return ("num", float(value))
+        if value == "(":
+            node = self.binary(0)
+            self.take(")")
+            return node
+        if value not in _FUNCTIONS:
+            raise SelectorError(f"unsupported XPath function {value}()")
+        self.take("(")
+        args = []
+        if not self.at(")"):
+            args.append(self.binary(0))
+            while self.at(","):
+                self.take()
+                args.append(self.binary(0))
+        self.take(")")
+        return ("fn", value, args)
+
+    def location_path(self):
+        if self.at("/"):
+            self.take()
+            kind, value = self.peek()
+            starts_step = kind == "name" or (kind == "op" and value in (".", "..", "@"))
+            return ("path", ("root",), self.relative_path(first=True) if starts_step else [])
+        if self.at("//"):
+            return ("path", ("root",), self.relative_path())
+        return ("path", None, self.relative_path(first=True))
+
+    def relative_path(self, first: bool = False):
+        steps = []
+        if first:
+            steps.append(self.step())
+        while self.at("/", "//"):
+            if self.take()[1] == "//":
+                steps.append(("descendant-or-self", ("node",), []))
+            steps.append(self.step())
+        return steps
+
+    def step(self):
+        if self.at("."):
+            self.take()
+            return ("self", ("node",), [])
+        if self.at(".."):
+            self.take()
+            return ("parent", ("node",), [])
+        axis = "child"
+        if self.at("@"):
+            self.take()
+            axis = "attribute"
+        elif self.peek()[0] == "name" and self.peek(1) == ("op", "::"):
+            axis = self.take()[1]
+            self.take("::")
+            if axis not in _AXES:
+                raise SelectorError(f"unsupported XPath axis {axis}")
+        kind, value = self.take()
+        if kind != "name":
+            raise SelectorError(f"expected node test, got {value!r} in XPath {self.expr!r}")
+        if value in _NODE_TYPES and self.peek() == ("op", "("):
+            self.take("(")
+            self.take(")")
+            test = (value,)
+        elif value == "*":
+            test = ("any",)
+        else:
+            test = ("name", value.lower())
+        return (axis, test, self.predicates())
+
+    def predicates(self):
+        preds = []
+        while self.at("["):
+            self.take()
+            preds.append(self.binary(0))
+            self.take("]")
+        return preds
+
+
+def compile_xpath(expr: str):
+    return _XPathParser(expr).parse()
+
+
+def _axis(node: Node, axis: str) -> list[Node]:
+    """Nodes on ``axis`` from ``node`` in axis order (reverse axes nearest first)."""
+    if axis == "child":
+        return node.children
+    if axis == "attribute":
+        return node.attr_nodes() if node.is_element else []
+    if axis == "self":
+        return [node]
+    if axis == "parent":
+        return [node.parent] if node.parent is not None else []
+    if axis in ("descendant", "descendant-or-self"):
+        nodes = list(node.iter())
+        return nodes if axis == "descendant-or-self" else nodes[1:]
+    if axis in ("ancestor", "ancestor-or-self"):
+        out, cur = ([node] if axis == "ancestor-or-self" else []), node.parent
+        while cur is not None:
+            out.append(cur)
+            cur = cur.parent
+        return out
+    if axis in ("following-sibling", "preceding-sibling"):
+        if node.parent is None or node.tag[0] == "@":
+            return []
+        siblings = node.parent.children
+        i = next(i for i, s in enumerate(siblings) if s is node)
+        return siblings[i + 1:] if axis == "following-sibling" else siblings[:i][::-1]
+    # following / preceding: document order minus ancestors/descendants
+    root = node
+    while root.parent is not None:
+        root = root.parent
+    everything = list(root.iter())
+    if axis == "following":
+        last = max((n.order for n in node.iter()), default=node.order)
+        return [n for n in everything if n.order > last]
+    ancestors = set(map(id, _axis(node, "ancestor")))
+    return [n for n in everything if n.order < node.order and id(n) not in ancestors][::-1]
+
+
+def _node_test(node: Node, test: tuple, axis: str) -> bool:
+    kind = test[0]
+    if kind == "node":
+        return True
+    if kind == "text":
+        return node.tag == "#text"
+    if kind in ("comment", "processing-instruction"):
+        return False  # not kept by the tree builder
+    if axis == "attribute":
+        return kind == "any" or node.tag[1:] == test[1]
+    if not node.is_element:
+        return False
+    return kind == "any" or node.tag == test[1]
+
+
+def _to_string(v) -> str:
+    if isinstance(v, list):
+        return v[0].text() if v else ""
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, float):
+        if math.isnan(v):
+            return "NaN"
+        if v == int(v):
+            return str(int(v))
+        return repr(v)
+    return v
+
+
+def _to_number(v) -> float:
+    if isinstance(v, bool):
+        return 1.0 if v else 0.0
+    if isinstance(v, float):
+        return v
+    try:
+        return float(_to_string(v).strip())
+    except ValueError:
+        return math.nan
+
+
+def _to_bool(v) -> bool:
+    if isinstance(v, float):
+        return v != 0 and not math.isnan(v)
+    return bool(v)
+
+
+_SWAP = {"<": ">", ">": "<", "<=": ">=", ">=": "<=", "=": "=", "!=": "!="}
+
+
+def _compare_atoms(op: str, a, b) -> bool:
+    if op in ("=", "!="):
+        if isinstance(a, bool) or isinstance(b, bool):
+            a, b = _to_bool(a), _to_bool(b)
+        elif isinstance(a, float) or isinstance(b, float):
+            a, b = _to_number(a), _to_number(b)
+        else:
+            a, b = _to_string(a), _to_string(b)
+        return (a == b) if op == "=" else (a != b)
+    a, b = _to_number(a), _to_number(b)
+    return {"<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b}[op]
+
+
+def _compare(op: str, a, b) -> bool:
+    if isinstance(a, list) and isinstance(b, list):
+        right = [y.text() for y in b]
+        return any(_compare_atoms(op, x.text(), y) for x in a for y in right)
+    if isinstance(b, list):
+        return _compare(_SWAP[op], b, a)
+    if isinstance(a, list):
+        if isinstance(b, bool):
+            return _compare_atoms(op, bool(a), b)
+        if isinstance(b, float):
+            return any(_compare_atoms(op, _to_number(x.text()), b) for x in a)
+        return any(_compare_atoms(op, x.text(), b) for x in a)
+    return _compare_atoms(op, a, b)
+
+
+def _doc_order(nodes) -> list[Node]:
+    unique = {id(n): n for n in nodes}
+    return sorted(unique.values(), key=lambda n: n.order)
+
+
+class _Context:
+    __slots__ = ("node", "position", "size")
+
+    def __init__(self, node: Node, position: int = 1, size: int = 1):
+        self.node, self.position, self.size = node, position, size
+
+
+def _filter(nodes: list[Node], preds: list) -> list[Node]:
+    for pred in preds:
+        size = len(nodes)
+        kept = []
+        for pos, node in enumerate(nodes, 1):
+            v = _eval(pred, _Context(node, pos, size))
+            if (v == pos) if isinstance(v, float) else _to_bool(v):
+                kept.append(node)
+        nodes = kept
+    return nodes
+
+
+def _steps(nodes: list[Node], steps: list) -> list[Node]:
+    for axis, test, preds in steps:
+        out = []
+        for node in nodes:
+            out.extend(_filter([n for n in _axis(node, axis) if _node_test(n, test, axis)], preds))
+        nodes = _doc_order(out)
+    return nodes
+
+
+def _eval(ast, ctx: _Context):
+    kind = ast[0]
+    if kind == "lit":
+        return ast[1]
+    if kind == "num":
+        return ast[1]
+    if kind == "root":
+        root = ctx.node
+        while root.parent is not None:
+            root = root.parent
+        return [root]
+    if kind == "path":
+        start = [ctx.node] if ast[1] is None else _eval(ast[1], ctx)
+        if not isinstance(start, list):
+            raise SelectorError("path step applied to a non-node-set")
+        return _steps(start, ast[2])
+    if kind == "filter":
+        value = _eval(ast[1], ctx)
+        if not isinstance(value, list):
+            raise SelectorError("predicate applied to a non-node-set")
+        return _filter(value, ast[2])
+    if kind == "neg":
+        return -_to_number(_eval(ast[1], ctx))
+    if kind == "binop":
+        op = ast[1]
+        if op == "or":
+            return _to_bool(_eval(ast[2], ctx)) or _to_bool(_eval(ast[3], ctx))
+        if op == "and":
+            return _to_bool(_eval(ast[2], ctx)) and _to_bool(_eval(ast[3], ctx))
+        a, b = _eval(ast[2], ctx), _eval(ast[3], ctx)
+        if op == "|":
+            if not (isinstance(a, list) and isinstance(b, list)):
+                raise SelectorError("union of non-node-sets")
+            return _doc_order(a + b)
+        if op in _SWAP:
+            return _compare(op, a, b)
+        a, b = _to_number(a), _to_number(b)
+        if op == "+":
+            return a + b
+        if op == "-":
+            return a - b
+        if op == "*":
+            return a * b
+        if op == "div":
+            return a / b if b else (math.nan if a == 0 or math.isnan(a) else math.copysign(math.inf, a) * math.copysign(1, b))
+        return math.fmod(a, b) if b else math.nan  # mod
+    return _call(ast[1], ast[2], ctx)
+
+
+def _call(name: str, args: list, ctx: _Context):
+    if name == "last":
+        return float(ctx.size)
+    if name == "position":
+        return float(ctx.position)
+    values = [_eval(a, ctx) for a in args]
+    if name in ("string", "normalize-space", "string-length", "name", "local-name") and not values:
+        values = [[ctx.node]]
+    if name == "count":
+        return float(len(values[0]))
+    if name == "sum":
+        return float(sum(_to_number(n.text()) for n in values[0]))
+    if name in ("name", "local-name"):
+        nodes = values[0]
+        if not nodes or not (nodes[0].is_element or nodes[0].tag[0] == "@"):
+            return ""
+        return nodes[0].tag.lstrip("@")
+    s = [_to_string(v) for v in values]
+    if name == "string":
+        return s[0]
+    if name == "concat":
+        return "".join(s)
+    if name == "starts-with":
+        return s[0].startswith(s[1])
+    if name == "contains":
+        return s[1] in s[0]
+    if name == "substring-before":
+        return s[0].split(s[1], 1)[0] if s[1] in s[0] else ""
+    if name == "substring-after":
+        return s[0].split(s[1], 1)[1] if s[1] in s[0] else ""
+    if name == "substring":
+        start = _to_number(values[1])
+        end = start + _to_number(values[2]) if len(values) > 2 else math.inf
+        if math.isnan(start) or math.isnan(end):
+            return ""
+        first, last = round(start), end if math.isinf(end) else round(end)
+        return "".join(ch for i, ch in enumerate(s[0], 1) if first <= i < last)
+    if name == "string-length":
+        return float(len(s[0]))
+    if name == "normalize-space":
+        return " ".join(s[0].split())
+    if name == "translate":
+        table = {}
+        for i, ch in enumerate(s[1]):
+            table.setdefault(ord(ch), s[2][i] if i < len(s[2]) else None)
+        return s[0].translate(table)
+    if name == "boolean":
+        return _to_bool(values[0])
+    if name == "not":
+        return not _to_bool(values[0])
+    if name == "true":
+        return True
+    if name == "false":
+        return False
+    n = _to_number(values[0]) if values else _to_number([ctx.node])
+    if name == "number":
+        return n
+    if name == "floor":
+        return float(math.floor(n)) if math.isfinite(n) else n
+    if name == "ceiling":
+        return float(math.ceil(n)) if math.isfinite(n) else n
+    return float(math.floor(n + 0.5)) if math.isfinite(n) else n  # round
+
+
+def select_xpath(doc: Node, expr: str) -> list[Node]:
+    try:
+        result = _eval(compile_xpath(expr), _Context(doc))
+    except IndexError:
+        raise SelectorError(f"missing function argument in XPath {expr!r}") from None
+    if not isinstance(result, list):
+        raise SelectorError(f"XPath does not select nodes: {expr!r}")
+    return [n for n in result if n.is_element]
+
+
+def compile_locator(locator: tuple[str, str]):
+    """Parse a locator without evaluating it; raises SelectorError on unsupported syntax."""
+    by, value = to_js_locator(*locator)
+    return compile_xpath(value) if by == "xpath" else compile_css(value)
+
+
+def find(doc: Node, locator: tuple[str, str]) -> list[Node]:
+    """Elements matching a Selenium locator, like driver.find_elements() without visibility."""
+    by, value = to_js_locator(*locator)
+    return select_xpath(doc, value) if by == "xpath" else select_css(doc, value)
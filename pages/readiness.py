@@ -0,0 +1,55 @@
+"""
+App-readiness detectors for BasePage.navigate.
+
+With PAGE_LOAD_STRATEGY=eager/none driver.get() returns before the page is usable, so
+navigation waits for a readiness condition instead. APP_READY picks the detectors
+(comma-separated, all must hold):
+
+    selector      the page's own ready condition (e.g. its title is visible) - default
+    spa           the SPA root (#app, #root, ...) has rendered children
+    dom           document.readyState is 'interactive' or later
+    load          document.readyState is 'complete'
+    network-idle  no new requests for NETWORK_IDLE_MS (500)
+
+More detectors can be added with register().
+"""
+from __future__ import annotations
+
+import os
+from typing import Callable, Optional
+
+from selenium.webdriver.common.by import By
+
+from .dom_wait import Cond, all_of, document_ready, network_idle, present
+
+
+SPA_ROOTS = (By.CSS_SELECTOR, "#app > *, #root > *, #__next > *, [data-v-app] > *")
+
+DETECTORS: dict[str, Callable[[], Cond]] = {
+    "spa": lambda: present(SPA_ROOTS),
+    "dom": lambda: document_ready("interactive"),
+    "load": lambda: document_ready("complete"),
+    "network-idle": lambda: network_idle(int(os.getenv("NETWORK_IDLE_MS", "500"))),
+}
+
+
+def register(name: str, factory: Callable[[], Cond]) -> None:
+    """Make a detector available to APP_READY under ``name``."""
+    DETECTORS[name] = factory
+
+
+def app_ready(selector: Optional[Cond] = None, names: Optional[str] = None) -> Cond:
+    """Combined readiness condition; ``selector`` is the page-specific one ('selector' in APP_READY)."""
+    names = names or os.getenv("APP_READY", "selector")
+    conds = []
+    for name in (n.strip() for n in names.split(",") if n.strip()):
+        if name == "selector":
+            if selector is not None:
+                conds.append(selector)
+            continue
+        if name not in DETECTORS:
+            raise ValueError(f"Unknown APP_READY detector {name!r}; known: selector, {', '.join(DETECTORS)}")
+        conds.append(DETECTORS[name]())
+    if not conds:
+        return document_ready("interactive")
+    return conds[0] if len(conds) == 1 else all_of(*conds)
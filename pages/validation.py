@@ -0,0 +1,141 @@
+"""
+Batched negative/positive validation of a single input.
+
+A whole table of (value, expected_blocked) cases is driven inside the browser by one
+execute_async_script: each value is set through the native setter, input/change/blur are
+dispatched, and the page's conditions (dom_wait Conds) are polled until the expectation is
+met or the per-case timeout runs out. An expected-allowed case waits for ``blocked`` (e.g.
+"Next disabled or error shown") to clear; an expected-blocked case waits for ``blocked``.
+Where the UI marks rejected input (aria-invalid, an error that appears on every invalid
+value), pass it as ``invalid``: expected-blocked cases then also wait for that positive signal,
+since "no progress yet" holds before async validation has run too.
+
+    results = validate_input(driver, EmailPage.EMAIL_INPUT, [("@", True), ("a@b.co", False)],
+                             blocked=~EmailPage.NEXT_ENABLED | EmailPage.HAS_ERROR)
+    failed = [r for r in results if not r.ok]
+
+BATCH_VALIDATION=false drives the same table over WebDriver instead (clear, send_keys,
+TAB and a bounded wait per case), for apps whose validation needs real keystrokes.
+"""
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .dom_js import to_js_locator
+from .dom_wait import EVAL_JS, Cond, ensure_script_timeout, holds, wait_for
+
+
+VALIDATE_JS = EVAL_JS + r"""
+var target = arguments[0], cases = arguments[1], blocked = arguments[2], rejected = arguments[3];
+var timeoutMs = arguments[4], settleMs = arguments[5], done = arguments[arguments.length - 1];
+var el = Array.isArray(target) ? __find(target[0], target[1]).filter(__visible)[0] : target;
+if (!el) { done({error: 'input not found'}); return; }
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+var setValue = Object.getOwnPropertyDescriptor(proto, 'value').set;
+function put(value) {
+  setValue.call(el, value);
+  el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: value}));
+}
+var out = [], i = 0;
+function next() {
+  if (i >= cases.length) { done({results: out}); return; }
+  var c = cases[i++], t0 = performance.now();
+  el.focus();
+  put('');
+  put(c[0]);
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  el.blur();
+  function poll() {
+    // expected-blocked cases need the positive signal, not just the absence of progress
+    var b = __check(c[1] ? rejected : blocked), ms = performance.now() - t0;
+    if (b === c[1] || ms >= timeoutMs) {
+      out.push({blocked: b, ms: Math.round(ms)});
+      setTimeout(next, 0);
+    } else {
+      setTimeout(poll, 10);
+    }
+  }
+  // let the framework re-render before the first check, so the previous case's state is not read
+  setTimeout(poll, settleMs);
+}
+next();
+"""
+
+
+@dataclass
+class ValidationResult:
+    value: str
+    expected_blocked: bool
+    blocked: bool
+    ms: int
+
+    @property
+    def ok(self) -> bool:
+        return self.blocked == self.expected_blocked
+
+
+def batch_enabled() -> bool:
+    return os.getenv("BATCH_VALIDATION", "true").lower() in ("1", "true", "yes")
+
+
+def validate_input(driver, target, cases: Sequence[tuple[str, bool]], blocked: Cond, invalid: Cond | None = None,
+                   timeout: float = 1.0, settle: float = 0.05, batch: bool | None = None) -> list[ValidationResult]:
+    """Run ``cases`` against the input ``target`` (locator or WebElement); one result per case.
+
+    ``timeout`` bounds each case. An expected-allowed case resolves once ``blocked`` clears;
+    an expected-blocked case once ``blocked`` holds, and ``invalid`` too when given.
+    """
+    batch = batch_enabled() if batch is None else batch
+    if not batch:
+        return _validate_with_keys(driver, target, cases, blocked, invalid, timeout)
+    ensure_script_timeout(driver, len(cases) * (timeout + settle) + 5)
+    loc = to_js_locator(*target) if isinstance(target, tuple) else target
+    res = driver.execute_async_script(VALIDATE_JS, loc, [[v, bool(b)] for v, b in cases], blocked.spec,
+                                      _rejected(blocked, invalid).spec, int(timeout * 1000), int(settle * 1000))
+    if res.get("error"):
+        raise AssertionError(f"Validation harness: {res['error']} ({target})")
+    return [ValidationResult(v, bool(b), bool(r["blocked"]), int(r["ms"]))
+            for (v, b), r in zip(cases, res["results"])]
+
+
+def _rejected(blocked: Cond, invalid: Cond | None) -> Cond:
+    return blocked if invalid is None else blocked & invalid
+
+
+def _validate_with_keys(driver, target, cases, blocked: Cond, invalid: Cond | None,
+                        timeout: float) -> list[ValidationResult]:
+    rejected = _rejected(blocked, invalid)
+    results = []
+    for value, expect in cases:
+        t0 = time.perf_counter()
+        el = target
+        if isinstance(target, tuple):
+            el = WebDriverWait(driver, 10).until(EC.visibility_of_element_located(target))
+        el.clear()
+        el.send_keys(value)
+        el.send_keys(Keys.TAB)  # blur triggers validation
+        try:
+            wait_for(driver, rejected if expect else ~blocked, timeout)
+        except TimeoutException:
+            pass
+        results.append(ValidationResult(value, bool(expect), holds(driver, rejected if expect else blocked),
+                                        int((time.perf_counter() - t0) * 1000)))
+    return results
+
+
+def format_matrix(results: Sequence[ValidationResult]) -> str:
+    lines = []
+    for r in results:
+        mark = "✓" if r.ok else "✗"
+        want = "block" if r.expected_blocked else "allow"
+        got = "blocked" if r.blocked else "allowed"
+        lines.append(f"  {mark} {r.value!r:<48} expect {want:<5} got {got:<7} {r.ms}ms")
+    return "\n".join(lines)
@@ -1,64 +1,70 @@
 from __future__ import annotations
 
+import argparse
 import os
+import time
 from pathlib import Path
 import sys
 
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from core.browser import get_driver, get_base_url
-from pages.auth_pages import AuthLandingPage
+from core.browser import get_locale
+from core.crawler import BoundaryCapture, CrawlBaseline, collect
+from core.diagnostics import get_diagnostics
+from core.runner import build_flows, exit_code, merge_report, print_report, run_flows
+from test_factory import STEPS
 
 
-OUT_DIR = Path("_dom_dumps")
-OUT_DIR.mkdir(exist_ok=True)
+def _split(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
 
 
 def main():
-    driver = get_driver(headless=os.getenv("HEADLESS", "true").lower() in ("1", "true", "yes"))
-    try:
-        # Open landing
-        lp = AuthLandingPage(driver).open()
-        # Click Start ("Начать") to move to email screen
-        try:
-            lp.click_start()
-        except Exception as e:
-            print(f"[warn] couldn't click Start: {e}")
-        # Dump email page
-        html = driver.page_source
-        f1 = OUT_DIR / "step_after_start.html"
-        f1.write_text(html)
-        print(f"[ok] wrote DOM to {f1}")
+    """Crawl the registration flow per locale, storing the DOM and a locator map at every step
+    boundary; only changes against the previous crawl are written (DUMP_DIR/crawl/<run>/)."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--locales", default=os.getenv("LOCALES", get_locale()), help="comma-separated locales")
+    parser.add_argument("--variants", default="default", help="comma-separated data variants")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "1")), help="parallel browsers")
+    parser.add_argument("--upto", type=int, default=len(STEPS), help="crawl only the first N steps")
+    parser.add_argument("--dir", help="snapshot store directory (default: DUMP_DIR env or _dom_dumps)")
+    args = parser.parse_args()
 
-        # Try to fill email and continue
-        try:
-            email_input = WebDriverWait(driver, 5).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "input#email-input"))
-            )
-            email_input.clear()
-            email_input.send_keys("user@test.com")
-            continue_btn = driver.find_element(By.XPATH, "//button[span[contains(normalize-space(.), 'Продолжить')]]")
-            continue_btn.click()
-        except Exception as e:
-            print(f"[warn] couldn't proceed to code page: {e}")
+    if args.dir:
+        os.environ["DUMP_DIR"] = args.dir  # before the store is opened; workers inherit it
+    if os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes"):
+        print("[warn] DRY_RUN is on: steps skip browser actions, the crawl will capture empty pages")
+    run = f"crawl-{time.strftime('%Y%m%d-%H%M%S')}"
+    steps = [(name, BoundaryCapture(name, fn, run)) for name, fn in STEPS[: args.upto]]
+    flows = build_flows(_split(args.locales), _split(args.variants))
 
-        # Dump next page
-        html2 = driver.page_source
-        f2 = OUT_DIR / "step_after_email.html"
-        f2.write_text(html2)
-        print(f"[ok] wrote DOM to {f2}")
-    except TimeoutException as e:
-        print(f"[err] timeout: {e}")
+    print(f"🕸  Обход {len(steps)} шагов: {len(flows)} флоу, воркеров: {args.workers}, run {run}")
+    results = run_flows(flows, steps, workers=args.workers)
+    print_report(merge_report(results))
+
+    diagnostics = get_diagnostics()
+    try:
+        for flow in flows:
+            captured = collect(run, flow.name, diagnostics.store)
+            diff, path = CrawlBaseline(flow.name).update(run, captured)
+            print(f"\n[{flow.name}] {len(captured)} шагов снято, изменилось: {len(diff)}"
+                  + (f" -> {path}" if path else ""))
+            for step, info in captured.items():
+                change = diff.get(step)
+                if change is None:
+                    mark = "="
+                elif change.get("new_step"):
+                    mark = f"+ new, {len(change['added'])} locators"
+                else:
+                    mark = (f"~ +{len(change['added'])} -{len(change['removed'])} "
+                            f"±{len(change['changed'])} locators" + (", url changed" if "url" in change else ""))
+                print(f"  #{info['snapshot']:<6} {step:<36} {mark}")
     finally:
-        driver.quit()
+        diagnostics.close()
+    return exit_code(results)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
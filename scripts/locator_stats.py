@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pages.locator_cache import LocatorCache
+
+
+def main():
+    """Print locator cache hit/miss statistics; candidates that never matched are pruning suspects."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--cache", help="cache file (default: LOCATOR_CACHE env or .locator_cache.json)")
+    parser.add_argument("--build", help="only this app build")
+    args = parser.parse_args()
+
+    stats = LocatorCache(args.cache).stats()
+    if not stats:
+        print("[warn] locator cache is empty")
+        return
+    for build, keys in stats.items():
+        if args.build and build != args.build:
+            continue
+        print(f"\n== build {build}")
+        for key, entry in sorted(keys.items()):
+            total = entry["hits"] + entry["misses"]
+            rate = entry["hits"] / total * 100 if total else 0.0
+            print(f"{key}: cache hits {entry['hits']}/{total} ({rate:.0f}%), winner: {entry['winner']}")
+            for cid, c in entry["candidates"].items():
+                mark = "dead?" if c["hits"] == 0 else "     "
+                print(f"  {mark} hits={c['hits']:<5} misses={c['misses']:<5} {cid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.chromedriver import cache_path, resolve_chromedriver
+
+
+def main():
+    """Resolve chromedriver once (may download) so later runs start offline from cache."""
+    try:
+        r = resolve_chromedriver()
+    except RuntimeError as e:
+        print(f"[err] {e}")
+        return 1
+    print(f"[ok] chromedriver: {r.path}")
+    print(f"[ok] chrome version: {r.chrome_version or 'unknown'}, source: {r.source}, {r.seconds:.3f}s")
+    print(f"[ok] cache: {cache_path()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.browser import get_base_url, get_driver, get_locale, reset_session
+from core.resources import PROFILES, page_stats
+
+
+def measure(profile: str, urls: list[str], runs: int) -> dict[str, dict]:
+    """Load every URL ``runs`` times with a cold cache under one profile; medians per page."""
+    driver = get_driver(headless=os.getenv("HEADLESS", "true").lower() in ("1", "true", "yes"),
+                        resource_profile=profile)
+    out: dict[str, dict] = {}
+    try:
+        for url in urls:
+            loads, requests, kb = [], [], []
+            for _ in range(runs):
+                reset_session(driver)  # clears cache and cookies; the blocklist stays on the tab
+                t0 = time.perf_counter()
+                driver.get(url)
+                loads.append(time.perf_counter() - t0)
+                stats = page_stats(driver)
+                requests.append(stats["requests"])
+                kb.append(stats["bytes"] / 1024)
+            out[url] = {
+                "load": statistics.median(loads),
+                "requests": statistics.median(requests),
+                "kb": statistics.median(kb),
+            }
+    finally:
+        driver.quit()
+    return out
+
+
+def main():
+    """Compare page load time, requests and transferred bytes per resource profile against 'full'."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--pages", default=f"/,/{get_locale()}", help="comma-separated paths under BASE_URL")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="comma-separated profile names")
+    parser.add_argument("--runs", type=int, default=3, help="cold loads per page and profile")
+    args = parser.parse_args()
+
+    base = get_base_url().rstrip("/")
+    urls = [base + p.strip() for p in args.pages.split(",") if p.strip()]
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    if "full" not in profiles:
+        profiles.insert(0, "full")
+
+    results = {name: measure(name, urls, args.runs) for name in profiles}
+    full = results["full"]
+    print(f"\n{'page':<40} {'profile':<10} {'load':>7} {'reqs':>6} {'KB':>9} {'saved reqs':>11} {'saved KB':>10}")
+    for url in urls:
+        for name in profiles:
+            r = results[name][url]
+            saved_reqs = full[url]["requests"] - r["requests"]
+            saved_kb = full[url]["kb"] - r["kb"]
+            print(f"{url:<40} {name:<10} {r['load']:>6.2f}s {r['requests']:>6.0f} {r['kb']:>9.1f}"
+                  f" {saved_reqs:>11.0f} {saved_kb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
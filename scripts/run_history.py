@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+import time
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.run_history import RunHistory
+
+
+def _ts(value: float) -> str:
+    return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M")
+
+
+def main():
+    """Query the local run history: recent runs, per-step duration trends and regressions between builds."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--db", help="history database (default: RUN_HISTORY_DB env or _run_history.sqlite)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    runs = sub.add_parser("runs", help="latest runs")
+    runs.add_argument("--limit", type=int, default=20)
+    trend = sub.add_parser("trend", help="per-step p50/p90/p95, failures and retries per day or build")
+    trend.add_argument("--by", choices=("day", "build"), default="day")
+    trend.add_argument("--days", type=float, default=30, help="look back this many days (0 = everything)")
+    trend.add_argument("--step", help="only steps whose name contains this text")
+    reg = sub.add_parser("regressions", help="step latency of one build against another")
+    reg.add_argument("--base", help="baseline build (default: the build before --head)")
+    reg.add_argument("--head", help="build to check (default: the latest build)")
+    reg.add_argument("--threshold", type=float, default=0.2, help="relative p50/p95 growth to flag")
+    reg.add_argument("--min-delta", type=float, default=0.1, help="ignore growth below this many seconds")
+    args = parser.parse_args()
+
+    history = RunHistory(args.db)
+    try:
+        if args.cmd == "runs":
+            for r in history.runs(args.limit):
+                mark = "✅" if r["exit_code"] == 0 else "❌"
+                print(f"{mark} #{r['id']:<5} {_ts(r['started'])}  {r['run']:<24} exit={r['exit_code']} "
+                      f"{r['duration']:>7.1f}s flows={r['flows']:<3} workers={r['workers']} "
+                      f"build={r['build']} browser={r['browser'] or '-'} commit={r['commit_sha'] or '-'}")
+        elif args.cmd == "trend":
+            since = time.time() - args.days * 86400 if args.days else 0.0
+            stats = history.trend(args.by, since, args.step)
+            if not stats:
+                print("[warn] no runs recorded in this window")
+                return 1
+            print(f"{'step':<36} {args.by:<16} {'n':>4} {'p50':>7} {'p90':>7} {'p95':>7} {'max':>7}"
+                  f" {'fail':>5} {'retry':>5} {'cmds':>6}")
+            for s in stats:
+                print(f"{s.step:<36} {s.bucket[:16]:<16} {s.n:>4} {s.p50:>6.2f}s {s.p90:>6.2f}s {s.p95:>6.2f}s"
+                      f" {s.max:>6.2f}s {s.failures:>5} {s.retries:>5} {s.commands:>6.1f}")
+        elif args.cmd == "regressions":
+            builds = history.builds()
+            head = args.head or (builds[-1] if builds else None)
+            if args.base:
+                base = args.base
+            else:
+                earlier = builds[: builds.index(head)] if head in builds else []
+                base = earlier[-1] if earlier else None
+            if not head or not base:
+                print("[err] need two builds with recorded runs (see: runs)")
+                return 1
+            rows = history.compare_builds(base, head, args.threshold, args.min_delta)
+            print(f"build {base} -> {head}")
+            for r in rows:
+                mark = "🔺" if r["regression"] else "  "
+                print(f"{mark} {r['step']:<36} p50 {r['base_p50']:6.2f}s -> {r['head_p50']:6.2f}s"
+                      f"  p95 {r['base_p95']:6.2f}s -> {r['head_p95']:6.2f}s  (n={r['base_n']}/{r['head_n']})")
+            if any(r["regression"] for r in rows):
+                return 1
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import os
+import statistics
+import time
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.offline_dom import SelectorError, compile_locator, find, parse_html
+
+_BY = {v for k, v in vars(By).items() if k.isupper()}
+
+
+def _is_locator(value) -> bool:
+    return isinstance(value, tuple) and len(value) == 2 and value[0] in _BY and isinstance(value[1], str)
+
+
+def collect_locators(module_name: str) -> dict[str, list[tuple[str, str]]]:
+    """Class-level locator tuples and ``*_CANDIDATES`` lists of every page object in a module."""
+    module = importlib.import_module(module_name)
+    found: dict[str, list[tuple[str, str]]] = {}
+    for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+        if not issubclass(cls, BasePage) or cls.__module__ != module.__name__:
+            continue
+        for attr, value in vars(cls).items():
+            if _is_locator(value):
+                found[f"{cls_name}.{attr}"] = [value]
+            elif attr.endswith("_CANDIDATES") and isinstance(value, (list, tuple)):
+                found[f"{cls_name}.{attr}"] = [v for v in value if _is_locator(v)]
+    return found
+
+
+def load_documents(root: Path, html_files: list[str], run: str | None, step: str | None,
+                   limit: int) -> list[tuple[str, str]]:
+    """(label, html) of stored snapshots (one per unique HTML blob), *.html in ``root`` and extra files."""
+    docs: list[tuple[str, str]] = []
+    if (root / "index.sqlite").exists():
+        from core.snapshot_store import SnapshotStore
+
+        store = SnapshotStore(root)
+        seen: set[str] = set()
+        for row in store.query(run=run, step=step, limit=limit):
+            if not row.html or row.html in seen:
+                continue
+            seen.add(row.html)
+            try:
+                html = store.read_blob(row.html, "html").decode("utf-8", "replace")
+            except FileNotFoundError:
+                continue
+            docs.append((f"#{row.id} {row.step or row.reason}", html))
+        store.close()
+    paths = sorted(root.glob("*.html")) if root.is_dir() else []
+    for path in [*paths, *map(Path, html_files)]:
+        docs.append((path.name, path.read_text(encoding="utf-8", errors="replace")))
+    return docs
+
+
+def _cost_hint(locator: tuple[str, str]) -> str:
+    by, value = locator
+    if by != By.XPATH:
+        return "" if not value.lstrip().startswith(("*", "[")) else "no tag to narrow the scan"
+    hints = []
+    if value.startswith("//*"):
+        hints.append("'//*' walks every element")
+    if "translate(" in value:
+        hints.append("translate() per node")
+    if "normalize-space(.)" in value or "contains(.," in value.replace(", ", ","):
+        hints.append("string-value of whole subtrees")
+    return ", ".join(hints)
+
+
+def check(locators: dict[str, list], docs: list[tuple[str, str]]) -> dict[str, list[dict]]:
+    """Per key, per candidate: matches per document, median evaluation ms and syntax errors."""
+    parsed = [(label, parse_html(html)) for label, html in docs]
+    report: dict[str, list[dict]] = {}
+    for key, candidates in locators.items():
+        rows = []
+        for loc in candidates:
+            row = {"locator": loc, "counts": [], "ms": [], "error": None}
+            try:
+                compile_locator(loc)
+                for _, doc in parsed:
+                    t0 = time.perf_counter()
+                    row["counts"].append(len(find(doc, loc)))
+                    row["ms"].append((time.perf_counter() - t0) * 1000)
+            except SelectorError as e:
+                row["error"] = str(e)
+            rows.append(row)
+        report[key] = rows
+    return report
+
+
+def _status(row: dict, slow_ms: float) -> list[str]:
+    if row["error"]:
+        return ["unsupported"]
+    flags = []
+    if not any(row["counts"]):
+        flags.append("dead")
+    if max(row["counts"], default=0) > 1:
+        flags.append(f"ambiguous(max {max(row['counts'])})")
+    if row["ms"] and statistics.median(row["ms"]) > slow_ms:
+        flags.append("slow")
+    return flags
+
+
+def main():
+    """Check page-object locators against stored DOM snapshots offline: dead, ambiguous and slow selectors.
+
+    A locator is dead when it matches in none of the loaded documents, so snapshot every
+    screen the flow visits (dump_dom.py, failure snapshots) before trusting a DEAD key.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--dir", default=None, help="snapshot store / dump directory (default: DUMP_DIR env or _dom_dumps)")
+    parser.add_argument("--html", nargs="*", default=[], help="extra HTML files to check against")
+    parser.add_argument("--module", action="append", help="page-object module (default: pages.auth_pages)")
+    parser.add_argument("--run", help="only snapshots of this run")
+    parser.add_argument("--step", help="only snapshots of this step")
+    parser.add_argument("--limit", type=int, default=50, help="latest stored snapshots to load")
+    parser.add_argument("--slow-ms", type=float, default=5.0, help="median evaluation time per document to flag")
+    parser.add_argument("--all", action="store_true", help="also list healthy locators")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    root = Path(args.dir or os.getenv("DUMP_DIR", "_dom_dumps"))
+    docs = load_documents(root, args.html, args.run, args.step, args.limit)
+    if not docs:
+        print(f"[err] no HTML snapshots in {root} (run scripts/dump_dom.py or a flow first)")
+        return 2
+    locators: dict[str, list] = {}
+    for module in args.module or ["pages.auth_pages"]:
+        locators.update(collect_locators(module))
+    report = check(locators, docs)
+
+    dead_keys = 0
+    for key, rows in report.items():
+        statuses = [_status(r, args.slow_ms) for r in rows]
+        group = len(rows) > 1
+        key_dead = all("dead" in s or "unsupported" in s for s in statuses)
+        dead_keys += key_dead
+        if not args.all and not any(statuses):
+            continue
+        print(f"\n{key}{'  <- DEAD' if key_dead else ''}")
+        for i, (row, flags) in enumerate(zip(rows, statuses)):
+            if not args.all and not flags:
+                continue
+            by, value = row["locator"]
+            hits = sum(1 for c in row["counts"] if c)
+            ms = statistics.median(row["ms"]) if row["ms"] else 0.0
+            label = f"[{i}]" if group else ""
+            detail = row["error"] or f"in {hits}/{len(docs)} docs, {ms:.2f}ms"
+            hint = _cost_hint(row["locator"]) if "slow" in flags else ""
+            print(f"  {label:<4} {' '.join(flags) or 'ok':<24} {detail:<28} {by}: {value}"
+                  + (f"  ({hint})" if hint else ""))
+
+    total = sum(len(rows) for rows in report.values())
+    print(f"\n{len(report)} keys / {total} locators against {len(docs)} documents "
+          f"in {time.perf_counter() - started:.2f}s; dead keys: {dead_keys}")
+    return 1 if dead_keys else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
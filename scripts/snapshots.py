@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.snapshot_store import KINDS, SUFFIXES, SnapshotStore
+
+
+def main():
+    """Inspect, extract and evict diagnostic snapshots in the content-addressed dump store."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--dir", help="store directory (default: DUMP_DIR env or _dom_dumps)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("stats", help="blob/snapshot counts and size on disk")
+    ls = sub.add_parser("list", help="latest snapshots")
+    ls.add_argument("--run")
+    ls.add_argument("--step")
+    ls.add_argument("--reason")
+    ls.add_argument("--limit", type=int, default=30)
+    show = sub.add_parser("show", help="extract a snapshot's HTML/PNG/trace as plain files")
+    show.add_argument("id", type=int)
+    show.add_argument("--out", default=".", help="target directory")
+    ev = sub.add_parser("evict", help="apply retention limits now")
+    ev.add_argument("--max-age-days", type=float, help="default: SNAPSHOT_MAX_AGE_DAYS env or 7")
+    ev.add_argument("--max-mb", type=float, help="default: SNAPSHOT_MAX_MB env or 500")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.dir)
+    if args.cmd == "stats":
+        s = store.stats()
+        saved = s["references"] - s["blobs"]
+        print(f"snapshots={s['snapshots']} runs={s['runs']} blobs={s['blobs']} "
+              f"size={s['bytes'] / 1024 / 1024:.1f}MB (dedup saved {max(saved, 0)} blob copies)")
+    elif args.cmd == "list":
+        for row in store.query(args.run, args.step, args.reason, args.limit):
+            ts = datetime.fromtimestamp(row.created).strftime("%Y-%m-%d %H:%M:%S")
+            kinds = "+".join(k for k in KINDS if getattr(row, k))
+            print(f"#{row.id:<6} {ts}  {row.run:<24} {row.step or '-':<32} {row.reason:<24} {kinds:<14} {row.url or ''}")
+    elif args.cmd == "show":
+        row = store.get(args.id)
+        if row is None:
+            print(f"[err] no snapshot #{args.id}")
+            return 1
+        out = Path(args.out)
+        out.mkdir(parents=True, exist_ok=True)
+        for kind in KINDS:
+            digest = getattr(row, kind)
+            if not digest:
+                continue
+            target = out / f"{row.reason}_{row.id}{SUFFIXES[kind]}"
+            target.write_bytes(store.read_blob(digest, kind))
+            print(f"[ok] {target}")
+    elif args.cmd == "evict":
+        removed = store.evict(args.max_age_days, args.max_mb)
+        print(f"[ok] evicted {removed['snapshots']} snapshots, {removed['blobs']} blobs "
+              f"({removed['bytes'] / 1024 / 1024:.1f}MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""
+Local stand-in for the Lenza auth app: all ten registration screens on localhost,
+using the markup the page objects in pages/auth_pages.py expect (OTP 666555).
+
+    python -m standin.server --port 8765 --latency-ms 50 --ui-latency-ms 200
+    BASE_URL=http://127.0.0.1:8765 DRY_RUN=false python test_factory.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    # Configured per server via make_server()
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    ui_latency_ms: float = 0.0
+    verbose: bool = False
+
+    def _delay(self) -> None:
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._delay()
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send(200, b"ok", "text/plain; charset=utf-8")
+            return
+        if path.startswith("/static/"):
+            target = (STATIC_DIR / path[len("/static/"):]).resolve()
+            if STATIC_DIR not in target.parents or not target.is_file():
+                self._send(404, b"not found", "text/plain; charset=utf-8")
+                return
+            self._send(200, target.read_bytes(), CONTENT_TYPES.get(target.suffix, "application/octet-stream"))
+            return
+        # SPA fallback: every other path is routed client-side
+        config = json.dumps({"uiLatencyMs": self.ui_latency_ms})
+        html = (STATIC_DIR / "index.html").read_text(encoding="utf-8").replace("__STANDIN_CONFIG__", config)
+        self._send(200, html.encode("utf-8"), CONTENT_TYPES[".html"])
+
+    def log_message(self, format: str, *args) -> None:
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                ui_latency_ms: float = 0.0, verbose: bool = False) -> ThreadingHTTPServer:
+    """Build a server; ``latency_ms``/``jitter_ms`` delay every HTTP response,
+    ``ui_latency_ms`` delays client-side screen transitions (simulated API calls)."""
+    handler = type("ConfiguredStandinHandler", (StandinHandler,), {
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "ui_latency_ms": ui_latency_ms,
+        "verbose": verbose,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def start_in_thread(**kwargs) -> tuple[ThreadingHTTPServer, str]:
+    """Start a server on a background thread (port 0 = any free port); returns (server, base_url)."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, name="standin", daemon=True).start()
+    return server, base_url(server)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local stand-in auth app for offline runs and benchmarks")
+    parser.add_argument("--host", default=os.getenv("STANDIN_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("STANDIN_PORT", "8765")))
+    parser.add_argument("--latency-ms", type=float, default=float(os.getenv("STANDIN_LATENCY_MS", "0")),
+                        help="delay added to every HTTP response")
+    parser.add_argument("--jitter-ms", type=float, default=float(os.getenv("STANDIN_JITTER_MS", "0")),
+                        help="random extra delay, uniform in [0, jitter]")
+    parser.add_argument("--ui-latency-ms", type=float, default=float(os.getenv("STANDIN_UI_LATENCY_MS", "0")),
+                        help="delay of client-side screen transitions (simulated API calls)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.latency_ms, args.jitter_ms, args.ui_latency_ms, args.verbose)
+    print(f"[standin] serving on {base_url(server)} (latency {args.latency_ms:.0f}ms "
+          f"+ jitter {args.jitter_ms:.0f}ms, ui {args.ui_latency_ms:.0f}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,365 @@
+// Stand-in registration flow. Markup mirrors the selectors in pages/auth_pages.py.
+(function () {
+  'use strict';
+
+  var CONFIG = window.STANDIN || {};
+  var UI_LATENCY = CONFIG.uiLatencyMs || 0;
+  var OTP = '666555';
+
+  var LANGS = [
+    {code: 'ru', label: 'Русский'},
+    {code: 'en', label: 'English (США)'},
+    {code: 'de', label: 'Deutsch'},
+    {code: 'es', label: 'Español'},
+    {code: 'kk', label: 'Қазақша'}
+  ];
+  var TEXTS = {
+    ru: {
+      title: 'Добро пожаловать в Lenza', start: 'Начать', login: 'Вход по email', next: 'Продолжить',
+      badEmail: 'Введите корректный email', code: 'Введите код из письма', badCode: 'Неверный код',
+      back: 'Назад', workspace: 'Создайте рабочее пространство', wsPlaceholder: 'Название компании',
+      wsNext: 'Далее', badWs: 'Допустимы буквы, цифры, пробел, точка, дефис',
+      profile: 'Профиль', first: 'Имя', last: 'Фамилия', badNames: 'Укажите имя и фамилию',
+      birthdate: 'Дата рождения', invite: 'Пригласите коллег', copy: 'Скопировать ссылку',
+      copied: 'Ссылка скопирована', later: 'Пригласить позже', send: 'Отправить приглашения',
+      domains: 'Разрешённые домены', skip: 'Пропустить', dashboard: 'Рабочее пространство'
+    },
+    en: {
+      title: 'Welcome to Lenza', start: 'Start', login: 'Sign in with email', next: 'Continue',
+      badEmail: 'Enter a valid email', code: 'Enter the code from the email', badCode: 'Wrong code',
+      back: 'Back', workspace: 'Create a workspace', wsPlaceholder: 'Company name',
+      wsNext: 'Next', badWs: 'Letters, digits, space, dot and dash only',
+      profile: 'Profile', first: 'First name', last: 'Last name', badNames: 'Enter first and last name',
+      birthdate: 'Date of birth', invite: 'Invite teammates', copy: 'Copy link',
+      copied: 'Link copied', later: 'Invite later', send: 'Send invites',
+      domains: 'Approved domains', skip: 'Skip', dashboard: 'Workspace'
+    }
+  };
+  var MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December'];
+
+  var EMAIL_RE = /^[A-Za-z0-9._%+-]{1,32}@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}$/;
+  var WS_RE = /^[A-Za-z0-9А-Яа-яЁё][A-Za-z0-9А-Яа-яЁё _.-]{1,62}$/;
+  var NAME_RE = /^[A-Za-zА-Яа-яЁё][A-Za-zА-Яа-яЁё' -]*$/;
+
+  // ---- state -------------------------------------------------------------
+
+  function loadState() {
+    try { return JSON.parse(sessionStorage.getItem('standin.state')) || {}; } catch (e) { return {}; }
+  }
+  function saveState() { sessionStorage.setItem('standin.state', JSON.stringify(state)); }
+  var state = loadState();
+
+  function lang() { return localStorage.getItem('standin.lang') || 'ru'; }
+  function setLang(code) {
+    localStorage.setItem('standin.lang', code);
+    document.documentElement.lang = code;
+  }
+  function t(key) { return (TEXTS[lang()] || TEXTS.en)[key]; }
+  function esc(s) {
+    return String(s == null ? '' : s).replace(/[&<>"']/g, function (c) {
+      return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+  }
+
+  // ---- routing -----------------------------------------------------------
+
+  function navigate(path) {
+    history.pushState({}, '', path);
+    render();
+  }
+  function go(path) {
+    // Forward transitions stand in for API calls and take UI_LATENCY
+    setTimeout(function () { navigate(path); }, UI_LATENCY);
+  }
+  window.addEventListener('popstate', render);
+
+  var $app = document.getElementById('app');
+  function $(sel) { return $app.querySelector(sel); }
+
+  function render() {
+    var path = window.location.pathname.replace(/\/+$/, '') || '/';
+    var langPath = /^\/([a-z]{2})$/.exec(path);
+    if (langPath && LANGS.some(function (l) { return l.code === langPath[1]; })) {
+      setLang(langPath[1]);
+      path = '/';
+    }
+    var screen = SCREENS[path] || SCREENS['/'];
+    if (screen.needs === 'email' && !state.email) screen = SCREENS['/'];
+    if (screen.needs === 'verified' && !state.verified) screen = SCREENS['/'];
+    renderHeader();
+    $app.innerHTML = screen.html();
+    $app.setAttribute('data-screen', screen.name);
+    screen.bind();
+  }
+
+  // ---- header: language switch and cookie banner -------------------------
+
+  var $langBtn = document.querySelector('button.lang-switch');
+  var $context = document.getElementById('context-root');
+  var $cookies = document.querySelector('.cookie-banner');
+
+  function renderHeader() {
+    var current = LANGS.filter(function (l) { return l.code === lang(); })[0] || LANGS[0];
+    $langBtn.querySelector('.lang-switch__label').textContent = current.label;
+    $langBtn.setAttribute('aria-label', current.label);
+    $langBtn.setAttribute('data-lang', current.code);
+    $cookies.hidden = localStorage.getItem('standin.cookies') === 'accepted';
+  }
+
+  function closeMenu() { $context.innerHTML = ''; }
+  $langBtn.addEventListener('click', function (ev) {
+    ev.stopPropagation();
+    if ($context.firstChild) { closeMenu(); return; }
+    $context.innerHTML = '<div class="context-menu context-menu--modal"><ul class="context-menu__list">' +
+      LANGS.map(function (l) {
+        return '<li class="context-menu__option list-item" data-lang="' + l.code + '">' +
+          '<span class="list-item__title">' + esc(l.label) + '</span></li>';
+      }).join('') + '</ul></div>';
+  });
+  $context.addEventListener('click', function (ev) {
+    var option = ev.target.closest('.context-menu__option');
+    if (!option) return;
+    setLang(option.getAttribute('data-lang'));
+    closeMenu();
+    render();
+  });
+  document.addEventListener('click', function (ev) {
+    if ($context.firstChild && !$context.contains(ev.target)) closeMenu();
+  });
+  document.querySelector('.cookie-accept').addEventListener('click', function () {
+    localStorage.setItem('standin.cookies', 'accepted');
+    $cookies.hidden = true;
+  });
+
+  // ---- screens -----------------------------------------------------------
+
+  function backButton() {
+    return '<button type="button" class="btn btn-back" data-testid="back-button"><span>' + t('back') + '</span></button>';
+  }
+  function onBack(path) {
+    // Back is pure client-side routing: no simulated API call, renders synchronously
+    $('[data-testid="back-button"]').addEventListener('click', function () { navigate(path); });
+  }
+
+  var SCREENS = {
+    '/': {
+      name: 'landing',
+      html: function () {
+        return '<p class="pr_slider_title">' + t('title') + '</p>' +
+          '<button type="button" class="btn btn--full-width btn-start"><span>' + t('start') + '</span></button>';
+      },
+      bind: function () {
+        state = {};
+        saveState();
+        $('.btn-start').addEventListener('click', function () { go('/email'); });
+      }
+    },
+
+    '/email': {
+      name: 'email',
+      html: function () {
+        return '<h1>' + t('login') + '</h1>' +
+          '<input id="email-input" type="email" autocomplete="email" placeholder="Email">' +
+          '<div class="email-error"></div>' +
+          '<button type="button" class="btn btn--full-width" disabled><span>' + t('next') + '</span></button>';
+      },
+      bind: function () {
+        var input = $('#email-input'), btn = $('button'), err = $('.email-error');
+        function valid() { return EMAIL_RE.test(input.value); }
+        function update() {
+          btn.disabled = !valid();
+          if (valid()) err.innerHTML = '';
+        }
+        input.addEventListener('input', update);
+        input.addEventListener('change', update);
+        input.addEventListener('blur', function () {
+          err.innerHTML = input.value && !valid() ? '<p class="hdi_description">' + t('badEmail') + '</p>' : '';
+        });
+        btn.addEventListener('click', function () {
+          if (!valid()) return;
+          state.email = input.value;
+          saveState();
+          go('/code');
+        });
+      }
+    },
+
+    '/code': {
+      name: 'code',
+      needs: 'email',
+      html: function () {
+        return '<h1>' + t('code') + '</h1><p class="code-hint">' + esc(state.email) + '</p>' +
+          '<input name="code" type="tel" autocomplete="one-time-code" inputmode="numeric" maxlength="6" placeholder="······">' +
+          '<p class="error-text" hidden>' + t('badCode') + '</p>' +
+          '<button type="submit" class="btn btn--full-width"><span>' + t('next') + '</span></button>';
+      },
+      bind: function () {
+        if (state.verified) {
+          // Session already confirmed (e.g. Back from the workspace screen): skip ahead
+          go('/workspace');
+          return;
+        }
+        var input = $('input[name="code"]'), err = $('.error-text');
+        function check(force) {
+          var v = input.value;
+          if (v.length < 6 && !force) { err.hidden = true; return; }
+          if (v === OTP) {
+            state.verified = true;
+            saveState();
+            go('/workspace');
+          } else {
+            err.hidden = false;
+          }
+        }
+        input.addEventListener('input', function () { check(false); });
+        $('button[type="submit"]').addEventListener('click', function () { check(true); });
+      }
+    },
+
+    '/workspace': {
+      name: 'workspace',
+      needs: 'verified',
+      html: function () {
+        return backButton() + '<h1>' + t('workspace') + '</h1>' +
+          '<input name="workspaceName" id="workspace-name" type="text" placeholder="' + t('wsPlaceholder') + '">' +
+          '<p class="field-error" hidden>' + t('badWs') + '</p>' +
+          '<button type="submit" class="btn btn--full-width" disabled><span>' + t('wsNext') + '</span></button>';
+      },
+      bind: function () {
+        onBack('/code');
+        var input = $('#workspace-name'), btn = $('button[type="submit"]'), err = $('.field-error');
+        function valid() { return WS_RE.test(input.value.trim()); }
+        function update() {
+          var ok = valid();
+          btn.disabled = !ok;
+          err.hidden = ok;
+          input.setAttribute('aria-invalid', ok ? 'false' : 'true');
+        }
+        input.addEventListener('input', update);
+        input.addEventListener('change', update);
+        btn.addEventListener('click', function () {
+          if (!valid()) return;
+          state.workspace = input.value.trim();
+          saveState();
+          go('/profile');
+        });
+      }
+    },
+
+    '/profile': {
+      name: 'profile',
+      needs: 'verified',
+      html: function () {
+        return backButton() + '<h1>' + t('profile') + '</h1>' +
+          '<input type="file" name="avatar" accept="image/*">' +
+          '<input type="text" name="firstName" placeholder="' + t('first') + '">' +
+          '<input type="text" name="lastName" placeholder="' + t('last') + '">' +
+          '<p class="field-error" hidden>' + t('badNames') + '</p>' +
+          '<button type="submit" class="btn btn--full-width"><span>' + t('next') + '</span></button>';
+      },
+      bind: function () {
+        onBack('/workspace');
+        var first = $('input[name="firstName"]'), last = $('input[name="lastName"]'), err = $('.field-error');
+        $('button[type="submit"]').addEventListener('click', function () {
+          var f = first.value.trim(), l = last.value.trim();
+          if (!NAME_RE.test(f) || !NAME_RE.test(l)) { err.hidden = false; return; }
+          state.first = f;
+          state.last = l;
+          saveState();
+          go('/birthdate');
+        });
+      }
+    },
+
+    '/birthdate': {
+      name: 'birthdate',
+      needs: 'verified',
+      html: function () {
+        function options(values) {
+          return '<option value="">—</option>' + values.map(function (v) {
+            return '<option value="' + v + '">' + v + '</option>';
+          }).join('');
+        }
+        var days = [], years = [];
+        for (var d = 1; d <= 31; d++) days.push(String(d));
+        for (var y = 2010; y >= 1940; y--) years.push(String(y));
+        return '<h1>' + t('birthdate') + '</h1>' +
+          '<select name="day">' + options(days) + '</select>' +
+          '<select name="month">' + options(MONTHS) + '</select>' +
+          '<select name="year">' + options(years) + '</select>' +
+          '<button type="submit" class="btn btn--full-width"><span>' + t('next') + '</span></button>';
+      },
+      bind: function () {
+        $('button[type="submit"]').addEventListener('click', function () {
+          var picked = ['day', 'month', 'year'].map(function (n) { return $('select[name="' + n + '"]').value; });
+          if (picked.some(function (v) { return !v; })) return;
+          state.birthdate = picked.join(' ');
+          saveState();
+          go('/invite');
+        });
+      }
+    },
+
+    '/invite': {
+      name: 'invite',
+      needs: 'verified',
+      html: function () {
+        return '<h1>' + t('invite') + '</h1>' +
+          '<textarea name="emails" rows="4" placeholder="email@example.com"></textarea>' +
+          '<p class="error-text invite-errors" hidden></p>' +
+          '<button type="button" class="btn" data-testid="copy-link"><span>' + t('copy') + '</span></button>' +
+          '<p class="invite-copied" hidden>' + t('copied') + '</p>' +
+          '<button type="button" class="btn" data-testid="invite-later"><span>' + t('later') + '</span></button>' +
+          '<button type="button" class="btn btn--full-width" data-testid="send-invites"><span>' + t('send') + '</span></button>';
+      },
+      bind: function () {
+        $('[data-testid="copy-link"]').addEventListener('click', function () {
+          var link = window.location.origin + '/join/' + encodeURIComponent(state.workspace || 'ws');
+          try { navigator.clipboard.writeText(link).catch(function () {}); } catch (e) { /* no clipboard */ }
+          $('.invite-copied').hidden = false;
+        });
+        $('[data-testid="invite-later"]').addEventListener('click', function () { go('/domains'); });
+        $('[data-testid="send-invites"]').addEventListener('click', function () {
+          var emails = $('textarea').value.split(/[\s,;]+/).filter(Boolean);
+          var bad = emails.filter(function (e) { return !EMAIL_RE.test(e); });
+          var err = $('.invite-errors');
+          if (bad.length) {
+            err.textContent = bad.join(', ');
+            err.hidden = false;
+            return;
+          }
+          state.invited = emails;
+          saveState();
+          go('/domains');
+        });
+      }
+    },
+
+    '/domains': {
+      name: 'domains',
+      needs: 'verified',
+      html: function () {
+        return '<h1>' + t('domains') + '</h1>' +
+          '<input type="text" name="domain" placeholder="example.com">' +
+          '<button type="button" class="btn" data-testid="skip"><span>' + t('skip') + '</span></button>';
+      },
+      bind: function () {
+        $('[data-testid="skip"]').addEventListener('click', function () { go('/dashboard'); });
+      }
+    },
+
+    '/dashboard': {
+      name: 'dashboard',
+      needs: 'verified',
+      html: function () {
+        return '<h1>' + t('dashboard') + ' ' + esc(state.workspace) + '</h1>' +
+          '<p data-testid="profile-name">' + esc((state.first || '') + ' ' + (state.last || '')) + '</p>' +
+          '<p data-testid="profile-email">' + esc(state.email) + '</p>';
+      },
+      bind: function () {}
+    }
+  };
+
+  render();
+})();
@@ -4,11 +4,9 @@ import os
 from selenium.common.exceptions import TimeoutException
 
 from pages.auth_pages import EmailPage, AuthLandingPage, CodePage
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from config.test_data import UserData
+from config.test_data import get_user_data
+from pages.validation import format_matrix
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 
@@ -26,27 +24,20 @@ def run(driver) -> None:
 
     # Wait until email input is visible (with one retry on slow UI)
     try:
-        WebDriverWait(driver, 12).until(EC.visibility_of_element_located(email.EMAIL_INPUT))
+        email.wait_until(EmailPage.INPUT_VISIBLE, 12)
     except TimeoutException:
         # Retry clicking Start once more and wait again
         landing.click_start()
-        WebDriverWait(driver, 10).until(EC.visibility_of_element_located(email.EMAIL_INPUT))
+        email.wait_until(EmailPage.INPUT_VISIBLE, 10)
 
-    data = UserData()
+    data = get_user_data()
 
     try:
-        # Negative cases
-        for invalid in data.email_invalids:
-            # Scroll input into view before interaction
-            el = driver.find_element(*email.EMAIL_INPUT)
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'})", el)
-            email.enter_email("")
-            email.enter_email(invalid)
-            # trigger blur/validation
-            driver.find_element(*email.EMAIL_INPUT).send_keys(Keys.TAB)
-            # For invalid emails, the Continue button remains disabled or an error appears
-            WebDriverWait(driver, 2).until(lambda d: (not email.is_next_enabled()) or email.has_error())
-            assert (not email.is_next_enabled()) or email.has_error(), f"Expected validation to block email: {invalid!r}"
+        # Negative cases: the whole table in one in-browser pass (pages/validation.py)
+        results = email.validate_emails([(invalid, True) for invalid in data.email_invalids])
+        print(f"[email] validation matrix:\n{format_matrix(results)}")
+        failed = [r.value for r in results if not r.ok]
+        assert not failed, f"Expected validation to block email: {failed!r}"
 
         # Positive
         el = driver.find_element(*email.EMAIL_INPUT)
@@ -56,10 +47,9 @@ def run(driver) -> None:
         # trigger blur/enable
         driver.find_element(*email.EMAIL_INPUT).send_keys(Keys.TAB)
         # Wait until Continue becomes enabled, then click
-        WebDriverWait(driver, 5).until(lambda d: email.is_next_enabled())
+        email.wait_until(EmailPage.NEXT_ENABLED, 5)
         email.click_next()
         # Ожидаем появления следующего шага (страница ввода кода).
-        cp = CodePage(driver)
-        WebDriverWait(driver, 15).until(lambda d: len(cp._find_code_inputs()) > 0)
+        email.wait_until(CodePage.INPUTS_PRESENT, 15)
     except TimeoutException as e:
         raise AssertionError(f"Email step timeout: {e}")
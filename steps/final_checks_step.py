@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 
 from pages.auth_pages import DashboardPage
-from config.test_data import UserData
+from config.test_data import get_user_data
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 
@@ -11,7 +11,7 @@ DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 def run(driver) -> None:
     """Step 10: Verify user is in workspace/dashboard and profile data shown."""
     page = DashboardPage(driver)
-    data = UserData()
+    data = get_user_data()
 
     if not DRY_RUN:
         name = page.get_profile_name()
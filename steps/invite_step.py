@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 
 from pages.auth_pages import InvitePage
-from config.test_data import UserData
+from config.test_data import get_user_data
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 
@@ -11,7 +11,7 @@ DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 def run(driver) -> None:
     """Step 8: Invitation block checks: remove invalids, copy link, invite later, send."""
     page = InvitePage(driver)
-    data = UserData()
+    data = get_user_data()
 
     if not DRY_RUN:
         page.paste_emails(list(data.invite_emails))
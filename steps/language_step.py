@@ -5,10 +5,9 @@ import random
 from selenium.common.exceptions import TimeoutException
 
 from pages.auth_pages import AuthLandingPage
-from core.browser import get_base_url
+from core.browser import get_base_url, get_locale
+from pages.dom_wait import url_contains, visible
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
@@ -31,20 +30,7 @@ def run(driver) -> None:
         def open_and_get():
             # Open dropdown and wait for menu visibility
             page.open_language_dropdown()
-            try:
-                WebDriverWait(driver, 5).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, ".context-menu.context-menu--modal .context-menu__list"))
-                )
-            except Exception:
-                pass
-            # dump DOM for diagnostics
-            try:
-                dump_dir = os.path.join(os.getcwd(), "_dom_dumps")
-                os.makedirs(dump_dir, exist_ok=True)
-                with open(os.path.join(dump_dir, "step_after_lang_open.html"), "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-            except Exception:
-                pass
+            page.wait_until(visible(AuthLandingPage.MENU_LIST), 5)
             data = page.get_language_items()
             items = data.get("items", [])
             texts = data.get("texts", [])
@@ -65,41 +51,13 @@ def run(driver) -> None:
             )
             print(f"[lang] now label: '{page.get_language_label()}'")
 
-        # Normalize to RU via URL navigation
+        # Normalize to the flow locale (RU by default) via URL navigation
         base = get_base_url().rstrip('/')
-        print(f"[lang] navigating to RU via URL: {base}/ru")
-        driver.get(f"{base}/ru")
-        WebDriverWait(driver, 10).until(EC.url_contains('/ru'))
-        print("[lang] RU via URL loaded")
+        locale = get_locale()
+        print(f"[lang] navigating to {locale.upper()} via URL: {base}/{locale}")
+        page.navigate(f"{base}/{locale}", ready=url_contains(f'/{locale}'), timeout=10)
+        print(f"[lang] {locale.upper()} via URL loaded")
 
     except TimeoutException as e:
-        # dump for diagnostics
-        import time
-        ts = int(time.time())
-        dump_dir = os.path.join(os.getcwd(), "_dom_dumps")
-        os.makedirs(dump_dir, exist_ok=True)
-        try:
-            with open(os.path.join(dump_dir, f"lang_timeout_{ts}.html"), "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-        except Exception:
-            pass
-        try:
-            driver.save_screenshot(os.path.join(dump_dir, f"lang_timeout_{ts}.png"))
-        except Exception:
-            pass
+        # Failure diagnostics are captured by the runner's flight recorder
         raise AssertionError(f"Language step timeout: {e}")
-    except AssertionError as e:
-        import time
-        ts = int(time.time())
-        dump_dir = os.path.join(os.getcwd(), "_dom_dumps")
-        os.makedirs(dump_dir, exist_ok=True)
-        try:
-            with open(os.path.join(dump_dir, f"lang_fail_{ts}.html"), "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-        except Exception:
-            pass
-        try:
-            driver.save_screenshot(os.path.join(dump_dir, f"lang_fail_{ts}.png"))
-        except Exception:
-            pass
-        raise
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 
 from pages.auth_pages import ProfilePage
-from config.test_data import UserData
+from config.test_data import get_user_data
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 
@@ -18,7 +18,7 @@ def run(driver) -> None:
     if DRY_RUN:
         return
     page = ProfilePage(driver)
-    data = UserData()
+    data = get_user_data()
 
     # Ensure assets exist or skip upload in DRY_RUN
     if not Path(VALID_AVATAR).exists():
@@ -4,7 +4,7 @@ import os
 from selenium.common.exceptions import TimeoutException
 
 from pages.auth_pages import WorkspaceNamePage
-from config.test_data import UserData
+from config.test_data import get_user_data
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() in ("1", "true", "yes")
 
@@ -14,7 +14,7 @@ def run(driver) -> None:
     if DRY_RUN:
         return
     page = WorkspaceNamePage(driver)
-    data = UserData()
+    data = get_user_data()
 
     try:
         # Negative
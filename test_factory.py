@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import argparse
 import os
 import sys
-from typing import Callable
+import time
+from typing import Callable, Sequence
 
-from core.browser import get_driver
+from config.test_data import VARIANTS
+from core import perf_metrics
+from core.browser import get_driver, get_locale
+from core.checkpoint import CheckpointStore
+from core.run_history import record_results
+from core.instrumentation import print_summary, summarize, write_jsonl
+from core.runner import (
+    FlowResult, build_flows, exit_code, merge_report, print_report, run_flows, run_steps, write_report,
+)
 
 # Steps
 from steps.language_step import run as step1
@@ -33,23 +43,94 @@ STEPS: list[tuple[str, Callable]] = [
 ]
 
 
-def main() -> int:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Factory тест регистрации")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "1")),
+                        help="number of parallel browsers (worker processes)")
+    parser.add_argument("--locales", default=os.getenv("LOCALES", get_locale()),
+                        help="comma-separated locales, one flow per locale and variant")
+    parser.add_argument("--variants", default=os.getenv("DATA_VARIANTS", "default"),
+                        help="comma-separated data variants from config.test_data.VARIANTS")
+    parser.add_argument("--report", default=os.getenv("REPORT_PATH"),
+                        help="write merged JSON report to this path")
+    parser.add_argument("--timings", default=os.getenv("TIMINGS_PATH"),
+                        help="JSONL file for per-command timings (default: _timings/commands-<ts>.jsonl)")
+    parser.add_argument("--checkpoints", action="store_true",
+                        default=os.getenv("CHECKPOINTS", "false").lower() in ("1", "true", "yes"),
+                        help="save browser state (cookies, storage, URL) after every passed step")
+    parser.add_argument("--from-step", type=int, default=int(os.getenv("FROM_STEP", "1")),
+                        help="restore the checkpoint saved after step N-1 and start from step N")
+    parser.add_argument("--step-retries", type=int, default=int(os.getenv("STEP_RETRIES", "0")),
+                        help="retry a failing step up to K times after rolling back to its start state")
+    args = parser.parse_args(argv)
+    if not 1 <= args.from_step <= len(STEPS):
+        parser.error(f"--from-step must be between 1 and {len(STEPS)}")
+    if not _split(args.locales):
+        parser.error("--locales must name at least one locale")
+    variants = _split(args.variants)
+    if not variants:
+        parser.error("--variants must name at least one data variant")
+    unknown = [v for v in variants if v not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown data variant(s): {', '.join(unknown)} (known: {', '.join(VARIANTS)})")
+    try:
+        perf_metrics.budget_mode()  # env-only setting; fail here, not mid-flow after the browser started
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def _split(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def emit_timings(results: Sequence[FlowResult], path: str | None) -> None:
+    """Print per-step WebDriver command latency summary and dump every command as JSONL."""
+    records = [c for r in results for c in r.commands]
+    if not records:
+        return
+    print_summary(summarize(records))
+    out = write_jsonl(records, path or f"_timings/commands-{int(time.time())}.jsonl")
+    print(f"[timings] {len(records)} команд записано в {out}")
+
+
+def record_history(results: Sequence[FlowResult], workers: int, started: float) -> None:
+    run = record_results(results, workers=workers, duration=time.perf_counter() - started)
+    if run is not None:
+        print(f"[history] запуск #{run} записан (python scripts/run_history.py trend)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    flows = build_flows(_split(args.locales), _split(args.variants))
+    started = time.perf_counter()
+
+    if len(flows) > 1 or args.workers > 1:
+        print(f"🚀 Запуск матрицы регистрации: {len(flows)} флоу, воркеров: {args.workers}")
+        results = run_flows(flows, STEPS, workers=args.workers, checkpoints=args.checkpoints,
+                            start=args.from_step - 1, retries=args.step_retries)
+        report = merge_report(results)
+        print_report(report)
+        emit_timings(results, args.timings)
+        record_history(results, args.workers, started)
+        if args.report:
+            write_report(report, args.report)
+        return exit_code(results)
+
+    os.environ.update(flows[0].env())
     print("🚀 Запуск factory теста регистрации")
     driver = get_driver()
 
     try:
-        for name, fn in STEPS:
-            print(f"\n▶️  {name}")
-            fn(driver)
-            print(f"✅ {name} пройден")
-        print("\n🎉 Все шаги пройдены успешно")
-        return 0
-    except AssertionError as e:
-        print(f"❌ Тест упал: {e}")
-        return 2
-    except Exception as e:
-        print(f"💥 Неожиданная ошибка: {e}")
-        return 3
+        store = None
+        if args.checkpoints or args.from_step > 1:
+            store = CheckpointStore(flows[0].name, readonly=not args.checkpoints)
+        result = run_steps(driver, STEPS, checkpoints=store, start=args.from_step - 1, retries=args.step_retries)
+        emit_timings([result], args.timings)
+        record_history([result], 1, started)
+        if args.report:
+            write_report(merge_report([result]), args.report)
+        return result.exit_code
     finally:
         driver.quit()
 